@@ -15,17 +15,20 @@ from .data_objects import (  # noqa: F401
     DisplayData,
     CameraData,
     DimensionData,
+    BoundsData,
     HistogramPlotData,
     InputFileData,
     MetaData,
     ModelMetaData,
     ScatterPlotData,
     TrajectoryData,
+    LazyTrajectoryData,
     UnitData,
     FrameData,
     SimulariumFileData,
     JsonData,
     BinaryData,
+    TypeNameData,
 )
 # DO NOT ISORT DISPLAY_TYPE, CAUSES CIRCULAR DEP
 from .constants import BINARY_SETTINGS, DISPLAY_TYPE  # noqa: F401
@@ -278,9 +278,10 @@ class CellpackConverter(TrajectoryConverter):
         geometry_url: str,
         display_data,
         scale_factor: float = None,
+        dtype: np.dtype = np.float64,
     ) -> Tuple[AgentData, float]:
         dimensions = CellpackConverter._parse_dimensions(all_ingredients)
-        spatial_data = AgentData.from_dimensions(dimensions)
+        spatial_data = AgentData.from_dimensions(dimensions, dtype=dtype)
         display_data = {} if display_data is None else display_data
         agent_id_counter = 0
         total_agents = 0
@@ -386,6 +387,7 @@ class CellpackConverter(TrajectoryConverter):
             input_data.geometry_url,
             input_data.display_data,
             input_data.meta_data.scale_factor,
+            input_data.dtype,
         )
         # parse
         box_size = np.array(CellpackConverter._get_boxsize(recipe_data))
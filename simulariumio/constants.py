@@ -124,6 +124,8 @@ class BINARY_SETTINGS:
     FRAME_HEADER_N_VALUES: int = 3  # frame number, time stamp, number of agents
     BYTES_PER_VALUE: int = 4
     BLOCK_OFFSET_BYTE_ALIGNMENT: int = 4
+    # filtered frames kept between sizing and writing lazy trajectory data
+    LAZY_FRAME_CACHE_BYTES: int = 500000000
 
     # The number of int values stored in the header of binary files
     HEADER_N_INT_VALUES: int = (
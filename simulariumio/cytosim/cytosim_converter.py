@@ -12,9 +12,11 @@ from ..data_objects import (
     UnitData,
     DimensionData,
     DisplayData,
+    BoundsData,
 )
 from ..constants import VIZ_TYPE, DISPLAY_TYPE, SUBPOINT_VALUES_PER_ITEM
 from ..exceptions import InputDataError
+from ..filters import TimeWindowFilter
 from .cytosim_data import CytosimData
 from .cytosim_object_info import CytosimObjectInfo
 
@@ -63,6 +65,45 @@ class CytosimConverter(TrajectoryConverter):
         """
         return len(line) < 1 or line[0:7] == "warning" or "report" in line
 
+    @staticmethod
+    def _get_lines_in_time_window(
+        data_lines: List[str], time_window: TimeWindowFilter
+    ) -> List[str]:
+        """
+        Get the lines before the first frame and the lines for the frames
+        inside the time window, stopping at the first frame after it
+        """
+        result = []
+        frame_index = -1
+        frame_lines = None
+        frame_time = None
+        in_window = False
+        for line in data_lines:
+            is_metadata = not CytosimConverter._ignore_line(line) and line[0] == "%"
+            if is_metadata and "frame" in line:
+                # start of frame, keep its lines until its time is read
+                frame_index += 1
+                frame_lines = [line]
+                frame_time = None
+                in_window = False
+                continue
+            if frame_lines is None:
+                result.append(line)
+                continue
+            if frame_time is None:
+                frame_lines.append(line)
+                if is_metadata and "time" in line:
+                    frame_time = float(line.split()[2])
+                    if time_window.is_after(frame_index, frame_time):
+                        break
+                    in_window = time_window.contains(frame_index, frame_time)
+                    if in_window:
+                        result += frame_lines
+                continue
+            if in_window:
+                result.append(line)
+        return result
+
     @staticmethod
     def _parse_object_dimensions(
         data_lines: List[str],
@@ -191,13 +232,15 @@ class CytosimConverter(TrajectoryConverter):
         used_unique_IDs: List[int],
         overall_line: int,
         total_lines: int,
-        scale_factor: float = None,
+        bounds: BoundsData,
     ) -> Tuple[Dict[str, Any], List[int], int]:
         """
         Parse a Cytosim output file containing objects
-        (fibers, solids, singles, or couples) to get agents
+        (fibers, solids, singles, or couples) to get agents,
+        and add the parsed agents in each frame to the bounds
         """
         time_index = -1
+        start_agent_index = 0
         uids = {}
         is_fiber = "fiber" in object_type
         for line in data_lines:
@@ -208,7 +251,10 @@ class CytosimConverter(TrajectoryConverter):
             if line[0] == "%":
                 if "frame" in line:
                     # start of frame
+                    if time_index >= 0:
+                        bounds.add_frame(result, time_index, start_agent_index)
                     time_index += 1
+                    start_agent_index = int(result.n_agents[time_index])
                 elif "time" in line:
                     # time metadata
                     result.times[time_index] = float(columns[2])
@@ -274,11 +320,10 @@ class CytosimConverter(TrajectoryConverter):
                 )
                 result.n_agents[time_index] += 1
             self.check_report_progress(overall_line / total_lines)
-        result, scale_factor = TrajectoryConverter.scale_agent_data(
-            result, scale_factor
-        )
+        if time_index >= 0:
+            bounds.add_frame(result, time_index, start_agent_index)
         result.n_timesteps = time_index + 1
-        return (result, used_unique_IDs, overall_line, scale_factor)
+        return (result, used_unique_IDs, overall_line)
 
     def _read(self, input_data: CytosimData) -> TrajectoryData:
         """
@@ -296,10 +341,17 @@ class CytosimConverter(TrajectoryConverter):
                 )
         except Exception as e:
             raise InputDataError(f"Error reading input cytosim file: {e}")
+        if input_data.time_window is not None:
+            for object_type in cytosim_data:
+                cytosim_data[object_type] = (
+                    CytosimConverter._get_lines_in_time_window(
+                        cytosim_data[object_type], input_data.time_window
+                    )
+                )
 
         # parse
         dimensions = CytosimConverter._parse_dimensions(cytosim_data)
-        agent_data = AgentData.from_dimensions(dimensions)
+        agent_data = AgentData.from_dimensions(dimensions, dtype=input_data.dtype)
         agent_data.draw_fiber_points = input_data.draw_fiber_points
         overall_line = 0
         total_lines = sum(
@@ -307,9 +359,10 @@ class CytosimConverter(TrajectoryConverter):
         )
 
         uids = []
+        bounds = BoundsData()
         for object_type in input_data.object_info:
             try:
-                (agent_data, uids, overall_line, scale_factor) = self._parse_objects(
+                (agent_data, uids, overall_line) = self._parse_objects(
                     object_type,
                     cytosim_data[object_type],
                     input_data.object_info[object_type],
@@ -317,10 +370,13 @@ class CytosimConverter(TrajectoryConverter):
                     uids,
                     overall_line,
                     total_lines,
-                    input_data.meta_data.scale_factor,
+                    bounds,
                 )
             except Exception as e:
                 raise InputDataError(f"Error reading input cytosim data: {e}")
+        agent_data, scale_factor = TrajectoryConverter.scale_agent_data(
+            agent_data, input_data.meta_data.scale_factor, bounds
+        )
         # get display data (geometry and color)
         for object_type in input_data.object_info:
             for tid in input_data.object_info[object_type].display_data:
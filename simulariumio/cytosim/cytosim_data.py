@@ -4,8 +4,11 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
+
 from .cytosim_object_info import CytosimObjectInfo
 from ..data_objects import MetaData
+from ..filters import TimeWindowFilter
 
 ###############################################################################
 
@@ -19,6 +22,8 @@ class CytosimData:
     meta_data: MetaData
     draw_fiber_points: bool
     plots: List[Dict[str, Any]]
+    dtype: np.dtype
+    time_window: TimeWindowFilter
 
     def __init__(
         self,
@@ -26,6 +31,8 @@ class CytosimData:
         meta_data: MetaData = None,
         draw_fiber_points: bool = False,
         plots: List[Dict[str, Any]] = None,
+        dtype: np.dtype = np.float64,
+        time_window: TimeWindowFilter = None,
     ):
         """
         This object holds simulation trajectory outputs
@@ -50,8 +57,18 @@ class CytosimData:
         plots : List[Dict[str, Any]] (optional)
             An object containing plot data already
             in Simularium format
+        dtype : np.dtype (optional)
+            The float dtype for the spatial data arrays (positions, radii,
+            rotations, and subpoints), use np.float32 to halve their memory
+            Default: np.float64
+        time_window : TimeWindowFilter (optional)
+            Only parse the frames inside this window of times
+            and/or frame indices, skipping the rest of each file
+            Default: None (parse all frames)
         """
         self.object_info = object_info
         self.meta_data = meta_data if meta_data is not None else MetaData()
         self.draw_fiber_points = draw_fiber_points
         self.plots = plots if plots is not None else []
+        self.dtype = dtype
+        self.time_window = time_window
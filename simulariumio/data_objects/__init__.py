@@ -4,10 +4,12 @@
 from .agent_data import AgentData  # noqa: F401
 from .display_data import DisplayData  # noqa: F401
 from .trajectory_data import TrajectoryData  # noqa: F401
+from .lazy_trajectory_data import LazyTrajectoryData  # noqa: F401
 from .meta_data import MetaData  # noqa: F401
 from .unit_data import UnitData  # noqa: F401
 from .camera_data import CameraData  # noqa: F401
 from .dimension_data import DimensionData  # noqa: F401
+from .bounds_data import BoundsData  # noqa: F401
 from .input_file_data import InputFileData  # noqa: F401
 from .model_meta_data import ModelMetaData  # noqa: F401
 from .histogram_plot_data import HistogramPlotData  # noqa: F401
@@ -16,3 +18,4 @@ from .json_data import JsonData  # noqa: F401
 from .binary_data import BinaryData  # noqa: F401
 from .simularium_file_data import SimulariumFileData  # noqa: F401
 from .frame_data import FrameData  # noqa: F401
+from .type_name_data import TypeNameData  # noqa: F401
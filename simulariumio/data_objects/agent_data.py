@@ -20,6 +20,7 @@ from ..constants import (
 from ..exceptions import DataError
 from .dimension_data import DimensionData
 from .display_data import DisplayData
+from .type_name_data import TypeNameData
 
 ###############################################################################
 
@@ -34,14 +35,16 @@ class AgentData:
     n_agents: Union[np.ndarray, List[int]]
     viz_types: Union[np.ndarray, List[List[float]]]
     unique_ids: Union[np.ndarray, List[List[int]]]
-    types: List[List[str]]
+    types: TypeNameData
     positions: Union[np.ndarray, List[List[List[float]]]]
     radii: Union[np.ndarray, List[List[float]]]
     rotations: Union[np.ndarray, List[List[List[float]]]]
     n_subpoints: Union[np.ndarray, List[List[float]]]
     subpoints: Union[np.ndarray, List[List[List[float]]]]
+    subpoint_offsets: np.ndarray
     display_data: Dict[str, DisplayData]
     draw_fiber_points: bool
+    dtype: np.dtype
 
     def __init__(
         self,
@@ -49,7 +52,7 @@ class AgentData:
         n_agents: Union[np.ndarray, List[int]],
         viz_types: Union[np.ndarray, List[List[float]]],
         unique_ids: Union[np.ndarray, List[List[int]]],
-        types: List[List[str]],
+        types: Union[TypeNameData, List[List[str]]],
         positions: Union[np.ndarray, List[List[List[float]]]],
         radii: Union[np.ndarray, List[List[float]]],
         rotations: Union[np.ndarray, List[List[List[float]]]] = None,
@@ -58,6 +61,8 @@ class AgentData:
         display_data: Dict[str, DisplayData] = None,
         draw_fiber_points: bool = False,
         n_timesteps: int = -1,
+        subpoint_offsets: Union[np.ndarray, List[List[int]]] = None,
+        dtype: np.dtype = None,
     ):
         """
         This object contains spatial simulation data
@@ -79,9 +84,12 @@ class AgentData:
         unique_ids : np.ndarray or List[List[int]] (shape = [timesteps, agents])
             A numpy ndarray or list containing the unique ID
             for each agent at each timestep
-        types : List[List[str]] (list of shape [timesteps, agents])
+        types : TypeNameData or List[List[str]] (list of shape [timesteps, agents])
             A list containing timesteps, for each a list of
-            the string name for the type of each agent
+            the string name for the type of each agent.
+            Stored as TypeNameData, an integer code for each agent
+            and a table of type names, which can still be used
+            like a list of lists
         positions : np.ndarray or List[List[List[float]]]
         (shape = [timesteps, agents, 3])
             A numpy ndarray or list containing the XYZ position
@@ -117,6 +125,21 @@ class AgentData:
         n_timesteps : int (optional)
             Use the first n_timesteps frames of data
             Default: -1 (use the full length of the buffer)
+        subpoint_offsets : np.ndarray or List[List[int]]
+        (shape = [timesteps, agents]) (optional)
+            Store subpoints in a ragged layout: if provided, subpoints
+            is a flat array of the subpoint values for all agents,
+            and this gives the index in that array of each agent's
+            first subpoint value, so memory scales with the actual
+            number of subpoints instead of the max per agent
+            Default: None (subpoints is padded to
+            shape [timesteps, agents, max subpoints])
+        dtype : np.dtype (optional)
+            The float dtype for positions, radii, rotations, and subpoints,
+            use np.float32 to halve the memory used for spatial data
+            (the simularium binary format stores float32 values)
+            Default: the dtype of positions if it is a float numpy ndarray,
+            otherwise np.float64
         """
         self.times = np.array(times)
         self.n_agents = np.array(n_agents)
@@ -130,7 +153,10 @@ class AgentData:
             if type(unique_ids) is list
             else unique_ids
         )
-        self.types = types
+        self.types = TypeNameData.from_type_names(
+            types,
+            self.unique_ids.shape[1] if len(self.unique_ids.shape) > 1 else 0,
+        )
         self.positions = (
             AgentData._jagged_3d_list_to_numpy_array(positions)
             if type(positions) is list
@@ -151,17 +177,63 @@ class AgentData:
             if n_subpoints is not None
             else np.zeros_like(self.radii)
         )
-        self.subpoints = (
-            AgentData._get_subpoints_numpy_array(subpoints)
-            if subpoints is not None
-            else np.zeros_like(n_agents)
+        self.subpoint_offsets = (
+            np.array(subpoint_offsets, dtype=int)
+            if subpoint_offsets is not None
+            else None
         )
+        if self.subpoint_offsets is not None:
+            self.subpoints = (
+                np.ravel(subpoints) if subpoints is not None else np.zeros(0)
+            )
+        else:
+            self.subpoints = (
+                AgentData._get_subpoints_numpy_array(subpoints)
+                if subpoints is not None
+                else np.zeros_like(n_agents)
+            )
+        if dtype is None:
+            dtype = (
+                self.positions.dtype
+                if np.issubdtype(self.positions.dtype, np.floating)
+                else np.float64
+            )
+        self.dtype = np.dtype(dtype)
+        self.positions = self.positions.astype(self.dtype, copy=False)
+        self.radii = self.radii.astype(self.dtype, copy=False)
+        self.rotations = self.rotations.astype(self.dtype, copy=False)
+        self.subpoints = self.subpoints.astype(self.dtype, copy=False)
         self.display_data = display_data if display_data is not None else {}
         self.draw_fiber_points = draw_fiber_points
         self.n_timesteps = n_timesteps
 
     @staticmethod
-    def _get_buffer_data_dimensions(buffer_data: Dict[str, Any]) -> DimensionData:
+    def _get_frame_agent_starts(frame_data: np.ndarray) -> np.ndarray:
+        """
+        Get the index in a frame's packed buffer where each agent starts
+        """
+        buffer_struct = V1_SPATIAL_BUFFER_STRUCT
+        n_values = frame_data.shape[0]
+        # fast path if none of the agents have subpoints
+        if n_values % buffer_struct.MIN_VALUES_PER_AGENT == 0:
+            starts = np.arange(0, n_values, buffer_struct.MIN_VALUES_PER_AGENT)
+            if not np.any(frame_data[starts + buffer_struct.NSP_INDEX]):
+                return starts
+        # otherwise scan the subpoint counts to find the jagged offsets
+        starts = []
+        buffer_index = 0
+        while buffer_index + buffer_struct.NSP_INDEX < n_values:
+            # a new agent should start at this index
+            starts.append(buffer_index)
+            buffer_index += buffer_struct.SP_INDEX + int(
+                frame_data[buffer_index + buffer_struct.NSP_INDEX]
+            )
+        return np.array(starts, dtype=int)
+
+    @staticmethod
+    def _get_buffer_data_dimensions(
+        buffer_data: Dict[str, Any], frame_agent_starts: List[np.ndarray] = None
+    ) -> DimensionData:
         """
         Get dimensions of a simularium JSON dict containing buffers
         """
@@ -169,77 +241,87 @@ class AgentData:
         result = DimensionData(total_steps=len(bundle_data), max_agents=0)
         for time_index in range(result.total_steps):
             # buffer = packed agent data as a list of numbers
-            buffer = bundle_data[time_index]["data"]
-            buffer_index = 0
-            agents = 0
-            while buffer_index < len(buffer):
-                # a new agent should start at this index
-                agents += 1
-                buffer_index += V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX
-                # get the number of subpoints
-                subpoints = buffer[buffer_index]
-                if subpoints > result.max_subpoints:
-                    result.max_subpoints = int(subpoints)
-                buffer_index += int(
-                    buffer[buffer_index]
-                    + (
-                        V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT
-                        - V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX
-                    )
-                )
-            if agents > result.max_agents:
-                result.max_agents = agents
+            frame_data = np.asarray(bundle_data[time_index]["data"])
+            starts = (
+                frame_agent_starts[time_index]
+                if frame_agent_starts is not None
+                else AgentData._get_frame_agent_starts(frame_data)
+            )
+            if starts.shape[0] > result.max_agents:
+                result.max_agents = starts.shape[0]
+            if starts.shape[0] < 1:
+                continue
+            max_subpoints = int(
+                np.amax(frame_data[starts + V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX])
+            )
+            if max_subpoints > result.max_subpoints:
+                result.max_subpoints = max_subpoints
         return result
 
     def get_type_ids_and_mapping(self) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
-        Generate a type_ids array from the type_names list
+        Generate a type_ids array from the type codes,
+        numbering the types in the order they first appear
         """
-        total_steps = len(self.types)
-        max_agents = 0
-        for time_index in range(len(self.types)):
-            agent_index = len(self.types[time_index])
-            if agent_index > max_agents:
-                max_agents = agent_index
-        type_ids = np.zeros((len(self.types), max_agents))
+        max_agents = int(np.amax(self.types.n_types)) if len(self.types) > 0 else 0
+        codes = self.types.codes[:, :max_agents]
+        type_id_for_code, type_name_mapping = self.get_type_id_for_code_and_mapping(
+            codes
+        )
+        return type_id_for_code[codes], type_name_mapping
+
+    def get_type_id_for_code_and_mapping(
+        self, codes: np.ndarray
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Number the types in the order their codes first appear
+        in the given codes, and get the type ID for each code,
+        with a last entry for codes that are -1
+        """
+        # the first index where each code appears, in time then agent order
+        valid_codes = codes[codes >= 0]
+        unique_codes, first_indices = np.unique(valid_codes, return_index=True)
         type_name_mapping = {}
-        type_id_mapping = {}
+        # the last entry is for codes that are -1
+        type_id_for_code = np.zeros(len(self.types.names) + 1)
         last_tid = 0
-        for time_index in range(total_steps):
-            for agent_index in range(len(self.types[time_index])):
-                type_name = self.types[time_index][agent_index]
-                if len(type_name) == 0:
-                    continue
-                if type_name not in type_id_mapping:
-                    tid = last_tid
-                    last_tid += 1
-                    type_id_mapping[type_name] = tid
-                    type_name_mapping[str(tid)] = {"name": type_name}
-                    if type_name not in self.display_data:
-                        raise DataError(
-                            f"Please provide DisplayData for agent type {type_name}"
-                        )
-                    type_name_mapping[str(tid)]["geometry"] = dict(
-                        self.display_data[type_name]
-                    )
-                type_ids[time_index][agent_index] = type_id_mapping[type_name]
-        return type_ids, type_name_mapping
+        for code in unique_codes[np.argsort(first_indices)]:
+            type_name = self.types.names[code]
+            if len(type_name) == 0:
+                continue
+            tid = last_tid
+            last_tid += 1
+            type_id_for_code[code] = tid
+            type_name_mapping[str(tid)] = {"name": type_name}
+            if type_name not in self.display_data:
+                raise DataError(
+                    f"Please provide DisplayData for agent type {type_name}"
+                )
+            type_name_mapping[str(tid)]["geometry"] = dict(self.display_data[type_name])
+        return type_id_for_code, type_name_mapping
 
     @staticmethod
     def get_type_names(
         type_ids: np.ndarray, type_mapping: Dict[str, Any]
-    ) -> List[List[str]]:
+    ) -> TypeNameData:
         """
-        Generate the type_names list from a type_ids array and a type_mapping
+        Generate the type names from a type_ids array and a type_mapping
         """
-        result = []
-        for time_index in range(type_ids.shape[0]):
-            result.append([])
-            for agent_index in range(int(len(type_ids[time_index]))):
-                result[time_index].append(
-                    type_mapping[str(int(type_ids[time_index][agent_index]))]["name"]
-                )
-        return result
+        names = {
+            int(type_id): type_mapping[type_id]["name"] for type_id in type_mapping
+        }
+        result = TypeNameData.from_dimensions(0)
+        unique_type_ids, type_id_indices = np.unique(
+            type_ids.astype(int), return_inverse=True
+        )
+        code_for_type_id = np.array(
+            [result.get_code(names[type_id]) for type_id in unique_type_ids],
+            dtype=int,
+        )
+        return TypeNameData(
+            codes=code_for_type_id[type_id_indices].reshape(type_ids.shape),
+            names=result.names,
+        )
 
     @staticmethod
     def get_display_data(
@@ -278,64 +360,59 @@ class AgentData:
         Create AgentData from a simularium JSON dict containing buffers
         """
         bundle_data = buffer_data["spatialData"]["bundleData"]
-        dimensions = AgentData._get_buffer_data_dimensions(buffer_data)
+        frame_agent_starts = [
+            AgentData._get_frame_agent_starts(np.asarray(frame["data"]))
+            for frame in bundle_data
+        ]
+        dimensions = AgentData._get_buffer_data_dimensions(
+            buffer_data, frame_agent_starts
+        )
         print(f"original dim = {dimensions}")
         agent_data = AgentData.from_dimensions(dimensions)
         type_ids = np.zeros((dimensions.total_steps, dimensions.max_agents))
+        buffer_struct = V1_SPATIAL_BUFFER_STRUCT
+        xyz = np.arange(VALUES_PER_3D_POINT)
         for time_index in range(dimensions.total_steps):
             agent_data.times[time_index] = bundle_data[time_index]["time"]
-            frame_data = bundle_data[time_index]["data"]
-            agent_index = 0
-            buffer_index = 0
-            while buffer_index + V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX < len(frame_data):
-                # a new agent should start at this index
-                agent_data.viz_types[time_index][agent_index] = frame_data[
-                    buffer_index + V1_SPATIAL_BUFFER_STRUCT.VIZ_TYPE_INDEX
-                ]
-                agent_data.unique_ids[time_index][agent_index] = frame_data[
-                    buffer_index + V1_SPATIAL_BUFFER_STRUCT.UID_INDEX
-                ]
-                type_ids[time_index][agent_index] = frame_data[
-                    buffer_index + V1_SPATIAL_BUFFER_STRUCT.TID_INDEX
-                ]
-                agent_data.positions[time_index][agent_index] = [
-                    frame_data[buffer_index + V1_SPATIAL_BUFFER_STRUCT.POSX_INDEX],
-                    frame_data[buffer_index + V1_SPATIAL_BUFFER_STRUCT.POSY_INDEX],
-                    frame_data[buffer_index + V1_SPATIAL_BUFFER_STRUCT.POSZ_INDEX],
-                ]
-                agent_data.rotations[time_index][agent_index] = [
-                    frame_data[buffer_index + V1_SPATIAL_BUFFER_STRUCT.ROTX_INDEX],
-                    frame_data[buffer_index + V1_SPATIAL_BUFFER_STRUCT.ROTY_INDEX],
-                    frame_data[buffer_index + V1_SPATIAL_BUFFER_STRUCT.ROTZ_INDEX],
-                ]
-                agent_data.radii[time_index][agent_index] = frame_data[
-                    buffer_index + V1_SPATIAL_BUFFER_STRUCT.R_INDEX
-                ]
-                buffer_index += V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX
-                # get the subpoints
-                if dimensions.max_subpoints < 1:
-                    buffer_index += int(
-                        V1_SPATIAL_BUFFER_STRUCT.SP_INDEX
-                        - V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX
-                    )
-                    agent_index += 1
-                    continue
-                agent_data.n_subpoints[time_index][agent_index] = int(
-                    frame_data[buffer_index]
-                )
-                for i in range(int(frame_data[buffer_index])):
-                    agent_data.subpoints[time_index][agent_index][i] = frame_data[
-                        buffer_index + 1 + i
-                    ]
-                buffer_index += int(
-                    frame_data[buffer_index]
-                    + (
-                        V1_SPATIAL_BUFFER_STRUCT.SP_INDEX
-                        - V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX
-                    )
-                )
-                agent_index += 1
-            agent_data.n_agents[time_index] = agent_index
+            frame_data = np.asarray(bundle_data[time_index]["data"], dtype=float)
+            starts = frame_agent_starts[time_index]
+            n_agents = starts.shape[0]
+            agent_data.n_agents[time_index] = n_agents
+            if n_agents < 1:
+                continue
+            # gather each field for all the agents in the frame at once
+            agent_data.viz_types[time_index, :n_agents] = frame_data[
+                starts + buffer_struct.VIZ_TYPE_INDEX
+            ]
+            agent_data.unique_ids[time_index, :n_agents] = frame_data[
+                starts + buffer_struct.UID_INDEX
+            ]
+            type_ids[time_index, :n_agents] = frame_data[
+                starts + buffer_struct.TID_INDEX
+            ]
+            agent_data.positions[time_index, :n_agents] = frame_data[
+                starts[:, np.newaxis] + buffer_struct.POSX_INDEX + xyz
+            ]
+            agent_data.rotations[time_index, :n_agents] = frame_data[
+                starts[:, np.newaxis] + buffer_struct.ROTX_INDEX + xyz
+            ]
+            agent_data.radii[time_index, :n_agents] = frame_data[
+                starts + buffer_struct.R_INDEX
+            ]
+            # get the subpoints
+            if dimensions.max_subpoints < 1:
+                continue
+            n_subpoints = frame_data[starts + buffer_struct.NSP_INDEX].astype(int)
+            agent_data.n_subpoints[time_index, :n_agents] = n_subpoints
+            sp_mask = np.arange(dimensions.max_subpoints) < n_subpoints[:, np.newaxis]
+            sp_indices = (
+                starts[:, np.newaxis]
+                + buffer_struct.SP_INDEX
+                + np.arange(dimensions.max_subpoints)
+            )
+            agent_data.subpoints[time_index, :n_agents][sp_mask] = frame_data[
+                sp_indices[sp_mask]
+            ]
         type_names = AgentData.get_type_names(
             type_ids, buffer_data["trajectoryInfo"]["typeMapping"]
         )
@@ -482,24 +559,40 @@ class AgentData:
 
     @classmethod
     def from_dimensions(
-        cls, dimensions: DimensionData, default_viz_type: float = VIZ_TYPE.DEFAULT
+        cls,
+        dimensions: DimensionData,
+        default_viz_type: float = VIZ_TYPE.DEFAULT,
+        ragged_subpoints: bool = False,
+        dtype: np.dtype = np.float64,
     ):
         """
-        Create AgentData with empty numpy arrays of the required dimensions
+        Create AgentData with empty numpy arrays of the required dimensions,
+        if ragged_subpoints is True, subpoints are empty with zero offsets
+        instead of padded to dimensions.max_subpoints.
+        Positions, radii, rotations, and subpoints are allocated with the dtype
         """
+        if ragged_subpoints:
+            dimensions = DimensionData(
+                total_steps=dimensions.total_steps,
+                max_agents=dimensions.max_agents,
+            )
         return cls(
             times=np.zeros(dimensions.total_steps),
             n_agents=np.zeros(dimensions.total_steps),
             viz_types=default_viz_type
             * np.ones((dimensions.total_steps, dimensions.max_agents)),
             unique_ids=np.zeros((dimensions.total_steps, dimensions.max_agents)),
-            types=[[] for t in range(dimensions.total_steps)],
+            types=TypeNameData.from_dimensions(
+                dimensions.total_steps, dimensions.max_agents
+            ),
             positions=np.zeros(
-                (dimensions.total_steps, dimensions.max_agents, VALUES_PER_3D_POINT)
+                (dimensions.total_steps, dimensions.max_agents, VALUES_PER_3D_POINT),
+                dtype=dtype,
             ),
-            radii=np.ones((dimensions.total_steps, dimensions.max_agents)),
+            radii=np.ones((dimensions.total_steps, dimensions.max_agents), dtype=dtype),
             rotations=np.zeros(
-                (dimensions.total_steps, dimensions.max_agents, VALUES_PER_3D_POINT)
+                (dimensions.total_steps, dimensions.max_agents, VALUES_PER_3D_POINT),
+                dtype=dtype,
             ),
             n_subpoints=np.zeros((dimensions.total_steps, dimensions.max_agents)),
             subpoints=np.zeros(
@@ -507,8 +600,17 @@ class AgentData:
                     dimensions.total_steps,
                     dimensions.max_agents,
                     dimensions.max_subpoints,
-                )
-            ),
+                ),
+                dtype=dtype,
+            )
+            if not ragged_subpoints
+            else np.zeros(0, dtype=dtype),
+            subpoint_offsets=np.zeros(
+                (dimensions.total_steps, dimensions.max_agents), dtype=int
+            )
+            if ragged_subpoints
+            else None,
+            dtype=dtype,
         )
 
     def total_timesteps(self) -> int:
@@ -525,9 +627,257 @@ class AgentData:
         return DimensionData(
             total_steps=self.total_timesteps(),
             max_agents=self.viz_types.shape[1],
-            max_subpoints=self.subpoints.shape[2]
-            if len(self.subpoints.shape) > 2
-            else 0,
+            max_subpoints=self._max_subpoints_capacity(),
+        )
+
+    def _max_subpoints_capacity(self) -> int:
+        """
+        Get the number of subpoint values that fit for each agent,
+        for ragged subpoints this is the current max number of subpoints
+        """
+        if self.has_ragged_subpoints():
+            return int(np.amax(self.n_subpoints)) if self.n_subpoints.size > 0 else 0
+        return self.subpoints.shape[2] if len(self.subpoints.shape) > 2 else 0
+
+    def has_ragged_subpoints(self) -> bool:
+        """
+        Are subpoints stored as a flat array with per agent offsets?
+        """
+        return self.subpoint_offsets is not None
+
+    @staticmethod
+    def _ragged_indices(offsets: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        Get the concatenated indices for ranges
+        [offsets[i], offsets[i] + counts[i]) of a flat array
+        """
+        counts = counts.astype(int)
+        result_starts = np.zeros_like(counts)
+        np.cumsum(counts[:-1], out=result_starts[1:])
+        return np.repeat(offsets.astype(int) - result_starts, counts) + np.arange(
+            int(np.sum(counts))
+        )
+
+    def get_subpoints(self, time_index: int, agent_index: int) -> np.ndarray:
+        """
+        Get a view of the subpoint values for the agent
+        at the given time and agent indices, in either layout
+        """
+        n_sp = int(self.n_subpoints[time_index][agent_index])
+        if self.has_ragged_subpoints():
+            start = int(self.subpoint_offsets[time_index][agent_index])
+            return self.subpoints[start : start + n_sp]
+        if n_sp < 1:
+            return np.zeros(0)
+        return self.subpoints[time_index][agent_index][:n_sp]
+
+    def get_subpoint_indices_for_agents(
+        self, time_indices: np.ndarray, agent_indices: np.ndarray
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Get an index into subpoints, in either layout,
+        for the subpoint values of each of the agents
+        at the given time and agent indices, concatenated in order.
+        It can be used to change the values in place
+        """
+        n_subpoints = self.n_subpoints[time_indices, agent_indices].astype(int)
+        if self.has_ragged_subpoints():
+            return (
+                AgentData._ragged_indices(
+                    self.subpoint_offsets[time_indices, agent_indices], n_subpoints
+                ),
+            )
+        return (
+            np.repeat(time_indices, n_subpoints),
+            np.repeat(agent_indices, n_subpoints),
+            AgentData._ragged_indices(np.zeros_like(n_subpoints), n_subpoints),
+        )
+
+    def get_subpoints_for_agents(
+        self, time_indices: np.ndarray, agent_indices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Get the subpoint values for each of the agents
+        at the given time and agent indices, concatenated in order
+        """
+        n_subpoints = self.n_subpoints[time_indices, agent_indices].astype(int)
+        if n_subpoints.size < 1 or np.amax(n_subpoints) < 1:
+            return np.zeros(0)
+        return self.subpoints[
+            self.get_subpoint_indices_for_agents(time_indices, agent_indices)
+        ]
+
+    def _set_subpoints_for_agents(
+        self,
+        time_indices: np.ndarray,
+        agent_indices: np.ndarray,
+        n_subpoints: np.ndarray,
+        values: np.ndarray,
+    ):
+        """
+        Replace the subpoints for the given agents with the concatenated
+        values, in this object's current layout.
+        For ragged subpoints, the flat array is rebuilt in time then agent
+        order, with the given values and the other agents' current values
+        """
+        n_subpoints = n_subpoints.astype(int)
+        if self.has_ragged_subpoints():
+            self._merge_ragged_subpoints(
+                time_indices, agent_indices, n_subpoints, values
+            )
+            return
+        self.n_subpoints[time_indices, agent_indices] = n_subpoints
+        if n_subpoints.size < 1 or np.amax(n_subpoints) < 1:
+            return
+        max_subpoints = int(np.amax(n_subpoints))
+        sp_mask = np.arange(max_subpoints) < n_subpoints[:, np.newaxis]
+        block = np.zeros((n_subpoints.shape[0], max_subpoints), dtype=self.dtype)
+        block[sp_mask] = values
+        self.subpoints[time_indices, agent_indices, :max_subpoints] = block
+
+    def _merge_ragged_subpoints(
+        self,
+        time_indices: np.ndarray,
+        agent_indices: np.ndarray,
+        n_subpoints: np.ndarray,
+        values: np.ndarray,
+    ):
+        """
+        Rebuild the flat array of ragged subpoints and the offsets
+        for all agents, with the concatenated values for the given agents
+        and a copy of the current values for the other agents
+        """
+        is_given = np.zeros(self.n_subpoints.shape, dtype=bool)
+        is_given[time_indices, agent_indices] = True
+        self.n_subpoints[time_indices, agent_indices] = n_subpoints
+        all_time_indices, all_agent_indices = np.nonzero(self.n_subpoints > 0)
+        all_n_subpoints = self.n_subpoints[all_time_indices, all_agent_indices].astype(
+            int
+        )
+        new_offsets = np.zeros(self.n_subpoints.shape, dtype=int)
+        agent_offsets = np.zeros_like(all_n_subpoints)
+        np.cumsum(all_n_subpoints[:-1], out=agent_offsets[1:])
+        new_offsets[all_time_indices, all_agent_indices] = agent_offsets
+        new_values = np.zeros(int(np.sum(all_n_subpoints)), dtype=self.dtype)
+        # copy the values for the agents that weren't given
+        other = ~is_given[all_time_indices, all_agent_indices]
+        other_indices = (all_time_indices[other], all_agent_indices[other])
+        new_values[
+            AgentData._ragged_indices(agent_offsets[other], all_n_subpoints[other])
+        ] = self.subpoints[
+            AgentData._ragged_indices(
+                self.subpoint_offsets[other_indices], all_n_subpoints[other]
+            )
+        ]
+        new_values[
+            AgentData._ragged_indices(
+                new_offsets[time_indices, agent_indices], n_subpoints
+            )
+        ] = values
+        self.subpoints = new_values
+        self.subpoint_offsets = new_offsets
+
+    def get_ragged_subpoints(
+        self, compact: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the subpoints as a flat array of values
+        and the offsets of each agent's first value in it.
+        If compact is True, ragged subpoints are copied to a new array
+        holding only the values for this object's agents,
+        in time then agent order
+        """
+        if self.has_ragged_subpoints() and not compact:
+            return self.subpoints, self.subpoint_offsets
+        time_indices, agent_indices = np.nonzero(self.n_subpoints > 0)
+        values = self.get_subpoints_for_agents(time_indices, agent_indices)
+        n_subpoints = self.n_subpoints[time_indices, agent_indices].astype(int)
+        offsets = np.zeros(self.n_subpoints.shape, dtype=int)
+        agent_offsets = np.zeros_like(n_subpoints)
+        np.cumsum(n_subpoints[:-1], out=agent_offsets[1:])
+        offsets[time_indices, agent_indices] = agent_offsets
+        return values, offsets
+
+    def use_ragged_subpoints(self):
+        """
+        Convert subpoints to the ragged layout:
+        a flat array of values with per agent offsets
+        """
+        if self.has_ragged_subpoints():
+            return
+        self.subpoints, self.subpoint_offsets = self.get_ragged_subpoints()
+
+    def use_padded_subpoints(self):
+        """
+        Convert subpoints to the padded layout:
+        an array of shape [timesteps, agents, max subpoints]
+        """
+        if not self.has_ragged_subpoints():
+            return
+        time_indices, agent_indices = np.nonzero(self.n_subpoints > 0)
+        values = self.get_subpoints_for_agents(time_indices, agent_indices)
+        self.subpoint_offsets = None
+        self.subpoints = np.zeros(
+            self.n_subpoints.shape
+            + (int(np.amax(self.n_subpoints)) if self.n_subpoints.size > 0 else 0,),
+            dtype=self.dtype,
+        )
+        self._set_subpoints_for_agents(
+            time_indices,
+            agent_indices,
+            self.n_subpoints[time_indices, agent_indices],
+            values,
+        )
+
+    @staticmethod
+    def _resized_array(
+        array: np.ndarray, shape: Tuple[int, ...], fill: float = 0
+    ) -> np.ndarray:
+        """
+        Get a copy of the array with the given shape,
+        keeping the current values and filling new values with fill
+        """
+        if array.shape == shape:
+            return array
+        result = np.full(shape, fill, dtype=array.dtype)
+        kept = tuple(
+            slice(0, min(current, new)) for current, new in zip(array.shape, shape)
+        )
+        result[kept] = array[kept]
+        return result
+
+    def _resize(self, dimensions: DimensionData):
+        """
+        Resize this object's numpy arrays to the given dimensions,
+        keeping the current values
+        """
+        total_steps = dimensions.total_steps
+        max_agents = dimensions.max_agents
+        agents_shape = (total_steps, max_agents)
+        self.times = AgentData._resized_array(self.times, (total_steps,))
+        self.n_agents = AgentData._resized_array(self.n_agents, (total_steps,))
+        self.viz_types = AgentData._resized_array(
+            self.viz_types, agents_shape, VIZ_TYPE.DEFAULT
+        )
+        self.unique_ids = AgentData._resized_array(self.unique_ids, agents_shape)
+        self.types.resize(total_steps, max_agents, self.n_agents)
+        self.positions = AgentData._resized_array(
+            self.positions, agents_shape + (VALUES_PER_3D_POINT,)
+        )
+        self.radii = AgentData._resized_array(self.radii, agents_shape, 1.0)
+        self.rotations = AgentData._resized_array(
+            self.rotations, agents_shape + (VALUES_PER_3D_POINT,)
+        )
+        self.n_subpoints = AgentData._resized_array(self.n_subpoints, agents_shape)
+        if self.has_ragged_subpoints():
+            self.subpoint_offsets = AgentData._resized_array(
+                self.subpoint_offsets, agents_shape
+            )
+            return
+        if len(self.subpoints.shape) < 3:
+            self.subpoints = np.zeros((0, 0, 0), dtype=self.dtype)
+        self.subpoints = AgentData._resized_array(
+            self.subpoints, agents_shape + (dimensions.max_subpoints,)
         )
 
     def get_copy_with_increased_buffer_size(
@@ -538,42 +888,9 @@ class AgentData:
         by the given added_dimensions
         """
         print(f"increase buffer {axis}")
-        current_dimensions = self.get_dimensions()
-        new_dimensions = added_dimensions.add(current_dimensions, axis)
-        current_types = copy.deepcopy(self.types)
-        result = AgentData.from_dimensions(new_dimensions)
-        result.times[0 : current_dimensions.total_steps] = self.times[:]
-        result.n_agents[0 : current_dimensions.total_steps] = self.n_agents[:]
-        result.viz_types[
-            0 : current_dimensions.total_steps, 0 : current_dimensions.max_agents
-        ] = self.viz_types[:]
-        result.unique_ids[
-            0 : current_dimensions.total_steps, 0 : current_dimensions.max_agents
-        ] = self.unique_ids[:]
-        for time_index in range(current_dimensions.total_steps):
-            n_a = int(self.n_agents[time_index])
-            for agent_index in range(n_a):
-                result.types[time_index].append(current_types[time_index][agent_index])
-        result.positions[
-            0 : current_dimensions.total_steps, 0 : current_dimensions.max_agents
-        ] = self.positions[:]
-        result.radii[
-            0 : current_dimensions.total_steps, 0 : current_dimensions.max_agents
-        ] = self.radii[:]
-        result.rotations[
-            0 : current_dimensions.total_steps, 0 : current_dimensions.max_agents
-        ] = self.rotations[:]
-        result.n_subpoints[
-            0 : current_dimensions.total_steps, 0 : current_dimensions.max_agents
-        ] = self.n_subpoints[:]
-        if len(self.subpoints.shape) > 2:
-            result.subpoints[
-                0 : current_dimensions.total_steps,
-                0 : current_dimensions.max_agents,
-                0 : current_dimensions.max_subpoints,
-            ] = self.subpoints[:]
-        result.display_data = copy.deepcopy(self.display_data)
-        result.draw_fiber_points = self.draw_fiber_points
+        new_dimensions = added_dimensions.add(self.get_dimensions(), axis)
+        result = copy.deepcopy(self)
+        result._resize(new_dimensions)
         return result
 
     def check_increase_buffer_size(
@@ -583,46 +900,45 @@ class AgentData:
         buffer_size_inc: DimensionData = BUFFER_SIZE_INC,
     ) -> AgentData:
         """
-        If needed for the next_index to fit in the arrays, create a copy of this object
-        with the size of the numpy arrays increased by the buffer_size_inc
-        """
-        result = self
-        if axis == 0:  # time dimension
-            while next_index >= result.get_dimensions().total_steps:
-                result = result.get_copy_with_increased_buffer_size(
-                    DimensionData(
-                        total_steps=buffer_size_inc.total_steps,
-                        max_agents=0,
-                    ),
-                    axis,
-                )
-        elif axis == 1:  # agents dimension
-            while next_index >= result.get_dimensions().max_agents:
-                result = result.get_copy_with_increased_buffer_size(
-                    DimensionData(
-                        total_steps=0,
-                        max_agents=buffer_size_inc.max_agents,
-                    ),
-                    axis,
-                )
-        elif axis == 2:  # subpoints dimension
-            while next_index >= result.get_dimensions().max_subpoints:
-                result = result.get_copy_with_increased_buffer_size(
-                    DimensionData(
-                        total_steps=0,
-                        max_agents=0,
-                        max_subpoints=buffer_size_inc.max_subpoints,
-                    ),
-                    axis,
-                )
-        return result
+        If needed for the next_index to fit in the arrays, increase the size
+        of this object's numpy arrays in place. The size at least doubles,
+        and increases by at least the buffer_size_inc, so that adding
+        agents or timesteps one at a time costs amortized constant time
+        """
+        if axis == 2 and self.has_ragged_subpoints():
+            return self
+        dimensions = self.get_dimensions()
+        sizes = [
+            dimensions.total_steps,
+            dimensions.max_agents,
+            dimensions.max_subpoints,
+        ]
+        increments = [
+            buffer_size_inc.total_steps,
+            buffer_size_inc.max_agents,
+            buffer_size_inc.max_subpoints,
+        ]
+        if axis not in [0, 1, 2] or next_index < sizes[axis]:
+            return self
+        print(f"increase buffer {axis}")
+        sizes[axis] = max(
+            next_index + 1, sizes[axis] + increments[axis], 2 * sizes[axis]
+        )
+        self._resize(
+            DimensionData(
+                total_steps=sizes[0],
+                max_agents=sizes[1],
+                max_subpoints=sizes[2],
+            )
+        )
+        return self
 
     def display_type_for_agent(self, time_index: int, agent_index: int) -> DISPLAY_TYPE:
         """
         Get the DISPLAY_TYPE for the agent
         at the given time and agent indices
         """
-        type_name = self.types[time_index][agent_index]
+        type_name = self.types.get_name(time_index, agent_index)
         if type_name not in self.display_data:
             self.display_data[type_name] = DisplayData(
                 name=type_name,
@@ -653,24 +969,291 @@ class AgentData:
                 return default_display_types[values_per_item]
         return DISPLAY_TYPE.SPHERE
 
+    def get_agent_mask(self) -> np.ndarray:
+        """
+        Get a mask (shape = [timesteps, agents])
+        that is True where there is an agent
+        """
+        total_steps = self.times.shape[0]
+        return (
+            np.arange(self.viz_types.shape[1]) < self.n_agents[:total_steps, np.newaxis]
+        )
+
+    def get_subset_of_agents(
+        self, time_indices: np.ndarray, agent_indices: np.ndarray
+    ) -> AgentData:
+        """
+        Create AgentData with only the agents at the given time and agent
+        indices, which are in time order, moved to the start of each frame
+        and sized to fit them
+        """
+        total_steps = self.times.shape[0]
+        n_kept = np.bincount(time_indices, minlength=total_steps)
+        frame_starts = np.zeros_like(n_kept)
+        np.cumsum(n_kept[:-1], out=frame_starts[1:])
+        new_agent_indices = np.arange(time_indices.size) - frame_starts[time_indices]
+        kept_n_subpoints = self.n_subpoints[time_indices, agent_indices]
+        new_dimensions = DimensionData(
+            total_steps=total_steps,
+            max_agents=int(np.amax(n_kept)) if n_kept.size > 0 else 0,
+            max_subpoints=int(np.amax(kept_n_subpoints))
+            if kept_n_subpoints.size > 0
+            else 0,
+        )
+        result = AgentData.from_dimensions(
+            new_dimensions,
+            ragged_subpoints=self.has_ragged_subpoints(),
+            dtype=self.dtype,
+        )
+        result.times = self.times
+        result.draw_fiber_points = self.draw_fiber_points
+        result.display_data = self.display_data
+        result.n_agents[:] = n_kept
+        new_indices = (time_indices, new_agent_indices)
+        kept_indices = (time_indices, agent_indices)
+        result.viz_types[new_indices] = self.viz_types[kept_indices]
+        result.unique_ids[new_indices] = self.unique_ids[kept_indices]
+        result.positions[new_indices] = self.positions[kept_indices]
+        result.radii[new_indices] = self.radii[kept_indices]
+        result.rotations[new_indices] = self.rotations[kept_indices]
+        result.types = self.types.get_subset(
+            time_indices,
+            agent_indices,
+            time_indices,
+            new_agent_indices,
+            new_dimensions.total_steps,
+            new_dimensions.max_agents,
+        )
+        result._set_subpoints_for_agents(
+            time_indices,
+            new_agent_indices,
+            kept_n_subpoints,
+            self.get_subpoints_for_agents(time_indices, agent_indices),
+        )
+        return result
+
+    def display_types_for_codes(
+        self, agent_mask: np.ndarray = None
+    ) -> List[DISPLAY_TYPE]:
+        """
+        Get the DISPLAY_TYPE for each type code, or None for type names
+        that no agent has. Like display_type_for_agent, DisplayData
+        is added for any type names that don't have it
+
+        Parameters
+        ----------
+        agent_mask : np.ndarray (shape = [timesteps, agents]) (optional)
+            Only include the agents where this is True
+            Default: all the agents
+        """
+        if agent_mask is None:
+            agent_mask = self.get_agent_mask()
+        time_indices, agent_indices = np.nonzero(agent_mask)
+        codes = self.types.codes[time_indices, agent_indices]
+        unique_codes, first_indices = np.unique(codes, return_index=True)
+        result = len(self.types.names) * [None]
+        for index in np.sort(first_indices[unique_codes >= 0]):
+            result[codes[index]] = self.display_type_for_agent(
+                time_indices[index], agent_indices[index]
+            )
+        return result
+
     def _check_subpoints_match_display_type(self):
         """
         Check that the number of subpoints is divisible
-        by the values per item for the agent's display type
-        """
-        for time_index in range(self.times.shape[0]):
-            for agent_index in range(int(self.n_agents[time_index])):
-                display_type = self.display_type_for_agent(time_index, agent_index)
-                values_per_item = SUBPOINT_VALUES_PER_ITEM(display_type)
-                n_subpoints = self.n_subpoints[time_index][agent_index]
-                if n_subpoints % values_per_item != 0:
-                    type_name = self.types[time_index][agent_index]
-                    raise Exception(
-                        f"T = {time_index} : {type_name} at index = "
-                        f"{agent_index} has n_subpoints = {n_subpoints} "
-                        f"but is display_type = {display_type}, which requires "
-                        f"subpoints in multiples of {values_per_item}"
-                    )
+        by the values per item for the agent's display type,
+        and report all the agents where it isn't
+        """
+        agent_mask = self.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        codes = self.types.codes[:total_steps, :max_agents]
+        n_subpoints = self.n_subpoints[:total_steps, :max_agents]
+        display_types = self.display_types_for_codes(agent_mask) + [None]
+        # values per item for each type code, the last is for codes that are -1
+        values_per_item = np.array(
+            [SUBPOINT_VALUES_PER_ITEM(display_type) for display_type in display_types]
+        )
+        time_indices, agent_indices = np.nonzero(
+            agent_mask & (n_subpoints % values_per_item[codes] != 0)
+        )
+        if time_indices.size < 1:
+            return
+        messages = []
+        for time_index, agent_index in zip(time_indices, agent_indices):
+            code = codes[time_index, agent_index]
+            messages.append(
+                f"T = {time_index} : {self.types.names[code]} at index = "
+                f"{agent_index} has n_subpoints = "
+                f"{n_subpoints[time_index, agent_index]} "
+                f"but is display_type = {display_types[code]}, which requires "
+                f"subpoints in multiples of {values_per_item[code]}"
+            )
+        raise DataError("\n".join(messages))
+
+    @staticmethod
+    def array_field_names() -> List[str]:
+        """
+        Get the names of the fields that hold data for each agent or timestep
+        """
+        return [
+            "times",
+            "n_agents",
+            "viz_types",
+            "unique_ids",
+            "types",
+            "positions",
+            "radii",
+            "rotations",
+            "n_subpoints",
+            "subpoints",
+            "subpoint_offsets",
+        ]
+
+    def get_frames(self, frames: Union[slice, np.ndarray]) -> AgentData:
+        """
+        Get AgentData for the given timesteps, its arrays are views
+        of this object's arrays if frames is a slice, otherwise copies.
+        Ragged subpoints only hold the values for the given timesteps,
+        with offsets into them: a view if those values are stored together,
+        otherwise a compacted copy
+        """
+        result = copy.copy(self)
+        result.n_timesteps = -1
+        for field_name in AgentData.array_field_names():
+            if field_name == "subpoints" and self.has_ragged_subpoints():
+                continue
+            value = getattr(self, field_name)
+            if value is None:
+                continue
+            setattr(result, field_name, value[frames])
+        if self.has_ragged_subpoints():
+            result._use_own_ragged_subpoints()
+        return result
+
+    def _use_own_ragged_subpoints(self):
+        """
+        Replace the flat array of ragged subpoints, which can hold values
+        for agents that aren't in this object, with only this object's values
+        and rebase the offsets
+        """
+        has_subpoints = self.n_subpoints > 0
+        n_subpoints = self.n_subpoints[has_subpoints].astype(int)
+        n_values = int(np.sum(n_subpoints))
+        if n_values < 1:
+            self.subpoints = self.subpoints[:0]
+            self.subpoint_offsets = np.zeros(self.n_subpoints.shape, dtype=int)
+            return
+        offsets = self.subpoint_offsets[has_subpoints]
+        start = int(np.amin(offsets))
+        end = int(np.amax(offsets + n_subpoints))
+        if end - start == n_values:
+            # the values are stored together, so keep a view of them
+            self.subpoints = self.subpoints[start:end]
+            self.subpoint_offsets = np.where(
+                has_subpoints, self.subpoint_offsets - start, 0
+            )
+            return
+        self.subpoints, self.subpoint_offsets = self.get_ragged_subpoints(compact=True)
+
+    @staticmethod
+    def concatenate_frames(agent_datas: List[AgentData]) -> AgentData:
+        """
+        Create AgentData with the timesteps of each of the given AgentData
+        in order, sized to fit the most agents and subpoints.
+        Subpoints are ragged if the first AgentData's subpoints are ragged
+        """
+        ragged = agent_datas[0].has_ragged_subpoints()
+        max_agents = max(agent_data.viz_types.shape[1] for agent_data in agent_datas)
+        max_subpoints = (
+            max(agent_data._max_subpoints_capacity() for agent_data in agent_datas)
+            if not ragged
+            else 0
+        )
+        types = TypeNameData.from_dimensions(0)
+        for agent_data in agent_datas:
+            for type_name in agent_data.types.names:
+                types.get_code(type_name)
+        chunks = []
+        ragged_values = []
+        n_ragged_values = 0
+        for agent_data in agent_datas:
+            chunk = copy.copy(agent_data)
+            chunk.types = copy.copy(agent_data.types)
+            if ragged:
+                values, offsets = agent_data.get_ragged_subpoints(compact=True)
+                ragged_values.append(values.astype(agent_data.dtype, copy=False))
+                chunk.subpoint_offsets = np.where(
+                    agent_data.n_subpoints > 0, offsets + n_ragged_values, 0
+                )
+                n_ragged_values += values.shape[0]
+            elif agent_data.has_ragged_subpoints():
+                chunk.use_padded_subpoints()
+            chunk._resize(
+                DimensionData(chunk.total_timesteps(), max_agents, max_subpoints)
+            )
+            # keep all the type codes, not only those for the first n_agents
+            chunk.types = TypeNameData(
+                codes=agent_data.types._codes_in(types),
+                names=types.names,
+                n_types=agent_data.types.n_types,
+            )
+            chunk.types.resize(chunk.total_timesteps(), max_agents)
+            chunks.append(chunk)
+        result = copy.copy(chunks[0])
+        result.n_timesteps = -1
+        for field_name in AgentData.array_field_names():
+            if field_name == "types" or getattr(result, field_name) is None:
+                continue
+            if field_name == "subpoints" and ragged:
+                result.subpoints = np.concatenate(ragged_values)
+                continue
+            setattr(
+                result,
+                field_name,
+                np.concatenate([getattr(chunk, field_name) for chunk in chunks]),
+            )
+        result.types = TypeNameData(
+            codes=np.concatenate([chunk.types.codes for chunk in chunks]),
+            names=types.names,
+            n_types=np.concatenate([chunk.types.n_types for chunk in chunks]),
+        )
+        result.display_data = {}
+        for chunk in chunks:
+            result.display_data.update(chunk.display_data)
+        return result
+
+    def get_shallow_copy(self) -> AgentData:
+        """
+        Create a copy of this object that shares its arrays,
+        with a copy of the display_data
+        """
+        result = copy.copy(self)
+        result.display_data = copy.deepcopy(self.display_data)
+        return result
+
+    def copy_fields_shared_with(self, other: AgentData, field_names: List[str]):
+        """
+        Replace any of the given fields that share memory
+        with the other AgentData's fields with copies,
+        so they can be changed in place without changing the other's
+        """
+        for field_name in field_names:
+            value = getattr(self, field_name)
+            other_value = getattr(other, field_name)
+            if value is None or other_value is None:
+                continue
+            if isinstance(value, np.ndarray):
+                shared = isinstance(other_value, np.ndarray) and np.may_share_memory(
+                    value, other_value
+                )
+                if shared:
+                    setattr(self, field_name, np.copy(value))
+            elif value is other_value or (
+                isinstance(value, TypeNameData)
+                and isinstance(other_value, TypeNameData)
+                and np.may_share_memory(value.codes, other_value.codes)
+            ):
+                setattr(self, field_name, copy.deepcopy(value))
 
     def __deepcopy__(self, memo):
         result = type(self)(
@@ -686,9 +1269,29 @@ class AgentData:
             subpoints=np.copy(self.subpoints),
             display_data=copy.deepcopy(self.display_data, memo),
             draw_fiber_points=self.draw_fiber_points,
+            subpoint_offsets=np.copy(self.subpoint_offsets)
+            if self.has_ragged_subpoints()
+            else None,
+            dtype=self.dtype,
         )
         return result
 
+    def _subpoints_equal(self, other: AgentData) -> bool:
+        """
+        Check if the subpoints are close to another AgentData's,
+        comparing values for each agent if either one is ragged
+        """
+        if not self.has_ragged_subpoints() and not other.has_ragged_subpoints():
+            return False not in np.isclose(self.subpoints, other.subpoints)
+        if self.n_subpoints.shape != other.n_subpoints.shape:
+            return False
+        time_indices, agent_indices = np.nonzero(self.n_subpoints > 0)
+        self_values = self.get_subpoints_for_agents(time_indices, agent_indices)
+        other_values = other.get_subpoints_for_agents(time_indices, agent_indices)
+        return self_values.shape == other_values.shape and False not in np.isclose(
+            self_values, other_values
+        )
+
     def __eq__(self, other):
         return (
             self.n_timesteps == other.n_timesteps
@@ -701,7 +1304,7 @@ class AgentData:
             and False not in np.isclose(self.radii, other.radii)
             and False not in np.isclose(self.rotations, other.rotations)
             and False not in np.isclose(self.n_subpoints, other.n_subpoints)
-            and False not in np.isclose(self.subpoints, other.subpoints)
+            and self._subpoints_equal(other)
             and self.display_data == other.display_data
             and self.draw_fiber_points == other.draw_fiber_points
         )
@@ -1,4 +1,5 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
+import mmap
 import numpy as np
 
 from .frame_data import FrameData
@@ -10,17 +11,37 @@ from ..readers import BinaryBlockInfo, SimulariumBinaryReader
 
 
 class BinaryData(SimulariumFileData):
-    def __init__(self, file_contents: bytes):
+    def __init__(
+        self,
+        file_contents: bytes = b"",
+        file_path: str = "",
+        memory_map: bool = False,
+    ):
         """
         This object holds binary encoded simulation trajectory file's
         data while staying close to the original file format
 
         Parameters
         ----------
-        file_contents : bytes
+        file_contents : bytes (optional)
             A byte array containing the data of an open .simularium file
-        """
-        self.file_contents = InputFileData(file_contents=file_contents)
+            Default: use file_path instead
+        file_path : str (optional)
+            A string path to a .simularium file
+            Default: use file_contents instead
+        memory_map : bool (optional)
+            If loading from file_path, memory map the file instead of
+            reading it into memory, so opening it is fast and only
+            the frames that are accessed get loaded
+            Default: False
+            (call close() or use BinaryData as a context manager
+            to close the memory map when the data isn't needed)
+        """
+        self.file_contents = InputFileData(
+            file_path=file_path,
+            file_contents=file_contents,
+            memory_map=memory_map,
+        )
         self.file_data = SimulariumBinaryReader._binary_data_from_source(
             self.file_contents
         )
@@ -81,7 +102,8 @@ class BinaryData(SimulariumFileData):
     def get_frame_at_index(self, frame_number: int) -> FrameData:
         """
         Return frame data for frame at index. If there is no frame at the index,
-        return None.
+        return None. The frame's data is a memoryview of the file's bytes,
+        which doesn't copy them
         """
         if frame_number < 0 or frame_number >= len(self.frame_metadata):
             # invalid frame number requested
@@ -89,7 +111,7 @@ class BinaryData(SimulariumFileData):
 
         metadata: FrameMetadata = self.frame_metadata[frame_number]
         start, end = metadata.get_start_end_indices()
-        data = self.file_data.byte_view[start:end]
+        data = memoryview(self.file_data.byte_view)[start:end]
         return FrameData(
             frame_number=frame_number,
             n_agents=self.file_data.int_view[
@@ -139,12 +161,15 @@ class BinaryData(SimulariumFileData):
         """
         Return the data of the trajectory, as a TrajectoryData object
         """
-        trajectory_dict = SimulariumBinaryReader.load_binary(self.file_contents)
+        trajectory_dict = SimulariumBinaryReader._load_binary(
+            self.file_contents, spatial_data_as_lists=False
+        )
         return TrajectoryData.from_buffer_data(trajectory_dict)
 
-    def get_file_contents(self) -> bytes:
+    def get_file_contents(self) -> Union[bytes, mmap.mmap]:
         """
         Return raw file data, as bytes
+        (or a read-only mmap if the file is memory mapped)
         """
         return self.file_contents.get_contents()
 
@@ -154,6 +179,21 @@ class BinaryData(SimulariumFileData):
         """
         return len(self.frame_metadata)
 
+    def close(self):
+        """
+        Close the memory map of the file, if it is memory mapped.
+        Frame data from get_frame_at_index shares memory with the file,
+        so release it first
+        """
+        self.file_data = None
+        self.file_contents.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 class FrameMetadata:
     def __init__(self, offset: int, length: int, frame_number: int, time: float):
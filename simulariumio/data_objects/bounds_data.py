@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+from .agent_data import AgentData
+from ..constants import VALUES_PER_3D_POINT
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+
+class BoundsData:
+    min_dimensions: np.ndarray
+    max_dimensions: np.ndarray
+    n_subpoint_values: int
+
+    def __init__(self):
+        """
+        This object accumulates the minimum and maximum X, Y, and Z
+        of agent positions (minus and plus their radii) and subpoints
+        while a converter parses them, so the bounds of the data are known
+        at the end of parsing without scanning the AgentData again
+        """
+        self.min_dimensions = None
+        self.max_dimensions = None
+        self.n_subpoint_values = 0
+
+    def is_empty(self) -> bool:
+        """
+        Have no values been added yet?
+        """
+        return self.min_dimensions is None
+
+    def _add_min_max(self, min_dimensions: np.ndarray, max_dimensions: np.ndarray):
+        """
+        Expand the bounds to include the given minimum and maximum XYZ values
+        """
+        if self.is_empty():
+            self.min_dimensions = min_dimensions
+            self.max_dimensions = max_dimensions
+            return
+        self.min_dimensions = np.fmin(self.min_dimensions, min_dimensions)
+        self.max_dimensions = np.fmax(self.max_dimensions, max_dimensions)
+
+    def add_agents(self, positions: np.ndarray, radii: np.ndarray):
+        """
+        Add agent positions (shape = [agents, 3]) and radii (shape = [agents])
+        """
+        if radii.size < 1:
+            return
+        self._add_min_max(
+            np.fmin.reduce(positions - radii[:, np.newaxis], axis=0),
+            np.fmax.reduce(positions + radii[:, np.newaxis], axis=0),
+        )
+
+    def add_subpoints(self, subpoints: np.ndarray):
+        """
+        Add subpoint values (shape = [values]), which are read as XYZ
+        coordinates one after another with the values that were added before
+        """
+        if subpoints.size < 1:
+            return
+        # the axis of each value
+        axes = (self.n_subpoint_values + np.arange(subpoints.size)) % (
+            VALUES_PER_3D_POINT
+        )
+        self.n_subpoint_values += subpoints.size
+        self._add_min_max(
+            np.array(
+                [
+                    np.fmin.reduce(subpoints, where=axes == axis, initial=np.inf)
+                    for axis in range(VALUES_PER_3D_POINT)
+                ],
+                dtype=subpoints.dtype,
+            ),
+            np.array(
+                [
+                    np.fmax.reduce(subpoints, where=axes == axis, initial=-np.inf)
+                    for axis in range(VALUES_PER_3D_POINT)
+                ],
+                dtype=subpoints.dtype,
+            ),
+        )
+
+    def add_frame(
+        self, agent_data: AgentData, time_index: int, start_agent_index: int = 0
+    ):
+        """
+        Add the agents in a timestep of AgentData once they are parsed
+
+        Parameters
+        ----------
+        agent_data : AgentData
+            The data being parsed
+        time_index : int
+            The index of the timestep to add
+        start_agent_index : int (optional)
+            Only add the agents at or after this index in the timestep,
+            when the agents before it were already added
+            Default: 0
+        """
+        n_agents = int(agent_data.n_agents[time_index])
+        self.add_agents(
+            agent_data.positions[time_index, start_agent_index:n_agents],
+            agent_data.radii[time_index, start_agent_index:n_agents],
+        )
+        agent_indices = (
+            start_agent_index
+            + np.nonzero(
+                agent_data.n_subpoints[time_index, start_agent_index:n_agents] > 0
+            )[0]
+        )
+        if agent_indices.size > 0:
+            self.add_subpoints(
+                agent_data.get_subpoints_for_agents(
+                    np.full(agent_indices.size, time_index), agent_indices
+                )
+            )
+
+    def get_min_max(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the minimum and maximum X, Y, and Z values that were added
+        """
+        return (self.min_dimensions, self.max_dimensions)
@@ -3,7 +3,11 @@ from typing import Dict, Union
 
 class FrameData:
     def __init__(
-        self, frame_number: int, n_agents: int, time: float, data: Union[bytes, Dict]
+        self,
+        frame_number: int,
+        n_agents: int,
+        time: float,
+        data: Union[bytes, memoryview, Dict],
     ):
         """
         This object holds frame data for a single frame of simularium data
@@ -16,9 +20,10 @@ class FrameData:
             Number of agents included in the frame
         time : float
             Elapsed simulation time of the frame
-        data : bytes or dict
-            Spatial data for the frame, as a byte array for binary encoded
-            .simularium files or as a dict for JSON .simularium files
+        data : bytes, memoryview, or dict
+            Spatial data for the frame, as a byte array or a memoryview
+            of the file's bytes for binary encoded .simularium files
+            or as a dict for JSON .simularium files
         """
         self.frame_number = frame_number
         self.n_agents = n_agents
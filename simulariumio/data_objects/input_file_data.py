@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import logging
+import mmap
 from typing import Union
 
 from ..exceptions import DataError
@@ -17,11 +18,13 @@ log = logging.getLogger(__name__)
 class InputFileData:
     file_path: str
     file_contents: str
+    memory_map: bool
 
     def __init__(
         self,
         file_path: str = "",
         file_contents: Union[str, bytes] = "",
+        memory_map: bool = False,
     ):
         """
         This object contains data about a file
@@ -34,6 +37,13 @@ class InputFileData:
         file_contents: str or bytes (optional)
             A string of data from an opened file
             Default: use file_path instead
+        memory_map: bool (optional)
+            If the file at file_path is binary, memory map it
+            instead of reading it all into memory, so only
+            the parts of the file that are accessed get loaded
+            Default: False
+            (call close() or use InputFileData as a context manager
+            to close the memory map when the contents aren't needed)
         """
         if not file_path and not file_contents:
             raise DataError(
@@ -42,6 +52,8 @@ class InputFileData:
             )
         self.file_path = file_path
         self.file_contents = file_contents
+        self.memory_map = memory_map
+        self._mapped_contents = None
 
     def get_contents(self):
         """
@@ -50,16 +62,48 @@ class InputFileData:
         If file_contents is not empty, return that.
         Otherwise try to open the file at file_path
         and return the data inside as a string or as
-        bytes, for binary files.
+        bytes, for binary files. If memory_map is True,
+        binary files are returned as a read-only mmap
         """
         if self.file_contents:
             return self.file_contents
         if self._is_binary():
+            if self.memory_map:
+                return self._get_mapped_contents()
             with open(self.file_path, "rb") as myfile:
                 return myfile.read()
         with open(self.file_path, "r") as myfile:
             return myfile.read()
 
+    def _get_mapped_contents(self) -> mmap.mmap:
+        """
+        Memory map the binary file at file_path,
+        the map is only created the first time it's requested
+        """
+        if self._mapped_contents is None:
+            with open(self.file_path, "rb") as myfile:
+                self._mapped_contents = mmap.mmap(
+                    myfile.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        return self._mapped_contents
+
+    def close(self):
+        """
+        Close the memory map of the file, if it was created.
+        Any views of the contents, like numpy arrays or memoryviews,
+        must be released first
+        """
+        if self._mapped_contents is None:
+            return
+        self._mapped_contents.close()
+        self._mapped_contents = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _is_binary(self):
         """
         Is this data in binary? (or JSON?)
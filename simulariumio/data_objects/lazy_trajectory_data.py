@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import copy
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple, Union
+
+import numpy as np
+
+from .agent_data import AgentData
+from .dimension_data import DimensionData
+from .meta_data import MetaData
+from .trajectory_data import TrajectoryData
+from .unit_data import UnitData
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+
+def _filter_frames(
+    data: TrajectoryData,
+    frames: Union[slice, np.ndarray],
+    filters: List[Any],
+    display_data: Dict[str, Any],
+) -> AgentData:
+    """
+    Apply the filters to AgentData for the given timesteps of the data,
+    copying any fields that a filter changes in place
+    """
+    frame_data = TrajectoryData(
+        meta_data=copy.copy(data.meta_data),
+        agent_data=data.agent_data.get_frames(frames),
+        time_units=copy.deepcopy(data.time_units),
+        spatial_units=copy.deepcopy(data.spatial_units),
+    )
+    frame_data.agent_data.display_data = display_data
+    for f in filters:
+        frame_data.agent_data.copy_fields_shared_with(
+            data.agent_data, f.get_mutated_agent_data_fields()
+        )
+        frame_data = f.apply_to_frames(frame_data)
+    return frame_data.agent_data
+
+
+def _shared_array_fields(agent_data: AgentData) -> Dict[str, np.ndarray]:
+    """
+    Get the numpy arrays in AgentData, keyed by field name,
+    with "types." before the names of the TypeNameData arrays
+    """
+    result = {}
+    for field_name in AgentData.array_field_names():
+        value = getattr(agent_data, field_name)
+        if field_name == "types":
+            result["types.codes"] = value.codes
+            result["types.n_types"] = value.n_types
+        elif isinstance(value, np.ndarray):
+            result[field_name] = value
+    return result
+
+
+def _set_shared_array_field(agent_data: AgentData, field_name: str, value: Any):
+    """
+    Set a field from _shared_array_fields in AgentData
+    """
+    if field_name.startswith("types."):
+        setattr(agent_data.types, field_name[len("types.") :], value)
+    else:
+        setattr(agent_data, field_name, value)
+
+
+def _filter_shared_frames(
+    data: TrajectoryData,
+    shared_arrays: Dict[str, Tuple[str, Tuple[int, ...], str]],
+    frames: Union[slice, np.ndarray],
+    filters: List[Any],
+    display_data: Dict[str, Any],
+) -> AgentData:
+    """
+    In a worker process, apply the filters to the given timesteps
+    of data whose AgentData arrays are in shared memory blocks,
+    given as (block name, shape, dtype) for each field
+    """
+    blocks = []
+    for field_name, (block_name, shape, dtype) in shared_arrays.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        _set_shared_array_field(
+            data.agent_data,
+            field_name,
+            np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf),
+        )
+    # copy the result so it doesn't use the shared memory
+    result = copy.deepcopy(_filter_frames(data, frames, filters, display_data))
+    for field_name in shared_arrays:
+        _set_shared_array_field(data.agent_data, field_name, None)
+    for block in blocks:
+        block.close()
+    return result
+
+
+###############################################################################
+
+
+class LazyTrajectoryData:
+    data: TrajectoryData
+    filters: List[Any]
+    frame_indices: np.ndarray
+    meta_data: MetaData
+    agent_data: AgentData
+    time_units: UnitData
+    spatial_units: UnitData
+    plots: List[Dict[str, Any]]
+
+    def __init__(self, data: TrajectoryData, filters: List[Any]):
+        """
+        This object holds simulation trajectory outputs and filters
+        that are applied to one frame at a time when the frame is needed,
+        so writers can write filtered frames without keeping
+        a filtered copy of the whole trajectory
+
+        Parameters
+        ----------
+        data : TrajectoryData
+            The unfiltered data, it is not changed
+        filters : List[Filter]
+            The filters to apply, in order. Each filter must filter
+            each frame independently of the other frames by overriding
+            Filter.apply_to_frames, or select frames with
+            Filter.get_frame_indices
+        """
+        self.data = data
+        self.filters = filters
+        source_agent_data = data.agent_data
+        total_steps = source_agent_data.total_timesteps()
+        self._display_data = copy.deepcopy(source_agent_data.display_data)
+        # apply the filters to the frames without any agents
+        # to get the kept frames, filtered times, metadata, and plots
+        header_agent_data = AgentData.from_dimensions(
+            DimensionData(total_steps=total_steps, max_agents=0),
+            dtype=source_agent_data.dtype,
+        )
+        header_agent_data.times = np.copy(source_agent_data.times[:total_steps])
+        header_agent_data.display_data = copy.deepcopy(self._display_data)
+        header_agent_data.draw_fiber_points = source_agent_data.draw_fiber_points
+        header_data = TrajectoryData(
+            meta_data=copy.deepcopy(data.meta_data),
+            agent_data=header_agent_data,
+            time_units=copy.deepcopy(data.time_units),
+            spatial_units=copy.deepcopy(data.spatial_units),
+            plots=copy.deepcopy(data.plots),
+        )
+        frame_indices = np.arange(total_steps)
+        self._frame_filters = []
+        for f in filters:
+            kept_frames = f.get_frame_indices(header_data)
+            if kept_frames is not None:
+                frame_indices = frame_indices[kept_frames]
+            else:
+                self._frame_filters.append(f)
+            header_data = f.apply_to_frames(header_data)
+        self.frame_indices = frame_indices
+        self.meta_data = header_data.meta_data
+        self.agent_data = header_data.agent_data
+        self.time_units = header_data.time_units
+        self.spatial_units = header_data.spatial_units
+        self.plots = header_data.plots
+
+    def total_timesteps(self) -> int:
+        """
+        Get number of filtered timesteps
+        """
+        return int(self.frame_indices.size)
+
+    def get_header_data(self) -> TrajectoryData:
+        """
+        Get TrajectoryData with the filtered metadata, units, and plots,
+        and AgentData with the filtered times but no agents
+        """
+        return TrajectoryData(
+            meta_data=self.meta_data,
+            agent_data=copy.copy(self.agent_data),
+            time_units=self.time_units,
+            spatial_units=self.spatial_units,
+            plots=self.plots,
+        )
+
+    def get_type_id_for_code_and_mapping(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Number the types in the order they first appear in the kept frames
+        of the unfiltered data, and get the type ID for each type code,
+        with a last entry for codes that are -1
+        """
+        source_agent_data = self.data.agent_data
+        codes = source_agent_data.types.codes[self.frame_indices]
+        return source_agent_data.get_type_id_for_code_and_mapping(codes)
+
+    def get_frame(self, time_index: int) -> AgentData:
+        """
+        Get AgentData with one timestep containing
+        the filtered frame at the given filtered time index
+        """
+        source_index = int(self.frame_indices[time_index])
+        return _filter_frames(
+            self.data,
+            slice(source_index, source_index + 1),
+            self._frame_filters,
+            self._display_data,
+        )
+
+    def _get_frame_chunks(self, n_chunks: int) -> List[Union[slice, np.ndarray]]:
+        """
+        Split the kept frames into chunks of consecutive filtered timesteps,
+        as slices of the unfiltered timesteps where possible
+        """
+        result = []
+        for frames in np.array_split(self.frame_indices, n_chunks):
+            if frames.size < 1:
+                continue
+            steps = np.diff(frames)
+            if steps.size < 1 or (steps[0] > 0 and np.all(steps == steps[0])):
+                step = int(steps[0]) if steps.size > 0 else 1
+                result.append(slice(int(frames[0]), int(frames[-1]) + 1, step))
+            else:
+                result.append(frames)
+        return result
+
+    def _filter_chunks_in_processes(
+        self, frame_chunks: List[Union[slice, np.ndarray]], n_workers: int
+    ) -> List[AgentData]:
+        """
+        Filter each chunk of frames in a pool of processes,
+        which read the unfiltered AgentData arrays from shared memory
+        """
+        arrays = _shared_array_fields(self.data.agent_data)
+        # the data sent to each process, without the arrays
+        data = copy.copy(self.data)
+        data.plots = []
+        data.agent_data = copy.copy(self.data.agent_data)
+        data.agent_data.types = copy.copy(self.data.agent_data.types)
+        data.agent_data.display_data = {}
+        blocks = []
+        shared_arrays = {}
+        try:
+            for field_name, array in arrays.items():
+                block = shared_memory.SharedMemory(
+                    create=True, size=max(array.nbytes, 1)
+                )
+                blocks.append(block)
+                np.copyto(
+                    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf), array
+                )
+                shared_arrays[field_name] = (block.name, array.shape, array.dtype.str)
+                _set_shared_array_field(data.agent_data, field_name, None)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _filter_shared_frames,
+                        data,
+                        shared_arrays,
+                        frames,
+                        self._frame_filters,
+                        self._display_data,
+                    )
+                    for frames in frame_chunks
+                ]
+                return [future.result() for future in futures]
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def get_trajectory_data(
+        self, n_workers: int = 1, use_processes: bool = False
+    ) -> TrajectoryData:
+        """
+        Apply the filters and get the filtered TrajectoryData
+
+        Parameters
+        ----------
+        n_workers : int (optional)
+            Split the kept frames into this many chunks of timesteps,
+            filter the chunks in parallel, and join them
+            Default: 1 (apply the filters to the whole trajectory at once)
+        use_processes : bool (optional)
+            Filter the chunks in a pool of processes that read
+            the unfiltered arrays from shared memory, instead of
+            a pool of threads? Threads work well for filters that
+            spend most of their time in numpy, which releases the GIL
+            Default: False
+        """
+        if n_workers < 2:
+            result = self.data.get_shallow_copy()
+            for f in self.filters:
+                result.agent_data.copy_fields_shared_with(
+                    self.data.agent_data, f.get_mutated_agent_data_fields()
+                )
+                result = f.apply_to_frames(result)
+            return result
+        frame_chunks = self._get_frame_chunks(n_workers)
+        if len(frame_chunks) < 1:
+            frame_chunks = [self.frame_indices]
+        if use_processes:
+            agent_datas = self._filter_chunks_in_processes(frame_chunks, n_workers)
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                agent_datas = list(
+                    executor.map(
+                        lambda frames: _filter_frames(
+                            self.data,
+                            frames,
+                            self._frame_filters,
+                            self._display_data,
+                        ),
+                        frame_chunks,
+                    )
+                )
+        agent_data = AgentData.concatenate_frames(agent_datas)
+        agent_data.display_data = copy.deepcopy(agent_data.display_data)
+        return TrajectoryData(
+            meta_data=copy.deepcopy(self.meta_data),
+            agent_data=agent_data,
+            time_units=copy.deepcopy(self.time_units),
+            spatial_units=copy.deepcopy(self.spatial_units),
+            plots=copy.deepcopy(self.plots),
+        )
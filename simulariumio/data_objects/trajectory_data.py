@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+from __future__ import annotations
 
 import copy
 import logging
@@ -101,9 +102,17 @@ class TrajectoryData:
         current_dimensions = self.agent_data.get_dimensions()
         added_dimensions = new_agents.get_dimensions()
         new_dimensions = current_dimensions.add(added_dimensions, axis=1)
+        # the buffer is resized in place, so keep the current agent info
+        current_n_agents = np.copy(self.agent_data.n_agents)
+        used_uids = list(np.unique(self.agent_data.unique_ids).astype(int))
         result = self.agent_data.check_increase_buffer_size(
             new_dimensions.max_agents - 1, axis=1, buffer_size_inc=BUFFER_SIZE_INC
         )
+        ragged_subpoints = (
+            result.has_ragged_subpoints() or new_agents.has_ragged_subpoints()
+        )
+        if ragged_subpoints:
+            result.use_ragged_subpoints()
         # add new agents
         result.n_agents = np.add(result.n_agents, new_agents.n_agents)
         start_i = current_dimensions.max_agents
@@ -113,13 +122,20 @@ class TrajectoryData:
         result.radii[:, start_i:end_i] = new_agents.radii[:]
         result.rotations[:, start_i:end_i] = new_agents.rotations[:]
         result.n_subpoints[:, start_i:end_i] = new_agents.n_subpoints[:]
-        if len(new_agents.subpoints.shape) > 2:
+        if ragged_subpoints:
+            new_subpoints, new_offsets = new_agents.get_ragged_subpoints()
+            result.subpoint_offsets[:, start_i:end_i] = (
+                new_offsets + result.subpoints.shape[0]
+            )
+            result.subpoints = np.concatenate([result.subpoints, new_subpoints]).astype(
+                result.dtype, copy=False
+            )
+        elif len(new_agents.subpoints.shape) > 2:
             result.subpoints[:, start_i:end_i] = new_agents.subpoints[:]
         # generate new unique IDs and type IDs so they don't overlap
-        used_uids = list(np.unique(self.agent_data.unique_ids).astype(int))
         new_uids = {}
         for time_index in range(new_dimensions.total_steps):
-            new_agent_index = int(self.agent_data.n_agents[time_index])
+            new_agent_index = int(current_n_agents[time_index])
             n_a = int(new_agents.n_agents[time_index])
             for agent_index in range(n_a):
                 raw_uid = int(new_agents.unique_ids[time_index][agent_index])
@@ -130,13 +146,24 @@ class TrajectoryData:
                     new_uids[raw_uid] = uid
                     used_uids.append(uid)
                 result.unique_ids[time_index][new_agent_index] = new_uids[raw_uid]
-                result.types[time_index].append(
-                    new_agents.types[time_index][agent_index]
-                )
                 new_agent_index += 1
+        result.types.extend(new_agents.types, new_agents.n_agents)
         result.display_data.update(new_agents.display_data)
         self.agent_data = result
 
+    def get_shallow_copy(self) -> TrajectoryData:
+        """
+        Create a copy of this object that shares the AgentData arrays,
+        with copies of everything else
+        """
+        return type(self)(
+            meta_data=copy.deepcopy(self.meta_data),
+            agent_data=self.agent_data.get_shallow_copy(),
+            time_units=copy.copy(self.time_units),
+            spatial_units=copy.copy(self.spatial_units),
+            plots=copy.deepcopy(self.plots),
+        )
+
     def __deepcopy__(self, memo):
         result = type(self)(
             meta_data=copy.deepcopy(self.meta_data, memo),
@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterator, List, Union
+
+import numpy as np
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+
+class TypeNameData:
+    codes: np.ndarray
+    names: List[str]
+    n_types: np.ndarray
+
+    def __init__(
+        self,
+        codes: np.ndarray,
+        names: List[str],
+        n_types: np.ndarray = None,
+    ):
+        """
+        This object contains the type name for each agent at each timestep,
+        stored as an integer code for each agent and a table of names.
+        It can also be used like a list of lists of type names
+        (shape = [timesteps, agents]) for compatibility
+
+        Parameters
+        ----------
+        codes : np.ndarray (shape = [timesteps, agents])
+            A numpy ndarray containing the index in names
+            of the type name for each agent at each timestep,
+            or -1 where there is no agent. An int32 ndarray
+            is used without copying it
+        names : List[str]
+            The type name for each code
+        n_types : np.ndarray (shape = [timesteps]) (optional)
+            The number of type names at each timestep
+            Default: the number of codes before the last -1 at each timestep
+        """
+        self.codes = np.asarray(codes, dtype=np.int32)
+        if len(self.codes.shape) < 2:
+            self.codes = self.codes.reshape((self.codes.shape[0], 0))
+        self.names = list(names)
+        self.n_types = (
+            np.array(n_types, dtype=int)
+            if n_types is not None
+            else TypeNameData._get_n_types(self.codes)
+        )
+        self._codes_by_name = {}
+
+    @staticmethod
+    def _get_n_types(codes: np.ndarray) -> np.ndarray:
+        """
+        Get the number of codes up to and including
+        the last valid code at each timestep
+        """
+        if codes.shape[1] < 1:
+            return np.zeros(codes.shape[0], dtype=int)
+        valid = codes >= 0
+        return np.where(
+            np.any(valid, axis=1),
+            codes.shape[1] - np.argmax(valid[:, ::-1], axis=1),
+            0,
+        )
+
+    @classmethod
+    def from_dimensions(cls, total_steps: int, max_agents: int = 0):
+        """
+        Create TypeNameData with no type names
+        for the given number of timesteps
+        """
+        return cls(
+            codes=-1 * np.ones((total_steps, max_agents), dtype=np.int32),
+            names=[],
+            n_types=np.zeros(total_steps, dtype=int),
+        )
+
+    @classmethod
+    def from_type_names(
+        cls, type_names: List[List[str]], max_agents: int = 0
+    ) -> TypeNameData:
+        """
+        Create TypeNameData from a list of lists of type names
+        (shape = [timesteps, agents])
+        """
+        if isinstance(type_names, TypeNameData):
+            return type_names
+        total_steps = len(type_names)
+        n_types = np.array([len(frame) for frame in type_names], dtype=int)
+        if n_types.size > 0:
+            max_agents = max(max_agents, int(np.amax(n_types)))
+        result = cls.from_dimensions(total_steps, max_agents)
+        result.n_types = n_types
+        for time_index in range(total_steps):
+            result.codes[time_index, : n_types[time_index]] = [
+                result.get_code(type_name) for type_name in type_names[time_index]
+            ]
+        return result
+
+    def get_code(self, type_name: str) -> int:
+        """
+        Get the code for a type name, adding it to the names if needed
+        """
+        if len(self._codes_by_name) != len(self.names):
+            self._codes_by_name = {name: code for code, name in enumerate(self.names)}
+        if type_name not in self._codes_by_name:
+            self._codes_by_name[type_name] = len(self.names)
+            self.names.append(type_name)
+        return self._codes_by_name[type_name]
+
+    def get_name(self, time_index: int, agent_index: int) -> str:
+        """
+        Get the type name for the agent at the given time and agent indices
+        """
+        if agent_index >= self.n_types[time_index]:
+            raise IndexError(
+                f"No type name for agent {agent_index} at time index {time_index}"
+            )
+        return self.names[self.codes[time_index, agent_index]]
+
+    def get_names_array(self) -> np.ndarray:
+        """
+        Get the names as an array of objects, with a None at the end
+        so that it can be indexed with codes that are -1
+        """
+        return np.array(self.names + [None], dtype=object)
+
+    def get_used_names(self) -> List[str]:
+        """
+        Get the type names that are used by any agent
+        """
+        codes = np.unique(self.codes[self.codes >= 0])
+        return [self.names[code] for code in codes]
+
+    def get_subset(
+        self,
+        time_indices: np.ndarray,
+        agent_indices: np.ndarray,
+        new_time_indices: np.ndarray,
+        new_agent_indices: np.ndarray,
+        total_steps: int,
+        max_agents: int,
+    ) -> TypeNameData:
+        """
+        Create TypeNameData with the given dimensions containing the type names
+        for the agents at the given time and agent indices,
+        moved to the new time and agent indices
+        """
+        codes = -1 * np.ones((total_steps, max_agents), dtype=np.int32)
+        codes[new_time_indices, new_agent_indices] = self.codes[
+            time_indices, agent_indices
+        ]
+        return TypeNameData(codes=codes, names=self.names)
+
+    def resize(self, total_steps: int, max_agents: int, n_types: np.ndarray = None):
+        """
+        Resize the codes to the given dimensions,
+        adding -1s for new agents and timesteps.
+        If n_types is provided, keep at most that many
+        type names at each of the current timesteps
+        """
+        codes = -1 * np.ones((total_steps, max_agents), dtype=np.int32)
+        n_steps = min(total_steps, self.codes.shape[0])
+        n_agents = min(max_agents, self.codes.shape[1])
+        codes[:n_steps, :n_agents] = self.codes[:n_steps, :n_agents]
+        max_n_types = np.minimum(self.n_types[:n_steps], max_agents)
+        if n_types is not None:
+            max_n_types = np.minimum(max_n_types, n_types[:n_steps].astype(int))
+            codes[:n_steps][np.arange(max_agents) >= max_n_types[:, np.newaxis]] = -1
+        n_types = np.zeros(total_steps, dtype=int)
+        n_types[:n_steps] = max_n_types
+        self.codes = codes
+        self.n_types = n_types
+
+    def _set_frame(self, time_index: int, type_names: List[str]):
+        """
+        Replace the type names at the given time index
+        """
+        codes = [self.get_code(type_name) for type_name in type_names]
+        if len(codes) > self.codes.shape[1]:
+            self.resize(self.codes.shape[0], len(codes))
+        self.codes[time_index, :] = -1
+        self.codes[time_index, : len(codes)] = codes
+        self.n_types[time_index] = len(codes)
+
+    def _append(self, time_index: int, type_name: str):
+        """
+        Add a type name after the last one at the given time index
+        """
+        agent_index = int(self.n_types[time_index])
+        if agent_index >= self.codes.shape[1]:
+            self.resize(self.codes.shape[0], max(2 * self.codes.shape[1], 1))
+        self.codes[time_index, agent_index] = self.get_code(type_name)
+        self.n_types[time_index] = agent_index + 1
+
+    def extend(self, other: TypeNameData, n_types: np.ndarray = None):
+        """
+        Add the type names from another TypeNameData
+        after the last ones at each timestep.
+        If n_types is provided, only add that many
+        of the other's type names at each timestep
+        """
+        n_steps = min(len(self), len(other))
+        n_new = (
+            np.minimum(n_types[:n_steps].astype(int), other.n_types[:n_steps])
+            if n_types is not None
+            else other.n_types[:n_steps]
+        )
+        if n_new.size < 1 or np.amax(n_new) < 1:
+            return
+        for type_name in other.names:
+            self.get_code(type_name)
+        other_codes = other._codes_in(self)
+        max_agents = int(np.amax(self.n_types[:n_steps] + n_new))
+        if max_agents > self.codes.shape[1]:
+            self.resize(len(self), max_agents)
+        time_indices, agent_indices = np.nonzero(
+            np.arange(int(np.amax(n_new))) < n_new[:, np.newaxis]
+        )
+        self.codes[
+            time_indices, self.n_types[time_indices] + agent_indices
+        ] = other_codes[time_indices, agent_indices]
+        self.n_types[:n_steps] += n_new
+
+    def to_list(self) -> List[List[str]]:
+        """
+        Get the type names as a list of lists (shape = [timesteps, agents])
+        """
+        names = self.get_names_array()
+        return [
+            names[self.codes[time_index, : self.n_types[time_index]]].tolist()
+            for time_index in range(self.codes.shape[0])
+        ]
+
+    def _codes_in(self, other: TypeNameData) -> np.ndarray:
+        """
+        Get this object's codes converted to codes in another's names,
+        names that the other doesn't have are -2
+        """
+        other_codes = {name: code for code, name in enumerate(other.names)}
+        conversion = np.array(
+            [other_codes.get(name, -2) for name in self.names] + [-1], dtype=int
+        )
+        return conversion[self.codes]
+
+    def __len__(self) -> int:
+        return self.codes.shape[0]
+
+    def __getitem__(
+        self, time_index: Union[int, slice, np.ndarray]
+    ) -> Union[FrameTypeNames, TypeNameData]:
+        if isinstance(time_index, (slice, np.ndarray)):
+            # the codes at the selected timesteps,
+            # a view if time_index is a slice
+            return TypeNameData(
+                codes=self.codes[time_index],
+                names=self.names,
+                n_types=self.n_types[time_index],
+            )
+        if time_index < 0:
+            time_index += len(self)
+        if time_index < 0 or time_index >= len(self):
+            raise IndexError(f"Time index {time_index} out of range")
+        return FrameTypeNames(self, time_index)
+
+    def __setitem__(self, time_index: int, type_names: List[str]):
+        if time_index < 0:
+            time_index += len(self)
+        self._set_frame(time_index, list(type_names))
+
+    def __iter__(self) -> Iterator[FrameTypeNames]:
+        for time_index in range(len(self)):
+            yield FrameTypeNames(self, time_index)
+
+    def __deepcopy__(self, memo):
+        return type(self)(
+            codes=np.copy(self.codes),
+            names=list(self.names),
+            n_types=np.copy(self.n_types),
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TypeNameData):
+            return self.to_list() == other
+        if len(self) != len(other) or not np.array_equal(self.n_types, other.n_types):
+            return False
+        max_agents = int(np.amax(self.n_types)) if self.n_types.size > 0 else 0
+        return np.array_equal(
+            self._codes_in(other)[:, :max_agents], other.codes[:, :max_agents]
+        )
+
+    def __repr__(self) -> str:
+        return repr(self.to_list())
+
+
+class FrameTypeNames:
+    def __init__(self, type_name_data: TypeNameData, time_index: int):
+        """
+        A view of the type names at one timestep of TypeNameData,
+        which can be used like a list of type names
+        """
+        self._data = type_name_data
+        self._time_index = time_index
+
+    def _check_index(self, agent_index: int) -> int:
+        n_types = len(self)
+        if agent_index < 0:
+            agent_index += n_types
+        if agent_index < 0 or agent_index >= n_types:
+            raise IndexError(f"Agent index {agent_index} out of range")
+        return agent_index
+
+    def append(self, type_name: str):
+        self._data._append(self._time_index, type_name)
+
+    def extend(self, type_names: List[str]):
+        for type_name in type_names:
+            self.append(type_name)
+
+    def __iadd__(self, type_names: List[str]) -> FrameTypeNames:
+        self.extend(type_names)
+        return self
+
+    def __len__(self) -> int:
+        return int(self._data.n_types[self._time_index])
+
+    def __getitem__(self, agent_index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(agent_index, slice):
+            return list(self)[agent_index]
+        return self._data.get_name(self._time_index, self._check_index(agent_index))
+
+    def __setitem__(self, agent_index: int, type_name: str):
+        self._data.codes[
+            self._time_index, self._check_index(agent_index)
+        ] = self._data.get_code(type_name)
+
+    def __iter__(self) -> Iterator[str]:
+        names = self._data.names
+        for code in self._data.codes[self._time_index, : len(self)].tolist():
+            yield names[code]
+
+    def __eq__(self, other: Any) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -33,7 +33,9 @@ class FileConverter(TrajectoryConverter):
             display_data = {}
         if input_file._is_binary():
             print("Reading Simularium binary -------------")
-            buffer_data = SimulariumBinaryReader.load_binary(input_file)
+            buffer_data = SimulariumBinaryReader._load_binary(
+                input_file, spatial_data_as_lists=False
+            )
         else:
             print("Reading Simularium JSON -------------")
             buffer_data = json.loads(input_file.get_contents())
@@ -10,3 +10,6 @@ from .multiply_time_filter import MultiplyTimeFilter  # noqa: F401
 from .add_agents_filter import AddAgentsFilter  # noqa: F401
 from .multiply_space_filter import MultiplySpaceFilter  # noqa: F401
 from .translate_filter import TranslateFilter  # noqa: F401
+from .crop_filter import CropFilter  # noqa: F401
+from .level_of_detail_filter import LevelOfDetailFilter  # noqa: F401
+from .time_window_filter import TimeWindowFilter  # noqa: F401
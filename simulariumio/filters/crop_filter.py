@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import List
+import logging
+
+import numpy as np
+
+from .filter import Filter
+from ..data_objects import TrajectoryData
+from ..constants import DISPLAY_TYPE, VALUES_PER_3D_POINT
+from ..exceptions import DataError
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+
+class CropFilter(Filter):
+    center: np.ndarray
+    size: np.ndarray
+    radius: float
+
+    def __init__(
+        self,
+        center: np.ndarray = np.zeros(VALUES_PER_3D_POINT),
+        size: np.ndarray = None,
+        radius: float = None,
+    ):
+        """
+        This filter keeps only the agents inside a box or a sphere
+        in each frame of simularium data. Fibers are kept
+        if any of their points are inside
+
+        Parameters
+        ----------
+        center : np.ndarray (shape = [3]) (optional)
+            XYZ center of the region to keep
+            Default: np.zeros(3)
+        size : np.ndarray (shape = [3]) (optional)
+            XYZ size of a box to keep, provide either size or radius
+            Default: None
+        radius : float (optional)
+            radius of a sphere to keep, provide either size or radius
+            Default: None
+        """
+        if (size is None) == (radius is None):
+            raise DataError("CropFilter requires either a box size or a radius")
+        self.center = np.array(center, dtype=float)
+        self.size = np.array(size, dtype=float) if size is not None else None
+        self.radius = float(radius) if radius is not None else None
+
+    def _is_inside(self, points: np.ndarray) -> np.ndarray:
+        """
+        Check whether each XYZ point in an array (shape = [..., 3])
+        is inside the region
+        """
+        offsets = points - self.center
+        if self.size is not None:
+            return np.all(np.abs(offsets) <= 0.5 * self.size, axis=-1)
+        return np.sum(offsets * offsets, axis=-1) <= self.radius * self.radius
+
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Filter out the agents outside the region in each frame
+        """
+        agent_data = data.agent_data
+        agent_mask = agent_data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        codes = agent_data.types.codes[:total_steps, :max_agents]
+        n_subpoints = agent_data.n_subpoints[:total_steps, :max_agents]
+        has_subpoints = agent_mask & (n_subpoints > 0)
+        is_fiber = np.array(
+            [
+                display_type == DISPLAY_TYPE.FIBER
+                for display_type in agent_data.display_types_for_codes(has_subpoints)
+            ]
+            + [False]
+        )
+        # keep fibers by their points, other agents by their position
+        fiber_mask = has_subpoints & is_fiber[codes]
+        keep = (
+            agent_mask
+            & ~fiber_mask
+            & self._is_inside(agent_data.positions[:total_steps, :max_agents])
+        )
+        time_indices, agent_indices = np.nonzero(fiber_mask)
+        if time_indices.size > 0:
+            n_points = (
+                n_subpoints[time_indices, agent_indices] // VALUES_PER_3D_POINT
+            ).astype(int)
+            points = agent_data.get_subpoints_for_agents(
+                time_indices, agent_indices
+            ).reshape((-1, VALUES_PER_3D_POINT))
+            n_inside = np.bincount(
+                np.repeat(np.arange(n_points.size), n_points),
+                weights=self._is_inside(points),
+                minlength=n_points.size,
+            )
+            keep[time_indices, agent_indices] = n_inside > 0
+        data.agent_data = agent_data.get_subset_of_agents(*np.nonzero(keep))
+        return data
+
+    def apply(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Keep only the agents inside the region
+        """
+        region = (
+            f"box of size {self.size}"
+            if self.size is not None
+            else f"sphere of radius {self.radius}"
+        )
+        print(f"Filtering: crop to {region} at {self.center} -------------")
+        data = self.apply_to_frames(data)
+        dimensions = data.agent_data.get_dimensions()
+        print(
+            f"filtered dims = {dimensions.total_steps} timesteps X "
+            f"{dimensions.max_agents} agents X {dimensions.max_subpoints} subpoints"
+        )
+        return data
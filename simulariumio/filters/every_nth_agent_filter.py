@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from simulariumio.data_objects.agent_data import AgentData
-from typing import Dict
+from typing import Dict, List
 import logging
 
 import numpy as np
@@ -38,63 +37,60 @@ class EveryNthAgentFilter(Filter):
         self.n_per_type = n_per_type
         self.default_n = default_n
 
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Filter out all but every nth agent of each type in each frame
+        """
+        agent_data = data.agent_data
+        agent_mask = agent_data.get_agent_mask()
+        time_indices, agent_indices = np.nonzero(agent_mask)
+        # get N for each type code, the last is for codes that are -1
+        type_codes = agent_data.types.codes[time_indices, agent_indices]
+        n_codes = len(agent_data.types.names) + 1
+        inc_for_code = np.array(
+            [
+                self.n_per_type.get(str(type_name), self.default_n)
+                for type_name in agent_data.types.names
+            ]
+            + [self.default_n],
+            dtype=int,
+        )
+        # count the agents of each type before each agent in its frame,
+        # agents are sorted by frame then type, stable to keep agent order
+        group_keys = time_indices * n_codes + (type_codes % n_codes)
+        order = np.argsort(group_keys, kind="stable")
+        sorted_keys = group_keys[order]
+        is_group_start = np.ones(sorted_keys.shape, dtype=bool)
+        is_group_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        group_starts = np.maximum.accumulate(
+            np.where(is_group_start, np.arange(sorted_keys.size), 0)
+        )
+        n_found = np.zeros_like(order)
+        n_found[order] = np.arange(sorted_keys.size) - group_starts
+        # keep every nth agent of each type
+        inc = inc_for_code[type_codes]
+        keep = (inc >= 1) & (n_found % np.maximum(inc, 1) == 0)
+        data.agent_data = agent_data.get_subset_of_agents(
+            time_indices[keep], agent_indices[keep]
+        )
+        return data
+
     def apply(self, data: TrajectoryData) -> TrajectoryData:
         """
         Reduce the number of agents in each frame of the simularium
         data by filtering out all but every nth agent
         """
         print("Filtering: every Nth agent -------------")
-        # get filtered data
-        start_dimensions = data.agent_data.get_dimensions()
-        result = AgentData.from_dimensions(start_dimensions)
-        result.times = data.agent_data.times
-        result.draw_fiber_points = data.agent_data.draw_fiber_points
-        result.display_data = data.agent_data.display_data
-        for time_index in range(start_dimensions.total_steps):
-            new_agent_index = 0
-            n_found = {}
-            n_a = int(data.agent_data.n_agents[time_index])
-            for agent_index in range(n_a):
-                type_name = str(data.agent_data.types[time_index][agent_index])
-                if type_name not in n_found:
-                    n_found[type_name] = -1
-                n_found[type_name] += 1
-                if type_name in self.n_per_type:
-                    inc = self.n_per_type[type_name]
-                else:
-                    inc = self.default_n
-                if inc < 1 or n_found[type_name] % inc != 0:
-                    continue
-                result.viz_types[time_index][
-                    new_agent_index
-                ] = data.agent_data.viz_types[time_index][agent_index]
-                result.unique_ids[time_index][
-                    new_agent_index
-                ] = data.agent_data.unique_ids[time_index][agent_index]
-                result.types[time_index].append(
-                    data.agent_data.types[time_index][agent_index]
-                )
-                result.positions[time_index][
-                    new_agent_index
-                ] = data.agent_data.positions[time_index][agent_index]
-                result.radii[time_index][new_agent_index] = data.agent_data.radii[
-                    time_index
-                ][agent_index]
-                result.rotations[time_index][
-                    new_agent_index
-                ] = data.agent_data.rotations[time_index][agent_index]
-                result.n_subpoints[time_index][
-                    new_agent_index
-                ] = data.agent_data.n_subpoints[time_index][agent_index]
-                result.subpoints[time_index][new_agent_index][
-                    : np.shape(data.agent_data.subpoints[time_index][agent_index])[0]
-                ] = data.agent_data.subpoints[time_index][agent_index]
-                new_agent_index += 1
-            result.n_agents[time_index] = new_agent_index
-        data.agent_data = result
+        data = self.apply_to_frames(data)
+        dimensions = data.agent_data.get_dimensions()
         print(
-            f"filtered dims = {start_dimensions.total_steps} timesteps X "
-            f"{int(np.amax(result.n_agents))} agents X "
-            f"{int(np.amax(data.agent_data.n_subpoints))} subpoints"
+            f"filtered dims = {dimensions.total_steps} timesteps X "
+            f"{dimensions.max_agents} agents X {dimensions.max_subpoints} subpoints"
         )
         return data
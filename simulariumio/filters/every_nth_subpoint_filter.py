@@ -1,14 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import math
-from typing import Dict
+from typing import Dict, List
 import logging
 
 import numpy as np
 
 from .filter import Filter
-from ..data_objects import TrajectoryData
+from ..data_objects import TrajectoryData, AgentData
+from ..exceptions import DataError
+from ..constants import SUBPOINT_VALUES_PER_ITEM
 
 ###############################################################################
 
@@ -39,42 +40,101 @@ class EveryNthSubpointFilter(Filter):
         self.n_per_type = n_per_type
         self.default_n = default_n
 
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Filter out all but every nth subpoint for each agent in each frame
+        """
+        agent_data = data.agent_data
+        agent_mask = agent_data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        n_subpoints = agent_data.n_subpoints[:total_steps, :max_agents]
+        has_subpoints = agent_mask & (n_subpoints > 0)
+        time_indices, agent_indices = np.nonzero(has_subpoints)
+        # get the values per item and the increment for each type code
+        values_per_item = np.array(
+            [
+                SUBPOINT_VALUES_PER_ITEM(display_type)
+                for display_type in agent_data.display_types_for_codes(has_subpoints)
+            ]
+            + [1],
+            dtype=int,
+        )
+        inc_for_code = np.array(
+            [
+                self.n_per_type.get(type_name, self.default_n)
+                for type_name in agent_data.types.names
+            ]
+            + [self.default_n],
+            dtype=int,
+        )
+        codes = agent_data.types.codes[time_indices, agent_indices]
+        agent_values_per_item = values_per_item[codes]
+        inc = inc_for_code[codes]
+        if np.any(inc < 1):
+            raise DataError("N < 1: subpoints can't be filtered")
+        # keep every nth item for each agent
+        agent_n_subpoints = n_subpoints[time_indices, agent_indices].astype(int)
+        n_items = np.round(agent_n_subpoints / agent_values_per_item).astype(int)
+        new_n_items = -(-n_items // inc)
+        new_agent_n_subpoints = agent_values_per_item * new_n_items
+        new_n_subpoints = np.zeros((total_steps, max_agents))
+        new_n_subpoints[time_indices, agent_indices] = new_agent_n_subpoints
+        # get the index in each agent's subpoints of each kept value
+        new_value_index = AgentData._ragged_indices(
+            np.zeros_like(new_agent_n_subpoints), new_agent_n_subpoints
+        )
+        value_agents = np.repeat(np.arange(time_indices.size), new_agent_n_subpoints)
+        value_values_per_item = agent_values_per_item[value_agents]
+        value_index = (
+            new_value_index
+            // value_values_per_item
+            * inc[value_agents]
+            * value_values_per_item
+            + new_value_index % value_values_per_item
+        )
+        # gather the kept values for all the agents at once
+        agent_starts = np.zeros_like(agent_n_subpoints)
+        np.cumsum(agent_n_subpoints[:-1], out=agent_starts[1:])
+        subpoint_indices = agent_data.get_subpoint_indices_for_agents(
+            time_indices, agent_indices
+        )
+        kept = agent_starts[value_agents] + value_index
+        new_values = agent_data.subpoints[
+            tuple(indices[kept] for indices in subpoint_indices)
+        ]
+        # the filtered subpoints are sized for the kept values
+        new_max_subpoints = (
+            int(np.amax(new_agent_n_subpoints)) if new_agent_n_subpoints.size > 0 else 0
+        )
+        agent_data.n_subpoints = new_n_subpoints
+        if not agent_data.has_ragged_subpoints():
+            agent_data.subpoints = np.zeros(
+                (total_steps, max_agents, new_max_subpoints), dtype=agent_data.dtype
+            )
+        agent_data._set_subpoints_for_agents(
+            time_indices,
+            agent_indices,
+            new_agent_n_subpoints,
+            new_values,
+        )
+        return data
+
     def apply(self, data: TrajectoryData) -> TrajectoryData:
         """
         Reduce the number of subpoints in each frame of the simularium
         data by filtering out all but every nth subpoint
         """
         print("Filtering: every Nth subpoint -------------")
-        # get dimensions
-        total_steps = data.agent_data.times.size
-        max_agents = int(np.amax(data.agent_data.n_agents))
-        max_subpoints = int(np.amax(data.agent_data.n_subpoints))
-        # get filtered data
-        new_n_subpoints = np.zeros((total_steps, max_agents))
-        new_subpoints = np.zeros((total_steps, max_agents, max_subpoints))
-        for time_index in range(total_steps):
-            for agent_index in range(int(data.agent_data.n_agents[time_index])):
-                sp_items = self.get_items_from_subpoints(
-                    data.agent_data, time_index, agent_index
-                )
-                if sp_items is None:
-                    continue
-                # get the increment to use for this type
-                type_name = data.agent_data.types[time_index][agent_index]
-                if type_name in self.n_per_type:
-                    inc = self.n_per_type[type_name]
-                else:
-                    inc = self.default_n
-                new_n_items = math.ceil(sp_items.shape[0] / float(inc))
-                new_n_sp = sp_items.shape[1] * new_n_items
-                new_n_subpoints[time_index][agent_index] = new_n_sp
-                new_subpoints[time_index][agent_index][:new_n_sp] = sp_items[
-                    ::inc
-                ].flatten()
-        data.agent_data.n_subpoints = new_n_subpoints
-        data.agent_data.subpoints = new_subpoints
+        data = self.apply_to_frames(data)
+        dimensions = data.agent_data.get_dimensions()
         print(
-            f"filtered dims = {total_steps} timesteps X "
-            f"{max_agents} agents X {int(np.amax(new_n_subpoints))} subpoints"
+            f"filtered dims = {dimensions.total_steps} timesteps X "
+            f"{dimensions.max_agents} agents X {dimensions.max_subpoints} subpoints"
         )
         return data
@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
 import logging
-import math
-from simulariumio.data_objects.dimension_data import DimensionData
+from typing import List
 from simulariumio.data_objects.agent_data import AgentData
 
 import numpy as np
@@ -20,10 +20,12 @@ log = logging.getLogger(__name__)
 
 class EveryNthTimestepFilter(Filter):
     n: int
+    contiguous: bool
 
     def __init__(
         self,
         n: int,
+        contiguous: bool = False,
     ):
         """
         This filter reduces the number
@@ -33,66 +35,79 @@ class EveryNthTimestepFilter(Filter):
         ----------
         n : int
             keep every nth time step, filter out all the others
+        contiguous : bool (optional)
+            Copy the kept timesteps into new contiguous arrays?
+            Otherwise the filtered data is strided views
+            of the input arrays, which doesn't copy any agent data
+            Default: False
         """
         self.n = n
+        self.contiguous = contiguous
 
-    def apply(self, data: TrajectoryData) -> TrajectoryData:
+    def get_mutated_agent_data_fields(self) -> List[str]:
         """
-        Reduce the number of timesteps in each frame of the simularium
-        data by filtering out all but every nth timestep
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def get_frame_indices(self, data: TrajectoryData) -> np.ndarray:
+        """
+        Keep every nth frame
+        """
+        return np.arange(0, data.agent_data.times.size, self.n)
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Filter out all but every nth timestep
         """
-        print(f"Filtering: every {self.n}th timestep -------------")
         if self.n < 2:
             raise Exception("N < 2: no timesteps will be filtered")
-        # get filtered dimensions
-        new_dimensions = DimensionData(
-            total_steps=int(math.ceil(data.agent_data.times.size / float(self.n))),
-            max_agents=int(np.amax(data.agent_data.n_agents)),
-            max_subpoints=int(np.amax(data.agent_data.n_subpoints)),
-        )
-        result = AgentData.from_dimensions(new_dimensions)
-        # get filtered data
-        new_time_index = 0
-        for time_index in range(data.agent_data.times.size):
-            if time_index % self.n != 0:
-                continue
-            result.times[new_time_index] = data.agent_data.times[time_index]
-            n_a = int(data.agent_data.n_agents[time_index])
-            result.n_agents[new_time_index] = n_a
-            for agent_index in range(n_a):
-                result.viz_types[new_time_index][
-                    agent_index
-                ] = data.agent_data.viz_types[time_index][agent_index]
-                result.unique_ids[new_time_index][
-                    agent_index
-                ] = data.agent_data.unique_ids[time_index][agent_index]
-                result.types[new_time_index].append(
-                    data.agent_data.types[time_index][agent_index]
+        agent_data = data.agent_data
+        # get every nth timestep of each field, ragged subpoints are
+        # a flat array with offsets for each agent at each timestep
+        result = agent_data.get_frames(slice(0, agent_data.times.size, self.n))
+        if self.contiguous:
+            for field_name in AgentData.array_field_names():
+                if field_name == "subpoints" and result.has_ragged_subpoints():
+                    continue
+                value = getattr(result, field_name)
+                if value is None:
+                    continue
+                setattr(
+                    result,
+                    field_name,
+                    np.ascontiguousarray(value)
+                    if isinstance(value, np.ndarray)
+                    else copy.deepcopy(value),
                 )
-                result.positions[new_time_index][
-                    agent_index
-                ] = data.agent_data.positions[time_index][agent_index]
-                result.radii[new_time_index][agent_index] = data.agent_data.radii[
-                    time_index
-                ][agent_index]
-                result.rotations[new_time_index][
-                    agent_index
-                ] = data.agent_data.rotations[time_index][agent_index]
-                result.n_subpoints[new_time_index][
-                    agent_index
-                ] = data.agent_data.n_subpoints[time_index][agent_index]
-                result.subpoints[new_time_index][agent_index][
-                    : np.shape(data.agent_data.subpoints[time_index][agent_index])[0]
-                ] = data.agent_data.subpoints[time_index][agent_index]
-            new_time_index += 1
-        unique_types = set([tn for frame in result.types for tn in frame])
-        for type_name in unique_types:
-            if type_name in data.agent_data.display_data:
-                result.display_data[type_name] = data.agent_data.display_data[type_name]
+        if self.contiguous and result.has_ragged_subpoints():
+            # only keep the subpoints for the kept timesteps
+            time_indices, agent_indices = np.nonzero(result.n_subpoints > 0)
+            result._set_subpoints_for_agents(
+                time_indices,
+                agent_indices,
+                result.n_subpoints[time_indices, agent_indices],
+                result.get_subpoints_for_agents(time_indices, agent_indices),
+            )
+        result.display_data = {}
+        for type_name in result.types.get_used_names():
+            if type_name in agent_data.display_data:
+                result.display_data[type_name] = agent_data.display_data[type_name]
         data.agent_data = result
+        return data
+
+    def apply(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Reduce the number of timesteps in each frame of the simularium
+        data by filtering out all but every nth timestep
+        """
+        print(f"Filtering: every {self.n}th timestep -------------")
+        data = self.apply_to_frames(data)
+        n_agents = data.agent_data.n_agents
         print(
-            f"filtered dims = {new_dimensions.total_steps} timesteps X "
-            f"{new_dimensions.max_agents} agents X "
-            f"{new_dimensions.max_subpoints} subpoints"
+            f"filtered dims = {data.agent_data.times.size} timesteps X "
+            f"{int(np.amax(n_agents)) if n_agents.size > 0 else 0} agents X "
+            f"{int(np.amax(data.agent_data.n_subpoints)) if n_agents.size > 0 else 0} "
+            "subpoints"
         )
         return data
@@ -3,6 +3,7 @@
 
 import logging
 from abc import ABC, abstractmethod
+from typing import List
 
 import numpy as np
 
@@ -21,6 +22,36 @@ class Filter(ABC):
     def apply(self, data: TrajectoryData) -> TrajectoryData:
         pass
 
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Apply the filter without printing progress.
+        Filters that override this change each frame without depending
+        on the other frames, so LazyTrajectoryData can apply them
+        one frame at a time while the data is written.
+        Default: apply
+        """
+        return self.apply(data)
+
+    def get_frame_indices(self, data: TrajectoryData) -> np.ndarray:
+        """
+        For filters that select frames, get the indices of the frames
+        in the data that this filter keeps. LazyTrajectoryData uses these
+        to select the frames to write instead of applying the filter
+        to each frame.
+        Default: None, the filter doesn't select frames
+        """
+        return None
+
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        Get the names of the AgentData fields that this filter
+        changes in place, which are copied before the filter is applied
+        by TrajectoryConverter.filter_data. Fields that the filter
+        replaces with new arrays don't need to be copied.
+        Default: all the fields, override to avoid copying
+        """
+        return AgentData.array_field_names()
+
     @staticmethod
     def get_items_from_subpoints(
         agent_data: AgentData, time_index: int, agent_index: int
@@ -34,6 +65,6 @@ class Filter(ABC):
         display_type = agent_data.display_type_for_agent(time_index, agent_index)
         values_per_item = SUBPOINT_VALUES_PER_ITEM(display_type)
         n_items = round(n_sp / values_per_item)
-        items = agent_data.subpoints[time_index][agent_index][:n_sp]
+        items = agent_data.get_subpoints(time_index, agent_index)
         items = items.reshape(n_items, values_per_item)
         return items
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from typing import List
+import logging
+
+import numpy as np
+
+from .filter import Filter
+from ..data_objects import AgentData, TrajectoryData
+from ..constants import DISPLAY_TYPE, VALUES_PER_3D_POINT
+from ..exceptions import DataError
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+
+class LevelOfDetailFilter(Filter):
+    distances: np.ndarray
+    keep_ratios: np.ndarray
+    focus: np.ndarray
+    decimate_fiber_points: bool
+
+    def __init__(
+        self,
+        distances: List[float],
+        keep_ratios: List[float],
+        focus: np.ndarray = None,
+        decimate_fiber_points: bool = True,
+    ):
+        """
+        This filter reduces the number of agents and fiber points
+        in each frame of simularium data depending on their distance
+        from a focus point, keeping full detail near the focus
+        and fewer agents farther away. Whether an agent is kept depends
+        only on its unique ID and distance, so agents that stay
+        in the same distance band are kept or filtered out in every frame
+
+        Parameters
+        ----------
+        distances : List[float]
+            The increasing distances from the focus point
+            where each distance band ends
+        keep_ratios : List[float]
+            The fraction of agents to keep in each distance band,
+            with one more value than distances for agents
+            beyond the last distance. Fibers are kept
+            depending on their nearest point
+        focus : np.ndarray (shape = [3]) (optional)
+            XYZ position to measure distances from
+            Default: the look at position of the camera defaults
+        decimate_fiber_points : bool (optional)
+            Also keep only about keep_ratio of the points of each fiber
+            in each distance band? Points are kept at even intervals,
+            and the end points of each fiber are always kept
+            Default: True
+        """
+        self.distances = np.array(distances, dtype=float)
+        self.keep_ratios = np.array(keep_ratios, dtype=float)
+        if self.keep_ratios.shape[0] != self.distances.shape[0] + 1:
+            raise DataError(
+                "LevelOfDetailFilter requires a keep ratio for each distance band, "
+                "one more than the number of distances"
+            )
+        if np.any(np.diff(self.distances) < 0):
+            raise DataError("LevelOfDetailFilter distances must be increasing")
+        if np.any((self.keep_ratios < 0) | (self.keep_ratios > 1)):
+            raise DataError("LevelOfDetailFilter keep ratios must be from 0 to 1")
+        self.focus = np.array(focus, dtype=float) if focus is not None else None
+        self.decimate_fiber_points = decimate_fiber_points
+
+    @staticmethod
+    def _hash_unique_ids(unique_ids: np.ndarray) -> np.ndarray:
+        """
+        Get a number from 0 to 1 for each unique ID,
+        spread evenly for consecutive IDs (splitmix64)
+        """
+        x = unique_ids.astype(np.int64).astype(np.uint64)
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        x = x ^ (x >> np.uint64(31))
+        return (x >> np.uint64(11)).astype(float) / float(2**53)
+
+    def _keep_ratios_for_distances(self, distances: np.ndarray) -> np.ndarray:
+        """
+        Get the keep ratio for the distance band of each distance
+        """
+        return self.keep_ratios[np.digitize(distances, self.distances)]
+
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Filter out agents and fiber points depending on
+        their distance from the focus point in each frame
+        """
+        focus = (
+            self.focus
+            if self.focus is not None
+            else np.array(data.meta_data.camera_defaults.look_at_position)
+        )
+        agent_data = data.agent_data
+        agent_mask = agent_data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        codes = agent_data.types.codes[:total_steps, :max_agents]
+        n_subpoints = agent_data.n_subpoints[:total_steps, :max_agents]
+        has_subpoints = agent_mask & (n_subpoints > 0)
+        is_fiber = np.array(
+            [
+                display_type == DISPLAY_TYPE.FIBER
+                for display_type in agent_data.display_types_for_codes(has_subpoints)
+            ]
+            + [False]
+        )
+        # distance to each agent's position, or to each fiber's nearest point
+        distances = np.linalg.norm(
+            agent_data.positions[:total_steps, :max_agents] - focus, axis=-1
+        )
+        time_indices, agent_indices = np.nonzero(has_subpoints & is_fiber[codes])
+        if time_indices.size > 0:
+            n_points = (
+                n_subpoints[time_indices, agent_indices] // VALUES_PER_3D_POINT
+            ).astype(int)
+            point_distances = np.linalg.norm(
+                agent_data.get_subpoints_for_agents(
+                    time_indices, agent_indices
+                ).reshape((-1, VALUES_PER_3D_POINT))
+                - focus,
+                axis=-1,
+            )
+            point_starts = np.zeros_like(n_points)
+            np.cumsum(n_points[:-1], out=point_starts[1:])
+            distances[time_indices, agent_indices] = np.minimum.reduceat(
+                point_distances, point_starts
+            )
+        keep = agent_mask & (
+            LevelOfDetailFilter._hash_unique_ids(
+                agent_data.unique_ids[:total_steps, :max_agents]
+            )
+            < self._keep_ratios_for_distances(distances)
+        )
+        result = agent_data.get_subset_of_agents(*np.nonzero(keep))
+        if self.decimate_fiber_points:
+            self._decimate_fiber_points(result, focus, is_fiber)
+        data.agent_data = result
+        return data
+
+    def _decimate_fiber_points(
+        self, agent_data: AgentData, focus: np.ndarray, is_fiber: np.ndarray
+    ):
+        """
+        Keep fiber points at intervals of about 1 / keep ratio
+        for their distance band, and the end points of each fiber
+        """
+        agent_mask = agent_data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        codes = agent_data.types.codes[:total_steps, :max_agents]
+        n_subpoints = agent_data.n_subpoints[:total_steps, :max_agents]
+        time_indices, agent_indices = np.nonzero(
+            agent_mask & (n_subpoints > 0) & is_fiber[codes]
+        )
+        if time_indices.size < 1:
+            return
+        n_points = (
+            n_subpoints[time_indices, agent_indices] // VALUES_PER_3D_POINT
+        ).astype(int)
+        points = agent_data.get_subpoints_for_agents(
+            time_indices, agent_indices
+        ).reshape((-1, VALUES_PER_3D_POINT))
+        ratios = self._keep_ratios_for_distances(
+            np.linalg.norm(points - focus, axis=-1)
+        )
+        inc = np.round(1.0 / np.maximum(ratios, 1e-12)).astype(np.int64)
+        point_numbers = AgentData._ragged_indices(np.zeros_like(n_points), n_points)
+        last_point_numbers = np.repeat(n_points - 1, n_points)
+        keep_points = (
+            (point_numbers == 0)
+            | (point_numbers == last_point_numbers)
+            | ((ratios > 0) & (point_numbers % np.maximum(inc, 1) == 0))
+        )
+        new_n_points = np.bincount(
+            np.repeat(np.arange(n_points.size), n_points),
+            weights=keep_points,
+            minlength=n_points.size,
+        ).astype(int)
+        agent_data._set_subpoints_for_agents(
+            time_indices,
+            agent_indices,
+            VALUES_PER_3D_POINT * new_n_points,
+            points[keep_points].ravel(),
+        )
+
+    def apply(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Reduce the number of agents and fiber points in each frame
+        depending on their distance from the focus point
+        """
+        print("Filtering: level of detail by distance -------------")
+        data = self.apply_to_frames(data)
+        dimensions = data.agent_data.get_dimensions()
+        print(
+            f"filtered dims = {dimensions.total_steps} timesteps X "
+            f"{dimensions.max_agents} agents X {dimensions.max_subpoints} subpoints"
+        )
+        return data
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import logging
+from typing import List
 
 from ..data_objects import TrajectoryData
 from .filter import Filter
@@ -30,6 +31,30 @@ class MultiplySpaceFilter(Filter):
         """
         self.multiplier = multiplier
 
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Multiply the spatial values in each frame
+        """
+        data.meta_data.box_size = self.multiplier * data.meta_data.box_size
+        dtype = data.agent_data.dtype
+        data.agent_data.positions = (
+            self.multiplier * data.agent_data.positions
+        ).astype(dtype, copy=False)
+        data.agent_data.radii = (self.multiplier * data.agent_data.radii).astype(
+            dtype, copy=False
+        )
+        data.agent_data.subpoints = (
+            self.multiplier * data.agent_data.subpoints
+        ).astype(dtype, copy=False)
+        data.spatial_units.multiply(1.0 / self.multiplier)
+        return data
+
     def apply(self, data: TrajectoryData) -> TrajectoryData:
         """
         Multiply spatial values in the data
@@ -37,9 +62,4 @@ class MultiplySpaceFilter(Filter):
         print(
             f"Filtering: multiplying spatial scale by {self.multiplier} -------------"
         )
-        data.meta_data.box_size = self.multiplier * data.meta_data.box_size
-        data.agent_data.positions = self.multiplier * data.agent_data.positions
-        data.agent_data.radii = self.multiplier * data.agent_data.radii
-        data.agent_data.subpoints = self.multiplier * data.agent_data.subpoints
-        data.spatial_units.multiply(1.0 / self.multiplier)
-        return data
+        return self.apply_to_frames(data)
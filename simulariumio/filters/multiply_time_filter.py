@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import logging
+from typing import List
 
 import numpy as np
 
@@ -39,11 +40,16 @@ class MultiplyTimeFilter(Filter):
         self.multiplier = multiplier
         self.apply_to_plots = apply_to_plots
 
-    def apply(self, data: TrajectoryData) -> TrajectoryData:
+    def get_mutated_agent_data_fields(self) -> List[str]:
         """
-        Multiply time values in the data
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Multiply the time values in each frame
         """
-        print(f"Filtering: multiplying time by {self.multiplier} -------------")
         # plot data
         if self.apply_to_plots:
             for plot in range(len(data.plots)):
@@ -56,3 +62,10 @@ class MultiplyTimeFilter(Filter):
         # spatial data
         data.agent_data.times = self.multiplier * data.agent_data.times
         return data
+
+    def apply(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Multiply time values in the data
+        """
+        print(f"Filtering: multiplying time by {self.multiplier} -------------")
+        return self.apply_to_frames(data)
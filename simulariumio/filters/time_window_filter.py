@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+from typing import List
+
+import numpy as np
+
+from ..data_objects import TrajectoryData
+from ..exceptions import DataError
+from .filter import Filter
+
+###############################################################################
+
+log = logging.getLogger(__name__)
+
+###############################################################################
+
+
+class TimeWindowFilter(Filter):
+    start_time: float
+    end_time: float
+    start_frame: int
+    end_frame: int
+
+    def __init__(
+        self,
+        start_time: float = None,
+        end_time: float = None,
+        start_frame: int = None,
+        end_frame: int = None,
+    ):
+        """
+        This filter keeps only the timesteps of simularium data
+        in a range of times and/or frame indices. The filtered data
+        is views of the input arrays, which doesn't copy any agent data.
+        It can also be provided to the input data for some converters
+        (SmoldynData, CytosimData, MdData) so that they only parse
+        the timesteps in the window
+
+        Parameters
+        ----------
+        start_time : float (optional)
+            keep the timesteps at or after this time
+            Default: None (from the first timestep)
+        end_time : float (optional)
+            keep the timesteps at or before this time
+            Default: None (to the last timestep)
+        start_frame : int (optional)
+            the index of the first timestep to keep
+            Default: None (from the first timestep)
+        end_frame : int (optional)
+            the index after the last timestep to keep
+            Default: None (to the last timestep)
+        """
+        if start_frame is not None and start_frame < 0:
+            raise DataError("TimeWindowFilter start_frame must be at least 0")
+        if end_frame is not None and end_frame < 0:
+            raise DataError("TimeWindowFilter end_frame must be at least 0")
+        self.start_time = start_time
+        self.end_time = end_time
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+
+    def contains(self, frame_index: int, time: float) -> bool:
+        """
+        Is the timestep with the given index and time inside the window?
+        """
+        return (
+            (self.start_frame is None or frame_index >= self.start_frame)
+            and (self.end_frame is None or frame_index < self.end_frame)
+            and (self.start_time is None or time >= self.start_time)
+            and (self.end_time is None or time <= self.end_time)
+        )
+
+    def is_after(self, frame_index: int, time: float) -> bool:
+        """
+        Is the timestep with the given index and time after the window,
+        so that none of the timesteps after it are inside the window?
+        Timesteps are expected to be in increasing time order
+        """
+        return (self.end_frame is not None and frame_index >= self.end_frame) or (
+            self.end_time is not None and time > self.end_time
+        )
+
+    def _get_frame_slice(self, times: np.ndarray) -> slice:
+        """
+        Get a slice of the timesteps in the window,
+        times are expected to be increasing
+        """
+        start = 0
+        end = times.size
+        if self.start_frame is not None:
+            start = max(start, self.start_frame)
+        if self.end_frame is not None:
+            end = min(end, self.end_frame)
+        if self.start_time is not None:
+            start = max(start, int(np.searchsorted(times, self.start_time, "left")))
+        if self.end_time is not None:
+            end = min(end, int(np.searchsorted(times, self.end_time, "right")))
+        return slice(start, max(start, end))
+
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        This filter creates new arrays instead of changing them in place
+        """
+        return []
+
+    def get_frame_indices(self, data: TrajectoryData) -> np.ndarray:
+        """
+        Keep the frames in the window
+        """
+        times = data.agent_data.times[: data.agent_data.total_timesteps()]
+        return np.arange(times.size)[self._get_frame_slice(times)]
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Filter out the timesteps outside the window
+        """
+        agent_data = data.agent_data
+        times = agent_data.times[: agent_data.total_timesteps()]
+        data.agent_data = agent_data.get_frames(self._get_frame_slice(times))
+        return data
+
+    def apply(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Keep only the timesteps of the simularium data inside the window
+        """
+        print("Filtering: time window -------------")
+        data = self.apply_to_frames(data)
+        dimensions = data.agent_data.get_dimensions()
+        print(
+            f"filtered dims = {dimensions.total_steps} timesteps X "
+            f"{dimensions.max_agents} agents X {dimensions.max_subpoints} subpoints"
+        )
+        return data
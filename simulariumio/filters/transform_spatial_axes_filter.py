@@ -9,7 +9,7 @@ import numpy as np
 from .filter import Filter
 from ..data_objects import TrajectoryData
 from ..exceptions import DataError
-from ..constants import VALUES_PER_3D_POINT
+from ..constants import VALUES_PER_3D_POINT, SUBPOINT_VALUES_PER_ITEM
 
 ###############################################################################
 
@@ -42,63 +42,87 @@ class TransformSpatialAxesFilter(Filter):
         for d in range(len(axes_mapping)):
             axes_mapping[d] = axes_mapping[d].lower()
         self.axes_mapping = axes_mapping
+        # the input axis and direction for each output axis
+        self._axis_indices = np.zeros(VALUES_PER_3D_POINT, dtype=int)
+        self._axis_signs = np.ones(VALUES_PER_3D_POINT)
+        for d in range(len(axes_mapping)):
+            axis = axes_mapping[d]
+            axis_index = [dim in axis for dim in "xyz"]
+            if sum(axis_index) != 1:
+                raise DataError(
+                    f"axes_mapping {axes_mapping} must contain one of x, y, or z "
+                    "in each direction"
+                )
+            self._axis_indices[d] = axis_index.index(True)
+            if "-" in axis:
+                self._axis_signs[d] = -1.0
 
-    def _transform_coordinate(
-        self, position: np.ndarray, set_direction: bool = True
+    def _transform_coordinates(
+        self, coordinates: np.ndarray, set_direction: bool = True
     ) -> np.ndarray:
         """
-        Transform an +X+Y+Z coordinate according to axes_mapping
+        Transform +X+Y+Z coordinates (shape = [..., 3])
+        according to axes_mapping
         """
-        result = np.zeros_like(position)
-        for d in range(len(self.axes_mapping)):
-            axis = self.axes_mapping[d]
-            if "x" in axis:
-                result[d] = position[0]
-            if "y" in axis:
-                result[d] = position[1]
-            if "z" in axis:
-                result[d] = position[2]
-            if set_direction and "-" in axis:
-                result[d] *= -1.0
+        result = np.asarray(coordinates)[..., self._axis_indices]
+        if set_direction:
+            result = result * self._axis_signs
         return result
 
-    def apply(self, data: TrajectoryData) -> TrajectoryData:
+    def get_mutated_agent_data_fields(self) -> List[str]:
         """
-        Transform spatial coordinates to rotate and/or reflect the scene
+        This filter changes positions and subpoints in place
+        """
+        return ["positions", "subpoints"]
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Transform the spatial coordinates in each frame
         """
-        print(f"Filtering: transform spatial axes {self.axes_mapping} -------------")
         # box size
-        data.meta_data.box_size = self._transform_coordinate(
+        data.meta_data.box_size = self._transform_coordinates(
             data.meta_data.box_size, False
         )
-        # get dimensions
-        start_dimensions = data.agent_data.get_dimensions()
-        max_subpoints = int(np.amax(data.agent_data.n_subpoints))
-        # get filtered data
-        for time_index in range(start_dimensions.total_steps):
-            for agent_index in range(int(data.agent_data.n_agents[time_index])):
-                data.agent_data.positions[time_index][
-                    agent_index
-                ] = self._transform_coordinate(
-                    data.agent_data.positions[time_index][agent_index]
-                )
-                # subpoints
-                if max_subpoints < 1:
-                    continue
-                sp_items = self.get_items_from_subpoints(
-                    data.agent_data, time_index, agent_index
-                )
-                if sp_items is None:
-                    continue
-                n_sp = int(data.agent_data.n_subpoints[time_index][agent_index])
-                n_items = sp_items.shape[0]
-                for item_index in range(n_items):
-                    sp_items[item_index][
-                        :VALUES_PER_3D_POINT
-                    ] = self._transform_coordinate(
-                        sp_items[item_index][:VALUES_PER_3D_POINT]
-                    )
-                data.agent_data.subpoints[time_index][agent_index][
-                    :n_sp
-                ] = sp_items.reshape(n_sp)
+        # positions
+        agent_data = data.agent_data
+        agent_mask = agent_data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        positions = agent_data.positions[:total_steps, :max_agents]
+        positions[agent_mask] = self._transform_coordinates(positions[agent_mask])
+        # subpoints, the xyz values of each fiber point or sphere in a sphere group
+        codes = agent_data.types.codes[:total_steps, :max_agents]
+        has_subpoints = agent_mask & (
+            agent_data.n_subpoints[:total_steps, :max_agents] > 0
+        )
+        values_per_item = np.array(
+            [
+                SUBPOINT_VALUES_PER_ITEM(display_type)
+                for display_type in agent_data.display_types_for_codes(has_subpoints)
+            ]
+            + [0],
+            dtype=int,
+        )
+        for n_values in np.unique(
+            values_per_item[values_per_item >= VALUES_PER_3D_POINT]
+        ):
+            time_indices, agent_indices = np.nonzero(
+                has_subpoints & (values_per_item[codes] == n_values)
+            )
+            if time_indices.size < 1:
+                continue
+            subpoint_indices = agent_data.get_subpoint_indices_for_agents(
+                time_indices, agent_indices
+            )
+            items = agent_data.subpoints[subpoint_indices].reshape((-1, n_values))
+            items[:, :VALUES_PER_3D_POINT] = self._transform_coordinates(
+                items[:, :VALUES_PER_3D_POINT]
+            )
+            agent_data.subpoints[subpoint_indices] = items.flatten()
         return data
+
+    def apply(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Transform spatial coordinates to rotate and/or reflect the scene
+        """
+        print(f"Filtering: transform spatial axes {self.axes_mapping} -------------")
+        return self.apply_to_frames(data)
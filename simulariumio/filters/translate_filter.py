@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Dict
+from typing import Dict, List
 import logging
 
 import numpy as np
@@ -45,50 +45,57 @@ class TranslateFilter(Filter):
         )
         self.default_translation = default_translation
 
+    def get_mutated_agent_data_fields(self) -> List[str]:
+        """
+        This filter changes positions and subpoints in place
+        """
+        return ["positions", "subpoints"]
+
+    def apply_to_frames(self, data: TrajectoryData) -> TrajectoryData:
+        """
+        Add the XYZ translation to the spatial coordinates in each frame
+        """
+        agent_data = data.agent_data
+        agent_mask = agent_data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        codes = agent_data.types.codes[:total_steps, :max_agents]
+        # translation for each type code, the last is for codes that are -1
+        translations = np.tile(
+            np.array(self.default_translation, dtype=float),
+            (len(agent_data.types.names) + 1, 1),
+        )
+        for code, type_name in enumerate(agent_data.types.names):
+            if type_name in self.translation_per_type:
+                translations[code] = self.translation_per_type[type_name]
+        # translate subpoints for fibers, and agent position for non-fibers
+        is_fiber = np.array(
+            [
+                display_type == DISPLAY_TYPE.FIBER
+                for display_type in agent_data.display_types_for_codes()
+            ]
+            + [False]
+        )
+        n_subpoints = agent_data.n_subpoints[:total_steps, :max_agents]
+        translate_subpoints = agent_mask & is_fiber[codes] & (n_subpoints > 0)
+        translate_positions = agent_mask & ~translate_subpoints
+        agent_data.positions[:total_steps, :max_agents][
+            translate_positions
+        ] += translations[codes[translate_positions]]
+        time_indices, agent_indices = np.nonzero(translate_subpoints)
+        if time_indices.size > 0:
+            n_points = (
+                n_subpoints[time_indices, agent_indices] // VALUES_PER_3D_POINT
+            ).astype(int)
+            agent_data.subpoints[
+                agent_data.get_subpoint_indices_for_agents(time_indices, agent_indices)
+            ] += np.repeat(
+                translations[codes[time_indices, agent_indices]], n_points, axis=0
+            ).flatten()
+        return data
+
     def apply(self, data: TrajectoryData) -> TrajectoryData:
         """
         Add the XYZ translation to all spatial coordinates
         """
         print("Filtering: translation -------------")
-        # get dimensions
-        total_steps = data.agent_data.times.size
-        max_subpoints = int(np.amax(data.agent_data.n_subpoints))
-        # get filtered data
-        for time_index in range(total_steps):
-            for agent_index in range(int(data.agent_data.n_agents[time_index])):
-                # get translation for this agent
-                if (
-                    data.agent_data.types[time_index][agent_index]
-                    in self.translation_per_type
-                ):
-                    translation = self.translation_per_type[
-                        data.agent_data.types[time_index][agent_index]
-                    ]
-                else:
-                    translation = self.default_translation
-                # apply translation
-                display_type = data.agent_data.display_type_for_agent(
-                    time_index, agent_index
-                )
-                translate_subpoints = (
-                    max_subpoints > 0 and display_type != DISPLAY_TYPE.SPHERE_GROUP
-                )
-                if translate_subpoints:
-                    sp_items = self.get_items_from_subpoints(
-                        data.agent_data, time_index, agent_index
-                    )
-                    if sp_items is None:
-                        translate_subpoints = False
-                    else:
-                        # translate subpoints for fibers
-                        n_items = sp_items.shape[0]
-                        for item_index in range(n_items):
-                            sp_items[item_index][:VALUES_PER_3D_POINT] += translation
-                        n_sp = int(data.agent_data.n_subpoints[time_index][agent_index])
-                        data.agent_data.subpoints[time_index][agent_index][
-                            :n_sp
-                        ] = sp_items.reshape(n_sp)
-                if not translate_subpoints:
-                    # translate agent position for non-fibers
-                    data.agent_data.positions[time_index][agent_index] += translation
-        return data
+        return self.apply_to_frames(data)
@@ -3,7 +3,7 @@
 
 import logging
 import copy
-from typing import Set, Callable, Tuple
+from typing import Set, Callable, Tuple, Iterator
 
 import numpy as np
 import pandas as pd
@@ -53,6 +53,28 @@ class MdConverter(TrajectoryConverter):
         super().__init__(input_data, progress_callback, callback_interval)
         self._data = self._read(input_data)
 
+    @staticmethod
+    def _get_timesteps(input_data: MdData) -> Iterator[int]:
+        """
+        Iterate the MD Universe trajectory to each timestep to read,
+        skipping the timesteps outside the time window if there is one,
+        and yield the index of the timestep
+        """
+        nth = input_data.nth_timestep_to_read
+        time_window = input_data.time_window
+        if time_window is None:
+            for index, _ in enumerate(input_data.md_universe.trajectory[::nth]):
+                yield index
+            return
+        start_frame = time_window.start_frame if time_window.start_frame else 0
+        for index, ts in enumerate(
+            input_data.md_universe.trajectory[start_frame * nth :: nth], start_frame
+        ):
+            if time_window.is_after(index, ts.time):
+                break
+            if time_window.contains(index, ts.time):
+                yield index
+
     @staticmethod
     def _read_universe_dimensions(
         input_data: MdData,
@@ -65,7 +87,7 @@ class MdConverter(TrajectoryConverter):
             total_steps=0,
             max_agents=0,
         )
-        for ts in input_data.md_universe.trajectory[:: input_data.nth_timestep_to_read]:
+        for _ in MdConverter._get_timesteps(input_data):
             result.total_steps += 1
             n_agents = input_data.md_universe.atoms.positions.shape[0]
             if n_agents > result.max_agents:
@@ -166,14 +188,12 @@ class MdConverter(TrajectoryConverter):
         Use a MD Universe to get AgentData
         """
         dimensions = MdConverter._read_universe_dimensions(input_data)
-        result = AgentData.from_dimensions(dimensions)
+        result = AgentData.from_dimensions(dimensions, dtype=input_data.dtype)
         get_type_name_func = np.frompyfunc(MdConverter._get_type_name, 2, 1)
         unique_raw_type_names = set([])
         time_index = 0
 
-        for frame in input_data.md_universe.trajectory[
-            :: input_data.nth_timestep_to_read
-        ]:
+        for _ in MdConverter._get_timesteps(input_data):
             result.times[time_index] = input_data.md_universe.trajectory.time
             atom_positions = input_data.md_universe.atoms.positions
             result.n_agents[time_index] = atom_positions.shape[0]
@@ -4,9 +4,11 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
 from MDAnalysis import Universe
 
 from ..data_objects import MetaData, UnitData, DisplayData
+from ..filters import TimeWindowFilter
 
 ###############################################################################
 
@@ -23,6 +25,8 @@ class MdData:
     time_units: UnitData
     spatial_units: UnitData
     plots: List[Dict[str, Any]]
+    dtype: np.dtype
+    time_window: TimeWindowFilter
 
     def __init__(
         self,
@@ -33,6 +37,8 @@ class MdData:
         time_units: UnitData = None,
         spatial_units: UnitData = None,
         plots: List[Dict[str, Any]] = None,
+        dtype: np.dtype = np.float64,
+        time_window: TimeWindowFilter = None,
     ):
         """
         This object holds simulation trajectory outputs
@@ -69,6 +75,15 @@ class MdData:
         plots : List[Dict[str, Any]] (optional)
             An object containing plot data already
             in Simularium format
+        dtype : np.dtype (optional)
+            The float dtype for the spatial data arrays (positions, radii,
+            rotations, and subpoints), use np.float32 to halve their memory
+            Default: np.float64
+        time_window : TimeWindowFilter (optional)
+            Only read the timesteps inside this window of times
+            and/or frame indices, where frame indices count
+            the timesteps that are visualized with nth_timestep_to_read
+            Default: None (read all timesteps)
         """
         self.md_universe = md_universe
         self.nth_timestep_to_read = nth_timestep_to_read
@@ -79,3 +94,5 @@ class MdData:
             spatial_units if spatial_units is not None else UnitData("m")
         )
         self.plots = plots if plots is not None else []
+        self.dtype = dtype
+        self.time_window = time_window
@@ -12,6 +12,7 @@ from ..data_objects import (
     UnitData,
     DimensionData,
     DisplayData,
+    BoundsData,
 )
 from ..constants import (
     VIZ_TYPE,
@@ -161,7 +162,8 @@ class MedyanConverter(TrajectoryConverter):
         except Exception as e:
             raise InputDataError(f"Error reading input medyan data: {e}")
 
-        result = AgentData.from_dimensions(dimensions)
+        result = AgentData.from_dimensions(dimensions, dtype=input_data.dtype)
+        bounds = BoundsData()
         time_index = -1
         at_frame_start = True
         parsing_object = False
@@ -188,6 +190,8 @@ class MedyanConverter(TrajectoryConverter):
             cols = line.split()
             if at_frame_start:
                 # start of timestep
+                if time_index >= 0:
+                    bounds.add_frame(result, time_index)
                 time_index += 1
                 agent_index = 0
                 result.times[time_index] = float(cols[1])
@@ -275,15 +279,17 @@ class MedyanConverter(TrajectoryConverter):
             line_count += 1
             self.check_report_progress(line_count / len(lines))
 
+        if time_index >= 0:
+            bounds.add_frame(result, time_index)
         result.n_timesteps = time_index + 1
 
         if input_data.center:
             return TrajectoryConverter.center_and_scale_agent_data(
-                result, input_data.meta_data.scale_factor
+                result, input_data.meta_data.scale_factor, bounds
             )
 
         return TrajectoryConverter.scale_agent_data(
-            result, input_data.meta_data.scale_factor
+            result, input_data.meta_data.scale_factor, bounds
         )
 
     def _read(self, input_data: MedyanData) -> TrajectoryData:
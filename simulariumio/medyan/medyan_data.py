@@ -4,6 +4,8 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
+
 from ..data_objects import MetaData, DisplayData, InputFileData
 
 ###############################################################################
@@ -21,6 +23,7 @@ class MedyanData:
     draw_fiber_points: bool
     plots: List[Dict[str, Any]]
     center: bool
+    dtype: np.dtype
 
     def __init__(
         self,
@@ -33,6 +36,7 @@ class MedyanData:
         draw_fiber_points: bool = False,
         plots: List[Dict[str, Any]] = None,
         center: bool = True,
+        dtype: np.dtype = np.float64,
     ):
         """
         This object holds simulation trajectory outputs
@@ -84,6 +88,10 @@ class MedyanData:
             If true, the spatial values of the data are centered
             around the origin (0, 0, 0) during conversion
             Default: True
+        dtype : np.dtype (optional)
+            The float dtype for the spatial data arrays (positions, radii,
+            rotations, and subpoints), use np.float32 to halve their memory
+            Default: np.float64
         """
         self.snapshot_file = snapshot_file
         self.meta_data = meta_data if meta_data is not None else MetaData()
@@ -100,3 +108,4 @@ class MedyanData:
         self.draw_fiber_points = draw_fiber_points
         self.plots = plots if plots is not None else []
         self.center = center
+        self.dtype = dtype
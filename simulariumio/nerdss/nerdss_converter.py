@@ -49,7 +49,7 @@ class NerdssConverter(TrajectoryConverter):
                 dimensions.max_agents = n_agents*2
             time_steps.append(os.path.splitext(file)[0])
         time_steps.sort(key=int)
-        agent_data = AgentData.from_dimensions(dimensions)
+        agent_data = AgentData.from_dimensions(dimensions, dtype=input_data.dtype)
         agent_data.n_timesteps = n_timesteps
 
         # keep track of fiber positions for bonds as we go
@@ -2,6 +2,8 @@ from ..data_objects import MetaData, DisplayData, UnitData
 from .bond_data import BondData
 from typing import List, Dict, Any
 
+import numpy as np
+
 
 class NerdssData:
     path_to_pdb_files: str
@@ -13,6 +15,7 @@ class NerdssData:
     inter_molecular_bonds: List[BondData]
     intra_molecular_bonds: List[BondData]
     time_step: UnitData
+    dtype: np.dtype
 
     def __init__(
         self,
@@ -25,6 +28,7 @@ class NerdssData:
         inter_molecular_bonds: List[BondData] = None,
         intra_molecular_bonds: List[BondData] = None,
         time_step: UnitData = None,
+        dtype: np.dtype = np.float64,
     ):
         """
         Parameters
@@ -65,6 +69,10 @@ class NerdssData:
             Time step between each frame, where the frame numbers are represented
             as the names of the .pdb files in path_to_pdb_files
             Default: 1.0 second
+        dtype : np.dtype (optional)
+            The float dtype for the spatial data arrays (positions, radii,
+            rotations, and subpoints), use np.float32 to halve their memory
+            Default: np.float64
         """
         self.path_to_pdb_files = path_to_pdb_files
         self.meta_data = meta_data if meta_data is not None else MetaData()
@@ -81,3 +89,4 @@ class NerdssData:
             intra_molecular_bonds if inter_molecular_bonds is not None else []
         )
         self.time_step = time_step if time_step is not None else self.time_units
+        self.dtype = dtype
@@ -180,7 +180,7 @@ class PhysicellConverter(TrajectoryConverter):
             raise InputDataError(f"Error reading from Physicell output directory: {e}")
 
         dimensions = PhysicellConverter._get_dimensions(discrete_cells)
-        result = AgentData.from_dimensions(dimensions)
+        result = AgentData.from_dimensions(dimensions, dtype=input_data.dtype)
         result.times = (
             input_data.nth_timestep_to_read
             * input_data.timestep
@@ -257,7 +257,8 @@ class PhysicellConverter(TrajectoryConverter):
                 dimensions.total_steps,
                 dimensions.max_agents,
                 max_subpoints,
-            )
+            ),
+            dtype=result.dtype,
         )
         owner_cell_color_indices = {}
         next_color_index = 0
@@ -332,8 +333,8 @@ class PhysicellConverter(TrajectoryConverter):
             result.radii[index][0 : n_def_agents[index]] = (
                 scale_factor * result.radii[index][0 : n_def_agents[index]]
             )
-        result.positions = scale_factor * result.positions
-        result.subpoints = scale_factor * result.subpoints
+        result.positions *= scale_factor
+        result.subpoints *= scale_factor
         spatial_units = UnitData(
             units,
             1.0 / scale_factor,
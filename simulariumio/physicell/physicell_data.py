@@ -4,6 +4,8 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
+
 from ..data_objects import UnitData, MetaData, DisplayData
 
 ###############################################################################
@@ -24,6 +26,7 @@ class PhysicellData:
     owner_cell_display_name: str
     time_units: UnitData
     plots: List[Dict[str, Any]]
+    dtype: np.dtype
 
     def __init__(
         self,
@@ -37,6 +40,7 @@ class PhysicellData:
         owner_cell_display_name: str = "cell",
         time_units: UnitData = None,
         plots: List[Dict[str, Any]] = None,
+        dtype: np.dtype = np.float64,
     ):
         """
         This object holds simulation trajectory outputs
@@ -83,6 +87,10 @@ class PhysicellData:
         plots : List[Dict[str, Any]] (optional)
             An object containing plot data already
             in Simularium format
+        dtype : np.dtype (optional)
+            The float dtype for the spatial data arrays (positions, radii,
+            rotations, and subpoints), use np.float32 to halve their memory
+            Default: np.float64
         """
         self.timestep = timestep
         self.path_to_output_dir = path_to_output_dir
@@ -94,3 +102,4 @@ class PhysicellData:
         self.owner_cell_display_name = owner_cell_display_name
         self.time_units = time_units if time_units is not None else UnitData("s")
         self.plots = plots if plots is not None else []
+        self.dtype = dtype
@@ -4,6 +4,8 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
+
 from ..data_objects import UnitData, MetaData, DisplayData
 
 ###############################################################################
@@ -22,6 +24,7 @@ class ReaddyData:
     time_units: UnitData
     spatial_units: UnitData
     plots: List[Dict[str, Any]]
+    dtype: np.dtype
 
     def __init__(
         self,
@@ -33,6 +36,7 @@ class ReaddyData:
         time_units: UnitData = None,
         spatial_units: UnitData = None,
         plots: List[Dict[str, Any]] = None,
+        dtype: np.dtype = np.float64,
     ):
         """
         This object holds simulation trajectory outputs
@@ -67,6 +71,10 @@ class ReaddyData:
         plots : List[Dict[str, Any]] (optional)
             An object containing plot data already
             in Simularium format
+        dtype : np.dtype (optional)
+            The float dtype for the spatial data arrays (positions, radii,
+            rotations, and subpoints), use np.float32 to halve their memory
+            Default: np.float64
         """
         self.timestep = timestep
         self.path_to_readdy_h5 = path_to_readdy_h5
@@ -76,3 +84,4 @@ class ReaddyData:
         self.time_units = time_units if time_units is not None else UnitData("s")
         self.spatial_units = spatial_units if time_units is not None else UnitData("m")
         self.plots = plots if plots is not None else []
+        self.dtype = dtype
@@ -128,9 +128,14 @@ class SimulariumBinaryReader:
         data_as_ints: np.ndarray,
         data_as_floats: np.ndarray,
         parse_data_as_binary: bool,
+        data_as_lists: bool = True,
     ) -> Dict[str, Any]:
         """
-        Parse spatial data binary block from a .simularium binary file
+        Parse spatial data binary block from a .simularium binary file,
+        if parse_data_as_binary is True each frame's data is a memoryview
+        of the file's bytes, otherwise if data_as_lists is False
+        each frame's data is a float32 view of the file's values
+        instead of a list
         """
         block_offset = (
             int(block_info.block_offsets[block_index] / BINARY_SETTINGS.BYTES_PER_VALUE)
@@ -148,6 +153,9 @@ class SimulariumBinaryReader:
             "bundleSize": n_frames,
             "bundleData": [],
         }
+        if parse_data_as_binary:
+            # slices of a memoryview don't copy the file's bytes
+            data_as_bytes = memoryview(data_as_bytes)
         for index in range(n_frames):
             frame_index = data_as_ints[current_frame_offset]
             if index == 0:
@@ -159,11 +167,12 @@ class SimulariumBinaryReader:
                     4 * (current_frame_offset + frame_n_values)
                 ]
             else:
-                data = list(
-                    data_as_floats[
-                        current_frame_offset + 3 : current_frame_offset + frame_n_values
-                    ]
-                )
+                # a view of the float32 values, no copy
+                data = data_as_floats[
+                    current_frame_offset + 3 : current_frame_offset + frame_n_values
+                ]
+                if data_as_lists:
+                    data = data.tolist()
             result["bundleData"].append(
                 {
                     "frameNumber": frame_index,
@@ -188,8 +197,25 @@ class SimulariumBinaryReader:
             A InputFileData object containing binary .simularium data to load
         parse_spatial_data_as_binary: bool (optional)
             Leave spatial data binary encoded in returned dict?
+            If True, each frame's data is a memoryview of the file's bytes,
+            which must be released before closing a memory mapped input_file
             Default = False
         """
+        return SimulariumBinaryReader._load_binary(
+            input_file, parse_spatial_data_as_binary
+        )
+
+    @staticmethod
+    def _load_binary(
+        input_file: InputFileData,
+        parse_spatial_data_as_binary: bool = False,
+        spatial_data_as_lists: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Load data from the input file in .simularium binary format,
+        if spatial_data_as_lists is False each frame's data is a float32 view
+        of the file's values, for decoding into AgentData without a copy
+        """
         result = {}
         binary_data = SimulariumBinaryReader._binary_data_from_source(input_file)
         block_info = SimulariumBinaryReader._parse_binary_header(binary_data.byte_view)
@@ -231,6 +257,7 @@ class SimulariumBinaryReader:
                     binary_data.int_view,
                     binary_data.float_view,
                     parse_spatial_data_as_binary,
+                    spatial_data_as_lists,
                 )
             else:
                 raise DataError(
@@ -6,8 +6,9 @@ from typing import List, Callable, Tuple
 import numpy as np
 
 from ..trajectory_converter import TrajectoryConverter
-from ..data_objects import TrajectoryData, AgentData, DimensionData
+from ..data_objects import TrajectoryData, AgentData, DimensionData, BoundsData
 from ..exceptions import InputDataError
+from ..filters import TimeWindowFilter
 from .smoldyn_data import SmoldynData
 
 ###############################################################################
@@ -48,6 +49,29 @@ class SmoldynConverter(TrajectoryConverter):
         super().__init__(input_data, progress_callback, callback_interval)
         self._data = self._read(input_data)
 
+    @staticmethod
+    def _get_lines_in_time_window(
+        smoldyn_data_lines: List[str], time_window: TimeWindowFilter
+    ) -> List[str]:
+        """
+        Get the lines for the timesteps inside the time window,
+        stopping at the first timestep after it
+        """
+        result = []
+        frame_index = -1
+        in_window = False
+        for line in smoldyn_data_lines:
+            cols = line.split()
+            if len(cols) == 2:
+                frame_index += 1
+                time = float(cols[0])
+                if time_window.is_after(frame_index, time):
+                    break
+                in_window = time_window.contains(frame_index, time)
+            if in_window:
+                result.append(line)
+        return result
+
     @staticmethod
     def _parse_dimensions(smoldyn_data_lines: List[str]) -> DimensionData:
         """
@@ -78,7 +102,8 @@ class SmoldynConverter(TrajectoryConverter):
         Parse a Smoldyn output file to get AgentData
         """
         dimensions = SmoldynConverter._parse_dimensions(smoldyn_data_lines)
-        result = AgentData.from_dimensions(dimensions)
+        result = AgentData.from_dimensions(dimensions, dtype=input_data.dtype)
+        bounds = BoundsData()
         time_index = -1
         agent_index = 0
         line_count = 0
@@ -90,6 +115,7 @@ class SmoldynConverter(TrajectoryConverter):
             if len(cols) == 2:
                 if time_index >= 0:
                     result.n_agents[time_index] = agent_index
+                    bounds.add_frame(result, time_index)
                 agent_index = 0
                 time_index += 1
                 result.times[time_index] = float(cols[0])
@@ -133,15 +159,16 @@ class SmoldynConverter(TrajectoryConverter):
             self.check_report_progress(line_count / len(smoldyn_data_lines))
 
         result.n_agents[time_index] = agent_index
+        bounds.add_frame(result, time_index)
         result.n_timesteps = time_index + 1
 
         if input_data.center:
             return TrajectoryConverter.center_and_scale_agent_data(
-                result, input_data.meta_data.scale_factor
+                result, input_data.meta_data.scale_factor, bounds
             )
 
         return TrajectoryConverter.scale_agent_data(
-            result, input_data.meta_data.scale_factor
+            result, input_data.meta_data.scale_factor, bounds
         )
 
     def _read(self, input_data: SmoldynData) -> TrajectoryData:
@@ -154,6 +181,10 @@ class SmoldynConverter(TrajectoryConverter):
             smoldyn_data = input_data.smoldyn_file.get_contents().split("\n")
         except Exception as e:
             raise InputDataError(f"Error reading input smoldyn data: {e}")
+        if input_data.time_window is not None:
+            smoldyn_data = SmoldynConverter._get_lines_in_time_window(
+                smoldyn_data, input_data.time_window
+            )
         # parse
         agent_data, scale_factor = self._parse_objects(smoldyn_data, input_data)
         # get display data (geometry and color)
@@ -4,6 +4,8 @@
 import logging
 from typing import Any, Dict, List
 
+import numpy as np
+
 
 from ..data_objects import (
     MetaData,
@@ -13,6 +15,7 @@ from ..data_objects import (
 )
 from ..utils import unpack_display_data
 from ..exceptions import DataError
+from ..filters import TimeWindowFilter
 
 ###############################################################################
 
@@ -29,6 +32,8 @@ class SmoldynData:
     spatial_units: UnitData
     plots: List[Dict[str, Any]]
     center: bool
+    dtype: np.dtype
+    time_window: TimeWindowFilter
 
     def __init__(
         self,
@@ -39,6 +44,8 @@ class SmoldynData:
         spatial_units: UnitData = None,
         plots: List[Dict[str, Any]] = None,
         center: bool = True,
+        dtype: np.dtype = np.float64,
+        time_window: TimeWindowFilter = None,
     ):
         """
         This object holds simulation trajectory outputs
@@ -76,6 +83,14 @@ class SmoldynData:
             If true, the spatial values of the data are centered
             around the origin (0, 0, 0) during conversion
             Default: True
+        dtype : np.dtype (optional)
+            The float dtype for the spatial data arrays (positions, radii,
+            rotations, and subpoints), use np.float32 to halve their memory
+            Default: np.float64
+        time_window : TimeWindowFilter (optional)
+            Only parse the timesteps inside this window of times
+            and/or frame indices, skipping the rest of the file
+            Default: None (parse all timesteps)
         """
         self.smoldyn_file = smoldyn_file
         self.meta_data = meta_data if meta_data is not None else MetaData()
@@ -86,6 +101,8 @@ class SmoldynData:
         )
         self.plots = plots if plots is not None else []
         self.center = center
+        self.dtype = dtype
+        self.time_window = time_window
 
     @classmethod
     def from_dict(
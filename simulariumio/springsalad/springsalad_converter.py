@@ -12,6 +12,7 @@ from ..data_objects import (
     UnitData,
     DimensionData,
     DisplayData,
+    BoundsData,
 )
 from .springsalad_data import SpringsaladData
 from ..constants import (
@@ -97,7 +98,8 @@ class SpringsaladConverter(TrajectoryConverter):
         dimensions = SpringsaladConverter._parse_dimensions(
             springsalad_data, input_data.draw_bonds
         )
-        result = AgentData.from_dimensions(dimensions)
+        result = AgentData.from_dimensions(dimensions, dtype=input_data.dtype)
+        bounds = BoundsData()
         box_size = np.zeros(VALUES_PER_3D_POINT)
         time_index = -1
         agent_index = 0
@@ -116,6 +118,8 @@ class SpringsaladConverter(TrajectoryConverter):
             if "z_inside" in line:
                 box_size[2] += 2 * float(cols[1])
             if "CurrentTime" in line:  # beginning of a scene (timepoint)
+                if time_index >= 0:
+                    bounds.add_frame(result, time_index)
                 agent_index = 0
                 time_index += 1
                 result.times[time_index] = float(
@@ -173,10 +177,12 @@ class SpringsaladConverter(TrajectoryConverter):
                 agent_index += 1
             line_count += 1
             self.check_report_progress(line_count / len(springsalad_data))
+        if time_index >= 0:
+            bounds.add_frame(result, time_index)
         result.n_timesteps = time_index + 1
 
         result, scale_factor = TrajectoryConverter.scale_agent_data(
-            result, input_data.meta_data.scale_factor
+            result, input_data.meta_data.scale_factor, bounds
         )
 
         return result, box_size, scale_factor
@@ -95,6 +95,30 @@ from simulariumio.constants import BUFFER_SIZE_INC
                 max_subpoints=BUFFER_SIZE_INC.max_subpoints + 1,
             ),
         ),
+        (
+            10,
+            2000,
+            0,
+            2000,
+            1,
+            DimensionData(
+                total_steps=10,
+                max_agents=4000,
+                max_subpoints=0,
+            ),
+        ),
+        (
+            10,
+            10,
+            0,
+            5000,
+            0,
+            DimensionData(
+                total_steps=5001,
+                max_agents=10,
+                max_subpoints=0,
+            ),
+        ),
     ],
 )
 def test_buffer_size(
@@ -103,3 +127,21 @@ def test_buffer_size(
     agent_data = empty_buffer(total_steps, n_agents, n_subpoints)
     agent_data = agent_data.check_increase_buffer_size(next_index, axis)
     assert agent_data.get_dimensions() == expected_dimensions
+
+
+def test_buffer_size_increases_in_place():
+    agent_data = empty_buffer(2, 1, 0)
+    n_resizes = 0
+    for agent_index in range(5000):
+        positions = agent_data.positions
+        result = agent_data.check_increase_buffer_size(
+            agent_index, 1, DimensionData(total_steps=1, max_agents=1)
+        )
+        assert result is agent_data
+        if agent_data.positions is not positions:
+            n_resizes += 1
+        agent_data.positions[:, agent_index] = agent_index
+    # capacity doubles, so resizing happens a logarithmic number of times
+    assert n_resizes <= 13
+    assert agent_data.get_dimensions().max_agents == 8192
+    assert (agent_data.positions[1, :5000, 0] == range(5000)).all()
@@ -394,3 +394,54 @@ def test_callback_fn():
         assert call_value > last_call_val
         assert call_value <= 1.0
         last_call_val = call_value
+
+
+def aster_pull3D_data(object_types):
+    path = "simulariumio/tests/data/cytosim/aster_pull3D_couples_actin_solid_3_frames"
+    return CytosimData(
+        object_info={
+            object_type: CytosimObjectInfo(
+                cytosim_file=InputFileData(file_path=f"{path}/{file_name}"),
+            )
+            for object_type, file_name in object_types
+        },
+    )
+
+
+def test_scale_factor_for_object_types():
+    converter = CytosimConverter(
+        aster_pull3D_data(
+            [
+                ("fibers", "fiber_points.txt"),
+                ("solids", "solids.txt"),
+                ("singles", "singles.txt"),
+                ("couples", "couples.txt"),
+            ]
+        )
+    )
+    # the largest range of the unscaled agents in all the object types,
+    # including their radii, is in X
+    range = 2.0 - -1.7412
+    assert converter._data.meta_data.scale_factor == pytest.approx(
+        VIEWER_DIMENSION_RANGE.MIN / range
+    )
+    assert converter._data.spatial_units.name == "nm"
+    assert converter._data.spatial_units.magnitude == pytest.approx(935.3)
+
+
+def test_object_types_have_same_scale():
+    converter = CytosimConverter(
+        aster_pull3D_data([("fibers", "fiber_points.txt"), ("solids", "solids.txt")])
+    )
+    scale_factor = converter._data.meta_data.scale_factor
+    agent_data = converter._data.agent_data
+    # the first fiber point and the first solid are at the same position
+    assert np.allclose(
+        agent_data.get_subpoints(0, 0)[:3],
+        scale_factor * np.array([0.3693, 0.3680, 0.1678]),
+    )
+    solid_index = int(np.nonzero(agent_data.n_subpoints[0] == 0)[0][0])
+    assert np.allclose(
+        agent_data.positions[0][solid_index],
+        scale_factor * np.array([0.3693, 0.3680, 0.1678]),
+    )
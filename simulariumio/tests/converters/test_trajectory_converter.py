@@ -2,8 +2,16 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
 
-from simulariumio import TrajectoryConverter, JsonWriter, DisplayData
+from simulariumio import (
+    TrajectoryConverter,
+    JsonWriter,
+    DisplayData,
+    AgentData,
+    TrajectoryData,
+    MetaData,
+)
 from simulariumio.tests.conftest import (
     fiber_agents_type_mapping,
     minimal_custom_data,
@@ -1435,3 +1443,126 @@ def test_get_display_data_for_agent(key, expected_data):
     assert expected_data == TrajectoryConverter._get_display_data_for_agent(
         key, display_dict
     )
+
+
+positions = np.array(
+    [
+        [[1.0, 2.0, 3.0], [-4.0, 5.0, 0.0], [100.0, 100.0, 100.0]],
+        [[0.0, -6.0, 2.0], [-100.0, -100.0, -100.0], [0.0, 0.0, 0.0]],
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "n_agents, expected_min, expected_max",
+    [
+        (np.array([2, 1]), [-4.0, -6.0, 0.0], [1.0, 5.0, 3.0]),
+        (np.array([3, 0]), [-4.0, 2.0, 0.0], [100.0, 100.0, 100.0]),
+        (None, [-100.0, -100.0, -100.0], [100.0, 100.0, 100.0]),
+    ],
+)
+def test_get_xyz_min_max(n_agents, expected_min, expected_max):
+    assert np.array_equal(
+        TrajectoryConverter.get_xyz_min(positions, n_agents), expected_min
+    )
+    assert np.array_equal(
+        TrajectoryConverter.get_xyz_max(positions, n_agents), expected_max
+    )
+
+
+@pytest.mark.parametrize(
+    "n_subpoints",
+    [
+        # whole XYZ points
+        np.array([[6, 0], [3, 3]]),
+        # values read one after another as XYZ points
+        np.array([[4, 0], [4, 4]]),
+    ],
+)
+def test_get_subpoints_xyz_min_max(n_subpoints):
+    subpoints = np.arange(24, dtype=float).reshape((2, 2, 6)) * np.array(
+        [1.0, -1.0, 2.0, -2.0, 0.5, -0.5]
+    )
+    xyz_subpoints = TrajectoryConverter.get_subpoints_xyz(subpoints, n_subpoints)
+    min_subpoints, max_subpoints = TrajectoryConverter.get_subpoints_xyz_min_max(
+        subpoints, n_subpoints
+    )
+    assert np.array_equal(min_subpoints, np.amin(xyz_subpoints[0], axis=0))
+    assert np.array_equal(max_subpoints, np.amax(xyz_subpoints[0], axis=0))
+
+
+@pytest.mark.parametrize("ragged", [False, True])
+def test_translate_positions(ragged):
+    agent_data = AgentData(
+        times=np.array([0.0, 1.0]),
+        n_agents=np.array([3, 1]),
+        viz_types=np.array([[1000.0, 1001.0, 1000.0], [1001.0, 1000.0, 1000.0]]),
+        unique_ids=np.array([[0, 1, 2], [1, 0, 0]]),
+        types=[["S", "F", "G"], ["F"]],
+        positions=np.zeros((2, 3, 3)),
+        radii=np.ones((2, 3)),
+        n_subpoints=np.array([[0, 6, 4], [3, 0, 0]]),
+        subpoints=np.array(
+            [
+                [6 * [0.0], [0.0, 0.0, 0.0, 1.0, 1.0, 1.0], [0.0, 0.0, 0.0, 1.0, 0, 0]],
+                [[2.0, 2.0, 2.0, 0, 0, 0], 6 * [0.0], 6 * [0.0]],
+            ]
+        ),
+        display_data={
+            "S": DisplayData(name="S", display_type=DISPLAY_TYPE.SPHERE),
+            "F": DisplayData(name="F", display_type=DISPLAY_TYPE.FIBER),
+            "G": DisplayData(name="G", display_type=DISPLAY_TYPE.SPHERE_GROUP),
+        },
+    )
+    if ragged:
+        agent_data.use_ragged_subpoints()
+    translation = np.array([1.0, 2.0, 3.0])
+    result = TrajectoryConverter.translate_positions(agent_data, translation)
+    # fibers translate their subpoints, other agents their position
+    assert np.array_equal(
+        result.positions[0], [[1.0, 2.0, 3.0], [0.0] * 3, [1.0, 2.0, 3.0]]
+    )
+    assert np.array_equal(result.positions[1][0], [0.0] * 3)
+    assert np.array_equal(result.get_subpoints(0, 1), [1.0, 2.0, 3.0, 2.0, 3.0, 4.0])
+    assert np.array_equal(result.get_subpoints(0, 2), [0.0, 0.0, 0.0, 1.0])
+    assert np.array_equal(result.get_subpoints(1, 0), [3.0, 4.0, 5.0])
+
+
+def test_per_type_plots():
+    converter = TrajectoryConverter(
+        TrajectoryData(
+            meta_data=MetaData(),
+            agent_data=AgentData(
+                times=np.array([0.0, 1.0]),
+                n_agents=np.array([3, 1]),
+                viz_types=1000.0 * np.ones((2, 3)),
+                unique_ids=np.array([[0, 1, 2], [0, 1, 2]]),
+                types=[["A#1", "B", "A#2"], ["B"]],
+                positions=np.array(
+                    [
+                        [[0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [2.0, 4.0, 6.0]],
+                        [[5.0, 5.0, 5.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
+                    ]
+                ),
+                radii=np.array([[1.0, 2.0, 3.0], [4.0, 0.0, 0.0]]),
+            ),
+        )
+    )
+    converter.add_number_of_agents_plot()
+    converter.add_mean_radius_plot()
+    converter.add_centroid_plot()
+    traces = [
+        {trace["name"]: trace["y"] for trace in plot["data"]}
+        for plot in converter._data.plots
+    ]
+    assert traces[0] == {"A": [2.0, 0.0], "B": [1.0, 1.0]}
+    # zero in frames without agents of the type
+    assert traces[1] == {"A": [2.0, 0.0], "B": [2.0, 4.0]}
+    assert traces[2] == {
+        "A X": [1.0, 0.0],
+        "A Y": [2.0, 0.0],
+        "A Z": [3.0, 0.0],
+        "B X": [1.0, 5.0],
+        "B Y": [1.0, 5.0],
+        "B Z": [1.0, 5.0],
+    }
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from simulariumio import AgentData, DisplayData, TrajectoryData, MetaData
+from simulariumio.filters import CropFilter
+from simulariumio.constants import DISPLAY_TYPE
+from simulariumio.exceptions import DataError
+
+
+def trajectory_data(ragged: bool = False) -> TrajectoryData:
+    n_subpoints = np.array([[0, 0, 6, 0], [0, 6, 0, 0]])
+    subpoints = np.zeros((2, 4, 6))
+    # the fiber at time 0 ends inside the region, the one at time 1 is outside
+    subpoints[0, 2] = [20.0, 0.0, 0.0, 4.0, 0.0, 0.0]
+    subpoints[1, 1] = [20.0, 0.0, 0.0, 30.0, 0.0, 0.0]
+    agent_data = AgentData(
+        times=np.array([0.0, 1.0]),
+        n_agents=np.array([4, 3]),
+        viz_types=np.array(
+            [[1000.0, 1000.0, 1001.0, 1000.0], [1000.0, 1001.0, 1000.0, 1000.0]]
+        ),
+        unique_ids=np.array([[0, 1, 2, 3], [10, 11, 12, 13]]),
+        types=[["A", "B", "F", "A"], ["B", "F", "A"]],
+        positions=np.array(
+            [
+                [[0.0, 0.0, 0.0], [4.0, 4.0, 4.0], [50.0, 0.0, 0.0], [6.0, 0.0, 0.0]],
+                [[1.0, -1.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, -5.5], [0.0] * 3],
+            ]
+        ),
+        radii=np.ones((2, 4)),
+        n_subpoints=n_subpoints,
+        subpoints=subpoints,
+        display_data={
+            "A": DisplayData(name="A", display_type=DISPLAY_TYPE.SPHERE),
+            "B": DisplayData(name="B", display_type=DISPLAY_TYPE.SPHERE),
+            "F": DisplayData(name="F", display_type=DISPLAY_TYPE.FIBER),
+        },
+    )
+    if ragged:
+        agent_data.use_ragged_subpoints()
+    return TrajectoryData(meta_data=MetaData(), agent_data=agent_data)
+
+
+@pytest.mark.parametrize("ragged", [False, True])
+@pytest.mark.parametrize(
+    "_filter, expected_unique_ids",
+    [
+        (CropFilter(size=np.array([10.0, 10.0, 10.0])), [[0, 1, 2], [10]]),
+        (CropFilter(radius=5.0), [[0, 2], [10]]),
+        (
+            CropFilter(center=np.array([0.0, 0.0, -5.0]), radius=1.0),
+            [[], [12]],
+        ),
+    ],
+)
+def test_crop_filter(_filter, expected_unique_ids, ragged):
+    result = _filter.apply(trajectory_data(ragged)).agent_data
+    assert np.array_equal(result.n_agents, [len(uids) for uids in expected_unique_ids])
+    # the buffers are sized for the kept agents
+    max_agents = max(len(uids) for uids in expected_unique_ids)
+    assert result.unique_ids.shape == (2, max_agents)
+    for time_index, uids in enumerate(expected_unique_ids):
+        assert result.unique_ids[time_index][: len(uids)].tolist() == uids
+        for agent_index, uid in enumerate(uids):
+            if uid == 2:
+                assert np.array_equal(
+                    result.get_subpoints(time_index, agent_index),
+                    [20.0, 0.0, 0.0, 4.0, 0.0, 0.0],
+                )
+
+
+def test_crop_filter_requires_one_region():
+    with pytest.raises(DataError):
+        CropFilter()
+    with pytest.raises(DataError):
+        CropFilter(size=np.ones(3), radius=1.0)
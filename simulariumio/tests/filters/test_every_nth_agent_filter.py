@@ -2,8 +2,17 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
 
-from simulariumio import FileConverter, InputFileData, JsonWriter, DisplayData
+from simulariumio import (
+    AgentData,
+    FileConverter,
+    InputFileData,
+    JsonWriter,
+    DisplayData,
+    TrajectoryData,
+    MetaData,
+)
 from simulariumio.filters import EveryNthAgentFilter
 from simulariumio.constants import (
     DEFAULT_CAMERA_SETTINGS,
@@ -684,3 +693,32 @@ def test_every_nth_agent_filter(input_path, display_data, _filter, expected_data
     buffer_data = JsonWriter.format_trajectory_data(filtered_data)
     assert expected_data == buffer_data
     assert JsonWriter._check_agent_ids_are_unique_per_frame(buffer_data)
+
+
+def test_every_nth_agent_filter_counts_per_frame_and_type():
+    types = [["A", "B", "A", "A", "B", "A", "C"], ["B", "A", "B", "B"]]
+    agent_data = AgentData(
+        times=np.array([0.0, 1.0]),
+        n_agents=np.array([7, 4]),
+        viz_types=1000.0 * np.ones((2, 7)),
+        unique_ids=np.array([np.arange(7), np.arange(10, 17)]),
+        types=types,
+        positions=np.zeros((2, 7, 3)),
+        radii=np.ones((2, 7)),
+        n_subpoints=np.array([[0, 0, 0, 3, 0, 0, 0], [6, 0, 0, 0, 0, 0, 0]]),
+        subpoints=np.arange(2 * 7 * 6).reshape((2, 7, 6)),
+    )
+    filtered_data = EveryNthAgentFilter(n_per_type={"A": 2, "C": 0}).apply(
+        TrajectoryData(meta_data=MetaData(), agent_data=agent_data)
+    )
+    result = filtered_data.agent_data
+    assert np.array_equal(result.n_agents, [4, 4])
+    # the buffers are sized for the kept agents
+    assert result.unique_ids.shape == (2, 4)
+    assert result.subpoints.shape == (2, 4, 6)
+    assert np.array_equal(result.unique_ids[0], [0, 1, 3, 4])
+    assert np.array_equal(result.unique_ids[1], [10, 11, 12, 13])
+    assert result.types == [["A", "B", "A", "B"], ["B", "A", "B", "B"]]
+    assert np.array_equal(result.n_subpoints, [[0, 0, 3, 0], [6, 0, 0, 0]])
+    assert np.array_equal(result.subpoints[0][2][:3], [18, 19, 20])
+    assert np.array_equal(result.subpoints[1][0], [42, 43, 44, 45, 46, 47])
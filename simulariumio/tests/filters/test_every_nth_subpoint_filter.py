@@ -2,8 +2,17 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
 
-from simulariumio import FileConverter, InputFileData, JsonWriter, DisplayData
+from simulariumio import (
+    AgentData,
+    FileConverter,
+    InputFileData,
+    JsonWriter,
+    DisplayData,
+    TrajectoryData,
+    MetaData,
+)
 from simulariumio.filters import EveryNthSubpointFilter
 from simulariumio.constants import (
     DEFAULT_CAMERA_SETTINGS,
@@ -816,3 +825,34 @@ def test_every_nth_subpoint_filter(input_path, display_data, _filter, expected_d
     buffer_data = JsonWriter.format_trajectory_data(filtered_data)
     assert expected_data == buffer_data
     assert JsonWriter._check_agent_ids_are_unique_per_frame(buffer_data)
+
+
+def test_every_nth_subpoint_filter_shrinks_subpoints():
+    agent_data = AgentData(
+        times=np.array([0.0]),
+        n_agents=np.array([3]),
+        viz_types=1000.0 * np.ones((1, 3)),
+        unique_ids=np.array([[0, 1, 2]]),
+        types=[["fiber", "group", "sphere"]],
+        positions=np.zeros((1, 3, 3)),
+        radii=np.ones((1, 3)),
+        n_subpoints=np.array([[15, 12, 0]]),
+        subpoints=np.array(
+            [[np.arange(15), np.arange(100, 115), np.zeros(15)]], dtype=float
+        ),
+        display_data={
+            "fiber": DisplayData(name="fiber", display_type=DISPLAY_TYPE.FIBER),
+            "group": DisplayData(name="group", display_type=DISPLAY_TYPE.SPHERE_GROUP),
+        },
+    )
+    filtered_data = EveryNthSubpointFilter(n_per_type={"group": 2}, default_n=3).apply(
+        TrajectoryData(meta_data=MetaData(), agent_data=agent_data)
+    )
+    result = filtered_data.agent_data
+    assert np.array_equal(result.n_subpoints, [[6, 8, 0]])
+    # the subpoints are sized for the kept values
+    assert result.subpoints.shape == (1, 3, 8)
+    assert np.array_equal(result.subpoints[0][0][:6], [0, 1, 2, 9, 10, 11])
+    assert np.array_equal(
+        result.subpoints[0][1], [100, 101, 102, 103, 108, 109, 110, 111]
+    )
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
 
 from simulariumio import FileConverter, InputFileData, JsonWriter, DisplayData
 from simulariumio.filters import EveryNthTimestepFilter
@@ -648,3 +649,42 @@ def test_every_nth_timestep_filter(input_path, display_data, _filter, expected_d
     buffer_data = JsonWriter.format_trajectory_data(filtered_data)
     assert expected_data == buffer_data
     assert JsonWriter._check_agent_ids_are_unique_per_frame(buffer_data)
+
+
+@pytest.mark.parametrize(
+    "contiguous, ragged",
+    [
+        (False, False),
+        (True, False),
+        (False, True),
+        (True, True),
+    ],
+)
+def test_every_nth_timestep_filter_views(contiguous, ragged):
+    converter = FileConverter(
+        input_file=InputFileData(
+            file_path=(
+                "simulariumio/tests/data/cytosim/aster_pull3D_couples_actin_solid_"
+                "3_frames/aster_pull3D_couples_actin_solid_3_frames_small.json"
+            )
+        ),
+    )
+    agent_data = converter._data.agent_data
+    if ragged:
+        agent_data.use_ragged_subpoints()
+    expected = JsonWriter.format_trajectory_data(
+        converter.filter_data([EveryNthTimestepFilter(n=2)])
+    )
+    filtered_data = converter.filter_data(
+        [EveryNthTimestepFilter(n=2, contiguous=contiguous)]
+    )
+    result = filtered_data.agent_data
+    assert np.array_equal(result.times, agent_data.times[::2])
+    assert result.types == agent_data.types.to_list()[::2]
+    for field_name in ["positions", "unique_ids", "n_subpoints"]:
+        shared = np.may_share_memory(
+            getattr(result, field_name), getattr(agent_data, field_name)
+        )
+        assert shared != contiguous
+        assert getattr(result, field_name).flags["C_CONTIGUOUS"] == contiguous
+    assert JsonWriter.format_trajectory_data(filtered_data) == expected
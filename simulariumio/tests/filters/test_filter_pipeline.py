@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import filecmp
+import json
+
+import pytest
+import numpy as np
+
+from simulariumio import (
+    AgentData,
+    BinaryWriter,
+    InputFileData,
+    JsonWriter,
+    LazyTrajectoryData,
+)
+from simulariumio.constants import BINARY_SETTINGS
+from simulariumio.cytosim import CytosimConverter, CytosimData, CytosimObjectInfo
+from simulariumio.filters import (
+    AddAgentsFilter,
+    EveryNthAgentFilter,
+    EveryNthSubpointFilter,
+    EveryNthTimestepFilter,
+    MultiplySpaceFilter,
+    MultiplyTimeFilter,
+    TimeWindowFilter,
+    TransformSpatialAxesFilter,
+    TranslateFilter,
+)
+
+
+def cytosim_converter() -> CytosimConverter:
+    return CytosimConverter(
+        CytosimData(
+            object_info={
+                "fibers": CytosimObjectInfo(
+                    cytosim_file=InputFileData(
+                        file_path=(
+                            "simulariumio/tests/data/cytosim/3_fibers_3_frames/test.txt"
+                        ),
+                    ),
+                )
+            },
+        )
+    )
+
+
+def new_agents(agent_data: AgentData) -> AgentData:
+    total_steps = agent_data.times.shape[0]
+    return AgentData(
+        times=agent_data.times,
+        n_agents=np.ones(total_steps),
+        viz_types=1000.0 * np.ones((total_steps, 1)),
+        unique_ids=1000 * np.ones((total_steps, 1)),
+        types=[["new agent"] for _ in range(total_steps)],
+        positions=np.ones((total_steps, 1, 3)),
+        radii=np.ones((total_steps, 1)),
+    )
+
+
+def agent_data_equal(agent_data: AgentData, other: AgentData) -> bool:
+    for field_name in AgentData.array_field_names():
+        value = getattr(agent_data, field_name)
+        other_value = getattr(other, field_name)
+        if isinstance(value, np.ndarray):
+            if value.shape != other_value.shape or not np.allclose(
+                value, other_value, equal_nan=True
+            ):
+                return False
+        elif value != other_value:
+            return False
+    return agent_data.display_data == other.display_data
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [TranslateFilter(default_translation=np.array([10.0, -5.0, 2.0]))],
+        [TransformSpatialAxesFilter(["-Z", "+X", "+Y"])],
+        [
+            EveryNthTimestepFilter(n=2),
+            TranslateFilter(default_translation=np.array([1.0, 2.0, 3.0])),
+        ],
+        [
+            EveryNthSubpointFilter(n_per_type={}, default_n=2),
+            MultiplySpaceFilter(multiplier=0.5),
+            MultiplyTimeFilter(multiplier=2.0, apply_to_plots=False),
+            TransformSpatialAxesFilter(["+Y", "+X", "-Z"]),
+        ],
+        ["add agents"],
+    ],
+)
+def test_filter_data_does_not_change_input(filters):
+    converter = cytosim_converter()
+    expected = copy.deepcopy(converter._data)
+    if filters == ["add agents"]:
+        filters = [AddAgentsFilter(new_agents(converter._data.agent_data))]
+    filtered = converter.filter_data(filters)
+    assert agent_data_equal(converter._data.agent_data, expected.agent_data)
+    assert converter._data.meta_data.box_size is not filtered.meta_data.box_size
+    assert not agent_data_equal(filtered.agent_data, expected.agent_data)
+
+
+def test_filter_data_copy_on_write():
+    converter = cytosim_converter()
+    agent_data = converter._data.agent_data
+    # filters that create new arrays don't need a copy of the input
+    filtered = converter.filter_data(
+        [EveryNthAgentFilter(n_per_type={}, default_n=1)]
+    ).agent_data
+    assert filtered.times is agent_data.times
+    # only the fields changed in place are copied
+    filtered = converter.filter_data(
+        [TranslateFilter(default_translation=np.array([1.0, 1.0, 1.0]))]
+    ).agent_data
+    assert filtered.unique_ids is agent_data.unique_ids
+    assert not np.may_share_memory(filtered.subpoints, agent_data.subpoints)
+    assert filtered.display_data is not agent_data.display_data
+
+
+def test_filter_data_in_place():
+    converter = cytosim_converter()
+    expected = copy.deepcopy(converter._data)
+    subpoints = converter._data.agent_data.subpoints
+    filtered = converter.filter_data(
+        [TranslateFilter(default_translation=np.array([1.0, 1.0, 1.0]))],
+        in_place=True,
+    )
+    assert filtered is converter._data
+    assert filtered.agent_data.subpoints is subpoints
+    assert not agent_data_equal(filtered.agent_data, expected.agent_data)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [],
+        [
+            TranslateFilter(default_translation=np.array([1.0, 2.0, 3.0])),
+            EveryNthTimestepFilter(n=2),
+            EveryNthSubpointFilter(n_per_type={}, default_n=2),
+            MultiplySpaceFilter(multiplier=0.5),
+            MultiplyTimeFilter(multiplier=2.0),
+        ],
+        [
+            EveryNthAgentFilter(n_per_type={}, default_n=2),
+            TransformSpatialAxesFilter(["-Z", "+X", "+Y"]),
+        ],
+        [
+            TimeWindowFilter(start_frame=1),
+            MultiplySpaceFilter(multiplier=0.5),
+        ],
+    ],
+)
+@pytest.mark.parametrize("ragged", [False, True])
+def test_filter_data_lazy(filters, ragged, tmp_path):
+    converter = cytosim_converter()
+    if ragged:
+        converter._data.agent_data.use_ragged_subpoints()
+    expected = copy.deepcopy(converter._data)
+    filtered = converter.filter_data(filters)
+    lazy = converter.filter_data(filters, lazy=True)
+    assert isinstance(lazy, LazyTrajectoryData)
+    assert lazy.total_timesteps() == filtered.agent_data.total_timesteps()
+    assert json.dumps(JsonWriter.format_trajectory_data(lazy)) == json.dumps(
+        JsonWriter.format_trajectory_data(filtered)
+    )
+    BinaryWriter.save(filtered, str(tmp_path / "eager"), True)
+    BinaryWriter.save(lazy, str(tmp_path / "lazy"), True)
+    assert filecmp.cmp(
+        tmp_path / "eager.simularium", tmp_path / "lazy.simularium", shallow=False
+    )
+    assert agent_data_equal(lazy.get_trajectory_data().agent_data, filtered.agent_data)
+    assert agent_data_equal(converter._data.agent_data, expected.agent_data)
+
+
+@pytest.mark.parametrize(
+    "cache_bytes, expected_n_filters_per_frame",
+    [(BINARY_SETTINGS.LAZY_FRAME_CACHE_BYTES, 1), (0, 2)],
+)
+def test_filter_data_lazy_binary_filters_frames_once(
+    cache_bytes, expected_n_filters_per_frame, tmp_path, monkeypatch
+):
+    converter = cytosim_converter()
+    filters = [TranslateFilter(default_translation=np.array([1.0, 2.0, 3.0]))]
+    filtered = converter.filter_data(filters)
+    lazy = converter.filter_data(filters, lazy=True)
+    filtered_frames = []
+    get_frame = lazy.get_frame
+
+    def counted_get_frame(time_index: int) -> AgentData:
+        filtered_frames.append(time_index)
+        return get_frame(time_index)
+
+    monkeypatch.setattr(lazy, "get_frame", counted_get_frame)
+    monkeypatch.setattr(BINARY_SETTINGS, "LAZY_FRAME_CACHE_BYTES", cache_bytes)
+    BinaryWriter.save(filtered, str(tmp_path / "eager"), True)
+    BinaryWriter.save(lazy, str(tmp_path / "lazy"), True)
+    assert filecmp.cmp(
+        tmp_path / "eager.simularium", tmp_path / "lazy.simularium", shallow=False
+    )
+    total_steps = lazy.total_timesteps()
+    assert sorted(filtered_frames) == sorted(
+        expected_n_filters_per_frame * list(range(total_steps))
+    )
+
+
+def test_filter_data_lazy_after_add_agents():
+    converter = cytosim_converter()
+    filters = [
+        AddAgentsFilter(new_agents(converter._data.agent_data)),
+        TranslateFilter(default_translation=np.array([1.0, 1.0, 1.0])),
+    ]
+    lazy = converter.filter_data(filters, lazy=True)
+    # filters that can't be applied to each frame are applied first
+    assert lazy.filters == filters[1:]
+    assert lazy.data.agent_data.types[0][-1] == "new agent"
+    assert agent_data_equal(
+        lazy.get_trajectory_data().agent_data,
+        converter.filter_data(filters).agent_data,
+    )
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+@pytest.mark.parametrize("ragged", [False, True])
+def test_filter_data_parallel(use_processes, ragged):
+    converter = cytosim_converter()
+    if ragged:
+        converter._data.agent_data.use_ragged_subpoints()
+    expected = copy.deepcopy(converter._data)
+    filters = [
+        TranslateFilter(default_translation=np.array([1.0, 2.0, 3.0])),
+        EveryNthTimestepFilter(n=2),
+        EveryNthSubpointFilter(n_per_type={}, default_n=2),
+        MultiplyTimeFilter(multiplier=2.0),
+    ]
+    filtered = converter.filter_data(filters)
+    parallel = converter.filter_data(filters, n_workers=2, use_processes=use_processes)
+    assert parallel.agent_data.has_ragged_subpoints() == ragged
+    assert json.dumps(JsonWriter.format_trajectory_data(parallel)) == json.dumps(
+        JsonWriter.format_trajectory_data(filtered)
+    )
+    assert agent_data_equal(converter._data.agent_data, expected.agent_data)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from simulariumio import (
+    AgentData,
+    CameraData,
+    DisplayData,
+    TrajectoryData,
+    MetaData,
+)
+from simulariumio.filters import LevelOfDetailFilter
+from simulariumio.constants import DISPLAY_TYPE
+from simulariumio.exceptions import DataError
+
+
+def spheres_data(camera_defaults: CameraData = None) -> TrajectoryData:
+    # 100 agents along the X axis, in reverse order in the second frame
+    unique_ids = np.array([np.arange(100), np.arange(100)[::-1]])
+    positions = np.zeros((2, 100, 3))
+    positions[:, :, 0] = unique_ids
+    return TrajectoryData(
+        meta_data=MetaData(
+            camera_defaults=camera_defaults
+            if camera_defaults is not None
+            else CameraData(look_at_position=np.zeros(3))
+        ),
+        agent_data=AgentData(
+            times=np.array([0.0, 1.0]),
+            n_agents=np.array([100, 100]),
+            viz_types=1000.0 * np.ones((2, 100)),
+            unique_ids=unique_ids,
+            types=[100 * ["A"], 100 * ["A"]],
+            positions=positions,
+            radii=np.ones((2, 100)),
+        ),
+    )
+
+
+def test_level_of_detail_filter_agents():
+    result = (
+        LevelOfDetailFilter(distances=[10.0, 50.0], keep_ratios=[1.0, 0.5, 0.0])
+        .apply(spheres_data())
+        .agent_data
+    )
+    kept = [
+        set(result.unique_ids[time_index, : int(result.n_agents[time_index])])
+        for time_index in range(2)
+    ]
+    # the same agents are kept in each frame
+    assert kept[0] == kept[1]
+    assert set(range(10)) <= kept[0]
+    assert not any(uid >= 50 for uid in kept[0])
+    assert 10 < len(kept[0] - set(range(10))) < 30
+    # the buffers are sized for the kept agents
+    assert result.unique_ids.shape == (2, len(kept[0]))
+
+
+def test_level_of_detail_filter_camera_focus():
+    result = (
+        LevelOfDetailFilter(distances=[5.0], keep_ratios=[1.0, 0.0])
+        .apply(spheres_data(CameraData(look_at_position=np.array([50.0, 0.0, 0.0]))))
+        .agent_data
+    )
+    assert np.array_equal(result.n_agents, [9, 9])
+    assert sorted(result.unique_ids[0]) == list(range(46, 55))
+
+
+@pytest.mark.parametrize("ragged", [False, True])
+def test_level_of_detail_filter_fiber_points(ragged):
+    # a fiber with 21 points along the X axis, 5 apart,
+    # and a sphere group that isn't decimated
+    fiber_points = np.zeros((21, 3))
+    fiber_points[:, 0] = 5.0 * np.arange(21)
+    subpoints = np.zeros((1, 2, 63))
+    subpoints[0, 0] = fiber_points.flatten()
+    subpoints[0, 1, :8] = [100.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+    agent_data = AgentData(
+        times=np.array([0.0]),
+        n_agents=np.array([2]),
+        viz_types=np.array([[1001.0, 1000.0]]),
+        unique_ids=np.array([[0, 1]]),
+        types=[["fiber", "group"]],
+        positions=np.zeros((1, 2, 3)),
+        radii=np.ones((1, 2)),
+        n_subpoints=np.array([[63, 8]]),
+        subpoints=subpoints,
+        display_data={
+            "fiber": DisplayData(name="fiber", display_type=DISPLAY_TYPE.FIBER),
+            "group": DisplayData(name="group", display_type=DISPLAY_TYPE.SPHERE_GROUP),
+        },
+    )
+    if ragged:
+        agent_data.use_ragged_subpoints()
+    result = (
+        LevelOfDetailFilter(
+            distances=[10.0, 50.0], keep_ratios=[1.0, 0.5, 0.0], focus=np.zeros(3)
+        )
+        .apply(TrajectoryData(meta_data=MetaData(), agent_data=agent_data))
+        .agent_data
+    )
+    assert np.array_equal(result.n_agents, [2])
+    kept_x = result.get_subpoints(0, 0)[::3]
+    # every point before 10, every other point before 50, then the end point
+    assert kept_x.tolist() == [0.0, 5.0, 10.0, 20.0, 30.0, 40.0, 100.0]
+    assert np.array_equal(
+        result.get_subpoints(0, 1), [100.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+    )
+
+
+def test_level_of_detail_filter_invalid_bands():
+    with pytest.raises(DataError):
+        LevelOfDetailFilter(distances=[10.0], keep_ratios=[1.0])
+    with pytest.raises(DataError):
+        LevelOfDetailFilter(distances=[10.0, 5.0], keep_ratios=[1.0, 0.5, 0.1])
+    with pytest.raises(DataError):
+        LevelOfDetailFilter(distances=[10.0], keep_ratios=[1.0, 2.0])
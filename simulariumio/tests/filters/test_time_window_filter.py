@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from MDAnalysis import Universe
+
+from simulariumio import (
+    AgentData,
+    TrajectoryData,
+    MetaData,
+    InputFileData,
+    JsonWriter,
+)
+from simulariumio.filters import TimeWindowFilter
+from simulariumio.smoldyn import SmoldynConverter, SmoldynData
+from simulariumio.cytosim import CytosimConverter, CytosimData, CytosimObjectInfo
+from simulariumio.md import MdConverter, MdData
+from simulariumio.exceptions import DataError
+
+
+def trajectory_data() -> TrajectoryData:
+    return TrajectoryData(
+        meta_data=MetaData(),
+        agent_data=AgentData(
+            times=0.5 * np.arange(6),
+            n_agents=np.array(6 * [2]),
+            viz_types=1000.0 * np.ones((6, 2)),
+            unique_ids=np.array(6 * [[0, 1]]),
+            types=6 * [["A", "B"]],
+            positions=np.arange(36, dtype=float).reshape((6, 2, 3)),
+            radii=np.ones((6, 2)),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "_filter, expected_times",
+    [
+        (TimeWindowFilter(start_frame=2), [1.0, 1.5, 2.0, 2.5]),
+        (TimeWindowFilter(start_frame=1, end_frame=3), [0.5, 1.0]),
+        (TimeWindowFilter(start_time=0.75, end_time=2.0), [1.0, 1.5, 2.0]),
+        (TimeWindowFilter(end_time=1.0, start_frame=1), [0.5, 1.0]),
+        (TimeWindowFilter(start_time=3.0), []),
+    ],
+)
+def test_time_window_filter(_filter, expected_times):
+    data = trajectory_data()
+    positions = data.agent_data.positions
+    result = _filter.apply(data).agent_data
+    assert result.total_timesteps() == len(expected_times)
+    assert np.array_equal(result.times, expected_times)
+    # the kept timesteps are views of the input data
+    if len(expected_times) > 0:
+        assert np.may_share_memory(result.positions, positions)
+        first_index = int(2 * expected_times[0])
+        assert np.array_equal(result.positions[0], positions[first_index])
+
+
+def test_time_window_filter_frames_must_not_be_negative():
+    with pytest.raises(DataError):
+        TimeWindowFilter(start_frame=-1)
+    with pytest.raises(DataError):
+        TimeWindowFilter(end_frame=-2)
+
+
+def assert_same_output(windowed_data: TrajectoryData, data: TrajectoryData):
+    assert JsonWriter.format_trajectory_data(
+        windowed_data
+    ) == JsonWriter.format_trajectory_data(data)
+
+
+@pytest.mark.parametrize(
+    "time_window",
+    [
+        TimeWindowFilter(start_frame=1, end_frame=3),
+        TimeWindowFilter(start_time=0.005, end_time=0.01),
+        TimeWindowFilter(end_frame=2),
+    ],
+)
+def test_smoldyn_time_window(time_window):
+    def smoldyn_data(time_window=None):
+        return SmoldynData(
+            meta_data=MetaData(scale_factor=1.0),
+            smoldyn_file=InputFileData(
+                file_path="simulariumio/tests/data/smoldyn/example_3D.txt"
+            ),
+            center=False,
+            time_window=time_window,
+        )
+
+    assert_same_output(
+        SmoldynConverter(smoldyn_data(time_window))._data,
+        time_window.apply(SmoldynConverter(smoldyn_data())._data),
+    )
+
+
+@pytest.mark.parametrize(
+    "time_window",
+    [
+        TimeWindowFilter(start_frame=1),
+        TimeWindowFilter(start_time=0.05, end_time=0.05),
+    ],
+)
+def test_cytosim_time_window(time_window):
+    def cytosim_data(time_window=None):
+        path = (
+            "simulariumio/tests/data/cytosim/aster_pull3D_couples_actin_solid_3_frames"
+        )
+        return CytosimData(
+            meta_data=MetaData(scale_factor=1.0),
+            object_info={
+                "fibers": CytosimObjectInfo(
+                    cytosim_file=InputFileData(file_path=f"{path}/fiber_points.txt"),
+                ),
+                "solids": CytosimObjectInfo(
+                    cytosim_file=InputFileData(file_path=f"{path}/solids.txt"),
+                ),
+            },
+            time_window=time_window,
+        )
+
+    assert_same_output(
+        CytosimConverter(cytosim_data(time_window))._data,
+        time_window.apply(CytosimConverter(cytosim_data())._data),
+    )
+
+
+@pytest.mark.parametrize(
+    "time_window",
+    [
+        TimeWindowFilter(start_frame=1, end_frame=2),
+        TimeWindowFilter(start_time=1.0),
+    ],
+)
+def test_md_time_window(time_window):
+    def md_data(time_window=None):
+        return MdData(
+            meta_data=MetaData(scale_factor=1.0),
+            md_universe=Universe("simulariumio/tests/data/md/example.xyz"),
+            time_window=time_window,
+        )
+
+    assert_same_output(
+        MdConverter(md_data(time_window))._data,
+        time_window.apply(MdConverter(md_data())._data),
+    )
@@ -2,9 +2,19 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
 
-from simulariumio import FileConverter, InputFileData, JsonWriter, DisplayData
+from simulariumio import (
+    AgentData,
+    FileConverter,
+    InputFileData,
+    JsonWriter,
+    DisplayData,
+    TrajectoryData,
+    MetaData,
+)
 from simulariumio.filters import TransformSpatialAxesFilter
+from simulariumio.exceptions import DataError
 from simulariumio.constants import (
     DEFAULT_CAMERA_SETTINGS,
     CURRENT_VERSION,
@@ -252,3 +262,46 @@ def test_transform_spatial_axes_filter(
     buffer_data = JsonWriter.format_trajectory_data(filtered_data)
     assert expected_data == buffer_data
     assert JsonWriter._check_agent_ids_are_unique_per_frame(buffer_data)
+
+
+def test_transform_spatial_axes_filter_sphere_groups():
+    agent_data = AgentData(
+        times=np.array([0.0]),
+        n_agents=np.array([2]),
+        viz_types=1000.0 * np.ones((1, 2)),
+        unique_ids=np.array([[0, 1]]),
+        types=[["fiber", "group"]],
+        positions=np.array([[[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]]),
+        radii=np.ones((1, 2)),
+        n_subpoints=np.array([[6, 8]]),
+        subpoints=np.array([[[1, 2, 3, 4, 5, 6, 0, 0], [1, 2, 3, 0.5, 4, 5, 6, 0.25]]]),
+        display_data={
+            "fiber": DisplayData(name="fiber", display_type=DISPLAY_TYPE.FIBER),
+            "group": DisplayData(name="group", display_type=DISPLAY_TYPE.SPHERE_GROUP),
+        },
+    )
+    filtered_data = TransformSpatialAxesFilter(["-Z", "+X", "-Y"]).apply(
+        TrajectoryData(
+            meta_data=MetaData(box_size=np.array([10.0, 20.0, 30.0])),
+            agent_data=agent_data,
+        )
+    )
+    result = filtered_data.agent_data
+    assert np.allclose(filtered_data.meta_data.box_size, [30, 10, 20])
+    assert np.allclose(result.positions[0], [[-3, 1, -2], [-6, 4, -5]])
+    assert np.allclose(result.subpoints[0][0][:6], [-3, 1, -2, -6, 4, -5])
+    # sphere group radii are not transformed
+    assert np.allclose(result.subpoints[0][1], [-3, 1, -2, 0.5, -6, 4, -5, 0.25])
+
+
+@pytest.mark.parametrize(
+    "axes_mapping",
+    [
+        ["+X", "+Y"],
+        ["+X", "+Y", "+W"],
+        ["+X", "+Y", "+XZ"],
+    ],
+)
+def test_transform_spatial_axes_filter_invalid_mapping(axes_mapping):
+    with pytest.raises(DataError):
+        TransformSpatialAxesFilter(axes_mapping)
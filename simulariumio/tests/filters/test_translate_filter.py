@@ -4,7 +4,15 @@
 import pytest
 import numpy as np
 
-from simulariumio import FileConverter, InputFileData, JsonWriter, DisplayData
+from simulariumio import (
+    AgentData,
+    FileConverter,
+    InputFileData,
+    JsonWriter,
+    DisplayData,
+    TrajectoryData,
+    MetaData,
+)
 from simulariumio.filters import TranslateFilter
 from simulariumio.constants import (
     DEFAULT_CAMERA_SETTINGS,
@@ -253,3 +261,57 @@ def test_translate_filter(input_path, display_data, _filter, expected_data):
     filtered_data = converter.filter_data([_filter])
     buffer_data = JsonWriter.format_trajectory_data(filtered_data)
     assert expected_data == buffer_data
+
+
+def test_translate_filter_display_types():
+    # a fiber, a sphere group, a sphere, and a fiber without display data
+    agent_data = AgentData(
+        times=np.array([0.0, 1.0]),
+        n_agents=np.array([4, 3]),
+        viz_types=1000.0 * np.ones((2, 4)),
+        unique_ids=np.array([[0, 1, 2, 3], [0, 1, 2, 0]]),
+        types=[["fiber", "group", "sphere", "other"], ["fiber", "group", "sphere"]],
+        positions=np.zeros((2, 4, 3)),
+        radii=np.ones((2, 4)),
+        n_subpoints=np.array([[6, 4, 0, 3], [3, 8, 0, 0]]),
+        subpoints=np.array(
+            [
+                [
+                    [0, 1, 2, 3, 4, 5, 0, 0],
+                    [1, 1, 1, 5, 0, 0, 0, 0],
+                    8 * [0],
+                    [1, 2, 3, 0, 0, 0, 0, 0],
+                ],
+                [
+                    [1, 1, 1, 0, 0, 0, 0, 0],
+                    [1, 1, 1, 5, 2, 2, 2, 5],
+                    8 * [0],
+                    8 * [0],
+                ],
+            ],
+            dtype=float,
+        ),
+        display_data={
+            "fiber": DisplayData(name="fiber", display_type=DISPLAY_TYPE.FIBER),
+            "group": DisplayData(name="group", display_type=DISPLAY_TYPE.SPHERE_GROUP),
+            "sphere": DisplayData(name="sphere", display_type=DISPLAY_TYPE.SPHERE),
+        },
+    )
+    filtered_data = TranslateFilter(
+        translation_per_type={"fiber": np.array([10, 20, 30])},
+        default_translation=np.array([-1.0, -2.0, -3.0]),
+    ).apply(TrajectoryData(meta_data=MetaData(), agent_data=agent_data))
+    result = filtered_data.agent_data
+    # fibers translate subpoints, other agents translate positions
+    assert np.allclose(
+        result.positions[0], [[0, 0, 0], [-1, -2, -3], [-1, -2, -3], [0, 0, 0]]
+    )
+    assert np.allclose(
+        result.positions[1], [[0, 0, 0], [-1, -2, -3], [-1, -2, -3], [0, 0, 0]]
+    )
+    assert np.allclose(result.subpoints[0][0][:6], [10, 21, 32, 13, 24, 35])
+    assert np.allclose(result.subpoints[0][1][:4], [1, 1, 1, 5])
+    assert np.allclose(result.subpoints[0][3][:3], [0, 0, 0])
+    assert np.allclose(result.subpoints[1][0][:3], [11, 21, 31])
+    assert np.allclose(result.subpoints[1][1], [1, 1, 1, 5, 2, 2, 2, 5])
+    assert result.display_data["other"].display_type == DISPLAY_TYPE.FIBER
@@ -2,13 +2,21 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import numpy as np
 
 from simulariumio import (
+    AgentData,
+    BinaryWriter,
+    DisplayData,
     FileConverter,
     InputFileData,
+    MetaData,
     TrajectoryConverter,
+    TrajectoryData,
     JsonWriter,
 )
+from simulariumio.constants import DISPLAY_TYPE, V1_SPATIAL_BUFFER_STRUCT, VIZ_TYPE
+from simulariumio.readers import SimulariumBinaryReader
 from simulariumio.tests.conftest import binary_test_data, assert_buffers_equal
 
 
@@ -56,3 +64,104 @@ def test_binary_parsing(
             expected_converter._data
         )
         assert_buffers_equal(test_buffer_data, expected_buffer_data)
+
+
+def one_frame_data(n_subpoints: np.ndarray) -> TrajectoryData:
+    n_agents = n_subpoints.shape[0]
+    rng = np.random.default_rng(0)
+    return TrajectoryData(
+        meta_data=MetaData(box_size=np.array([100.0, 100.0, 100.0])),
+        agent_data=AgentData(
+            times=np.array([0.5]),
+            n_agents=np.array([n_agents]),
+            viz_types=np.where(
+                n_subpoints > 0, VIZ_TYPE.FIBER, VIZ_TYPE.DEFAULT
+            ).reshape((1, n_agents)),
+            unique_ids=np.arange(n_agents).reshape((1, n_agents)),
+            types=[["F" if n > 0 else "A" for n in n_subpoints]],
+            positions=rng.uniform(-10.0, 10.0, size=(1, n_agents, 3)),
+            radii=rng.uniform(1.0, 2.0, size=(1, n_agents)),
+            n_subpoints=n_subpoints.reshape((1, n_agents)),
+            subpoints=rng.uniform(-10.0, 10.0, size=(1, n_agents, 6)),
+            display_data={
+                "A": DisplayData(name="A", display_type=DISPLAY_TYPE.SPHERE),
+                "F": DisplayData(name="F", display_type=DISPLAY_TYPE.FIBER),
+            },
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "n_subpoints",
+    [
+        # none of the agents have subpoints, so they start at even intervals
+        np.array([0, 0, 0, 0]),
+        # every agent has the same number of subpoints
+        np.array([6, 6, 6, 6]),
+        # a mix of agents with and without subpoints
+        np.array([0, 6, 0, 3]),
+    ],
+)
+def test_binary_frame_decoding(n_subpoints, tmp_path):
+    data = one_frame_data(n_subpoints)
+    output_path = str(tmp_path / "test")
+    BinaryWriter.save(data, output_path, True)
+    input_file = InputFileData(file_path=f"{output_path}.simularium")
+    # the public reader output has lists of values, as it always has
+    buffer_data = SimulariumBinaryReader.load_binary(input_file)
+    frame_data = buffer_data["spatialData"]["bundleData"][0]["data"]
+    assert isinstance(frame_data, list)
+    expected_starts = np.zeros_like(n_subpoints)
+    np.cumsum(
+        V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT + n_subpoints[:-1],
+        out=expected_starts[1:],
+    )
+    assert np.array_equal(
+        AgentData._get_frame_agent_starts(np.array(frame_data)), expected_starts
+    )
+    # decoding float32 views of the file matches decoding the lists
+    expected_buffer_data = JsonWriter.format_trajectory_data(
+        TrajectoryConverter(TrajectoryData.from_buffer_data(buffer_data))._data
+    )
+    test_converter = FileConverter(input_file=input_file)
+    assert_buffers_equal(
+        JsonWriter.format_trajectory_data(test_converter._data),
+        expected_buffer_data,
+    )
+    agent_data = test_converter._data.agent_data
+    assert np.array_equal(agent_data.n_subpoints[0], n_subpoints)
+    assert np.allclose(agent_data.positions, data.agent_data.positions, atol=1e-5)
+    for agent_index, n in enumerate(n_subpoints):
+        assert np.allclose(
+            agent_data.get_subpoints(0, agent_index),
+            data.agent_data.subpoints[0][agent_index][:n],
+            atol=1e-5,
+        )
+
+
+def test_binary_frame_data_is_not_copied():
+    input_path = "simulariumio/tests/data/binary/binary_test.binary"
+    with open(input_path, "rb") as open_file:
+        file_contents = open_file.read()
+    input_file = InputFileData(file_path=input_path, memory_map=True)
+    mapped_contents = input_file.get_contents()
+    buffer_data = SimulariumBinaryReader.load_binary(
+        input_file, parse_spatial_data_as_binary=True
+    )
+    expected_buffer_data = SimulariumBinaryReader.load_binary(
+        InputFileData(file_path=input_path)
+    )
+    bundle_data = buffer_data["spatialData"]["bundleData"]
+    expected_bundle_data = expected_buffer_data["spatialData"]["bundleData"]
+    assert len(bundle_data) == len(expected_bundle_data)
+    for frame, expected_frame in zip(bundle_data, expected_bundle_data):
+        # each frame's data is a view of the memory mapped file
+        assert isinstance(frame["data"], memoryview)
+        assert frame["data"].obj is mapped_contents
+        assert frame["data"].tobytes() in file_contents
+        assert np.array_equal(
+            np.frombuffer(frame["data"], dtype="<f4"), expected_frame["data"]
+        )
+        frame["data"].release()
+    input_file.close()
+    assert mapped_contents.closed
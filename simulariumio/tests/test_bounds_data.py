@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from simulariumio import (
+    AgentData,
+    BoundsData,
+    DimensionData,
+    TrajectoryConverter,
+)
+
+
+def agent_data(dtype: np.dtype, ragged: bool) -> AgentData:
+    rng = np.random.default_rng(0)
+    result = AgentData.from_dimensions(
+        DimensionData(total_steps=3, max_agents=4, max_subpoints=8), dtype=dtype
+    )
+    result.n_agents[:] = [4, 2, 3]
+    result.positions[:] = rng.normal(size=result.positions.shape)
+    result.radii[:] = rng.uniform(size=result.radii.shape)
+    # subpoints that are whole XYZ points and subpoints that aren't
+    result.n_subpoints[:] = [[6, 0, 4, 0], [8, 3, 0, 0], [0, 0, 3, 0]]
+    result.subpoints[:] = 10.0 * rng.normal(size=result.subpoints.shape)
+    if ragged:
+        result.use_ragged_subpoints()
+    return result
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize("ragged", [False, True])
+def test_bounds_data_matches_scan(dtype, ragged):
+    data = agent_data(dtype, ragged)
+    bounds = BoundsData()
+    assert bounds.is_empty()
+    for time_index in range(3):
+        bounds.add_frame(data, time_index)
+    expected_min, expected_max = TrajectoryConverter.get_min_max_positions(data)
+    min_dimensions, max_dimensions = bounds.get_min_max()
+    assert min_dimensions.dtype == expected_min.dtype
+    assert np.array_equal(min_dimensions, expected_min)
+    assert np.array_equal(max_dimensions, expected_max)
+    assert TrajectoryConverter.calculate_scale_factor(
+        data, bounds
+    ) == TrajectoryConverter.calculate_scale_factor(data)
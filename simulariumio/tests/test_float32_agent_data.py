@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from simulariumio import (
+    AgentData,
+    BinaryWriter,
+    DimensionData,
+    InputFileData,
+    JsonWriter,
+    TrajectoryConverter,
+)
+from simulariumio.cytosim import CytosimConverter, CytosimData, CytosimObjectInfo
+from simulariumio.smoldyn import SmoldynConverter, SmoldynData
+from simulariumio.filters import (
+    EveryNthAgentFilter,
+    EveryNthSubpointFilter,
+    EveryNthTimestepFilter,
+    MultiplySpaceFilter,
+    TransformSpatialAxesFilter,
+    TranslateFilter,
+)
+
+
+def cytosim_converter(dtype: np.dtype) -> CytosimConverter:
+    return CytosimConverter(
+        CytosimData(
+            object_info={
+                "fibers": CytosimObjectInfo(
+                    cytosim_file=InputFileData(
+                        file_path=(
+                            "simulariumio/tests/data/cytosim/3_fibers_3_frames/test.txt"
+                        ),
+                    ),
+                )
+            },
+            dtype=dtype,
+        )
+    )
+
+
+def smoldyn_converter(dtype: np.dtype) -> SmoldynConverter:
+    return SmoldynConverter(
+        SmoldynData(
+            smoldyn_file=InputFileData(
+                file_path="simulariumio/tests/data/smoldyn/example_data.txt"
+            ),
+            dtype=dtype,
+        )
+    )
+
+
+def assert_spatial_dtype(agent_data: AgentData, dtype: np.dtype):
+    assert agent_data.dtype == dtype
+    assert agent_data.positions.dtype == dtype
+    assert agent_data.radii.dtype == dtype
+    assert agent_data.rotations.dtype == dtype
+    assert agent_data.subpoints.dtype == dtype
+
+
+def test_from_dimensions_dtype():
+    agent_data = AgentData.from_dimensions(
+        DimensionData(total_steps=2, max_agents=3, max_subpoints=6),
+        dtype=np.float32,
+    )
+    assert_spatial_dtype(agent_data, np.float32)
+    bigger = agent_data.get_copy_with_increased_buffer_size(
+        DimensionData(total_steps=2, max_agents=3), axis=1
+    )
+    assert_spatial_dtype(bigger, np.float32)
+    # dtype is inferred from float positions, otherwise float64
+    agent_data = AgentData(
+        times=[0.0],
+        n_agents=[1],
+        viz_types=[[1000.0]],
+        unique_ids=[[0]],
+        types=[["A"]],
+        positions=np.zeros((1, 1, 3), dtype=np.float32),
+        radii=[[1.0]],
+    )
+    assert_spatial_dtype(agent_data, np.float32)
+    agent_data = AgentData(
+        times=[0.0],
+        n_agents=[1],
+        viz_types=[[1000.0]],
+        unique_ids=[[0]],
+        types=[["A"]],
+        positions=[[[0, 0, 0]]],
+        radii=[[1]],
+    )
+    assert_spatial_dtype(agent_data, np.float64)
+
+
+@pytest.mark.parametrize(
+    "get_converter, filters",
+    [
+        (smoldyn_converter, []),
+        (smoldyn_converter, [EveryNthAgentFilter(n_per_type={}, default_n=2)]),
+        (smoldyn_converter, [EveryNthTimestepFilter(n=2)]),
+        (cytosim_converter, []),
+        (
+            cytosim_converter,
+            [
+                TranslateFilter(default_translation=np.array([10.0, -5.0, 2.0])),
+                TransformSpatialAxesFilter(["-Z", "+X", "+Y"]),
+                EveryNthSubpointFilter(n_per_type={}, default_n=2),
+                MultiplySpaceFilter(multiplier=0.5),
+            ],
+        ),
+    ],
+)
+def test_float32_pipeline(get_converter, filters):
+    converter64 = get_converter(np.float64)
+    converter32 = get_converter(np.float32)
+    assert_spatial_dtype(converter32._data.agent_data, np.float32)
+    data64 = converter64.filter_data(filters)
+    data32 = converter32.filter_data(filters)
+    assert_spatial_dtype(data32.agent_data, np.float32)
+    assert data32.agent_data == data64.agent_data
+    # the binary format stores float32 values either way
+    binary64 = BinaryWriter.format_trajectory_data(data64)
+    binary32 = BinaryWriter.format_trajectory_data(data32)
+    assert len(binary64) == len(binary32)
+    json64 = JsonWriter.format_trajectory_data(data64)
+    json32 = JsonWriter.format_trajectory_data(data32)
+    for frame64, frame32 in zip(
+        json64["spatialData"]["bundleData"], json32["spatialData"]["bundleData"]
+    ):
+        assert np.allclose(frame64["data"], frame32["data"], rtol=1e-5, atol=1e-4)
+    assert TrajectoryConverter(data32).to_JSON()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import mmap
+
 import pytest
 
 from simulariumio import InputFileData
@@ -54,3 +56,34 @@ def test_input_data_binary(file_to_read, is_binary):
         content = open_binary_file.read()
         file_data = InputFileData(file_contents=content)
         assert file_data._is_binary() == is_binary
+
+
+@pytest.mark.parametrize(
+    "input_path, is_binary",
+    [
+        (
+            (
+                "simulariumio/tests/data/cytosim/aster_pull3D_couples_actin"
+                "_solid_3_frames/aster_pull3D_couples_actin_solid_3_frames.json"
+            ),
+            False,
+        ),
+        (
+            (
+                "simulariumio/tests/data/binary/"
+                "50filaments_motor_linker_binary.binary"
+            ),
+            True,
+        ),
+    ],
+)
+def test_input_data_memory_map(input_path, is_binary):
+    input_file = InputFileData(file_path=input_path, memory_map=True)
+    contents = input_file.get_contents()
+    # only binary files are memory mapped
+    assert isinstance(contents, mmap.mmap) == is_binary
+    with open(input_path, "rb" if is_binary else "r") as open_file:
+        assert contents[:] == open_file.read()
+    input_file.close()
+    if is_binary:
+        assert contents.closed
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+
+import pytest
+import numpy as np
+
+from simulariumio import (
+    AgentData,
+    DimensionData,
+    DisplayData,
+    FileConverter,
+    InputFileData,
+    JsonWriter,
+    TrajectoryConverter,
+)
+from simulariumio.constants import DISPLAY_TYPE
+from simulariumio.filters import (
+    AddAgentsFilter,
+    EveryNthAgentFilter,
+    EveryNthSubpointFilter,
+    EveryNthTimestepFilter,
+    MultiplySpaceFilter,
+    TransformSpatialAxesFilter,
+    TranslateFilter,
+)
+
+input_path = (
+    "simulariumio/tests/data/cytosim/aster_pull3D_couples_actin_solid_3_frames"
+    "/aster_pull3D_couples_actin_solid_3_frames_small.json"
+)
+
+
+def padded_and_ragged_converters():
+    padded = FileConverter(input_file=InputFileData(file_path=input_path))
+    ragged = FileConverter(input_file=InputFileData(file_path=input_path))
+    ragged._data.agent_data.use_ragged_subpoints()
+    return padded, ragged
+
+
+def test_ragged_subpoints_layout():
+    padded, ragged = padded_and_ragged_converters()
+    agent_data = ragged._data.agent_data
+    assert agent_data.has_ragged_subpoints()
+    assert agent_data.subpoints.ndim == 1
+    assert agent_data.subpoints.shape[0] == int(np.sum(agent_data.n_subpoints))
+    assert agent_data == padded._data.agent_data
+    assert copy.deepcopy(agent_data) == padded._data.agent_data
+    agent_data.use_padded_subpoints()
+    assert not agent_data.has_ragged_subpoints()
+    assert agent_data == padded._data.agent_data
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [],
+        [TranslateFilter(default_translation=np.array([10.0, -5.0, 2.0]))],
+        [TransformSpatialAxesFilter(["-Z", "+X", "+Y"])],
+        [EveryNthSubpointFilter(n_per_type={}, default_n=2)],
+        [EveryNthAgentFilter(n_per_type={}, default_n=2)],
+        [EveryNthTimestepFilter(n=2)],
+        [MultiplySpaceFilter(multiplier=0.5)],
+    ],
+)
+def test_ragged_subpoints_filters(filters):
+    padded, ragged = padded_and_ragged_converters()
+    expected_data = JsonWriter.format_trajectory_data(padded.filter_data(filters))
+    ragged_data = ragged.filter_data(filters)
+    assert ragged_data.agent_data.has_ragged_subpoints()
+    assert JsonWriter.format_trajectory_data(ragged_data) == expected_data
+
+
+def test_ragged_subpoints_add_agents():
+    padded, ragged = padded_and_ragged_converters()
+    new_agents = copy.deepcopy(padded._data.agent_data)
+    filters = [AddAgentsFilter(new_agents)]
+    expected_data = JsonWriter.format_trajectory_data(padded.filter_data(filters))
+    ragged_data = ragged.filter_data(filters)
+    assert ragged_data.agent_data.has_ragged_subpoints()
+    assert JsonWriter.format_trajectory_data(ragged_data) == expected_data
+
+
+def test_ragged_subpoints_center_and_scale():
+    padded, ragged = padded_and_ragged_converters()
+    (
+        expected_agent_data,
+        expected_scale,
+    ) = TrajectoryConverter.center_and_scale_agent_data(padded._data.agent_data)
+    agent_data, scale = TrajectoryConverter.center_and_scale_agent_data(
+        ragged._data.agent_data
+    )
+    assert np.isclose(scale, expected_scale)
+    assert agent_data == expected_agent_data
+
+
+def test_ragged_subpoints_set_for_some_agents():
+    expected_agent_data = AgentData.from_dimensions(
+        DimensionData(total_steps=2, max_agents=3, max_subpoints=6)
+    )
+    expected_agent_data.n_agents[:] = 3
+    expected_agent_data.n_subpoints[:] = [[6, 3, 0], [3, 0, 6]]
+    expected_agent_data.subpoints[:] = np.arange(36).reshape((2, 3, 6))
+    agent_data = copy.deepcopy(expected_agent_data)
+    agent_data.use_ragged_subpoints()
+    # replace the subpoints of some of the agents, not in order
+    time_indices = np.array([1, 0, 1])
+    agent_indices = np.array([1, 1, 0])
+    n_subpoints = np.array([3, 0, 6])
+    values = -1.0 - np.arange(9)
+    for data in [expected_agent_data, agent_data]:
+        data._set_subpoints_for_agents(time_indices, agent_indices, n_subpoints, values)
+    assert agent_data.subpoints.shape[0] == int(np.sum(agent_data.n_subpoints))
+    assert agent_data == expected_agent_data
+    assert np.array_equal(agent_data.get_subpoints(0, 0), np.arange(6))
+    assert np.array_equal(agent_data.get_subpoints(1, 1), [-1.0, -2.0, -3.0])
+    assert np.array_equal(agent_data.get_subpoints(1, 2), np.arange(30, 36))
+
+
+def test_ragged_subpoints_min_max_positions_sphere_group():
+    # one sphere group agent with one sphere of XYZ and radius values
+    agent_data = AgentData.from_dimensions(
+        DimensionData(total_steps=1, max_agents=1, max_subpoints=4)
+    )
+    agent_data.n_agents[:] = 1
+    agent_data.types[0] = ["A"]
+    agent_data.radii[:] = 1.0
+    agent_data.n_subpoints[:] = 4
+    agent_data.subpoints[0][0] = [1.0, 2.0, 3.0, 0.5]
+    agent_data.display_data = {
+        "A": DisplayData(name="A", display_type=DISPLAY_TYPE.SPHERE_GROUP)
+    }
+    expected_min, expected_max = TrajectoryConverter.get_min_max_positions(agent_data)
+    assert np.array_equal(expected_min, [-1.0, -1.0, -1.0])
+    assert np.array_equal(expected_max, [1.0, 2.0, 3.0])
+    agent_data.use_ragged_subpoints()
+    min_positions, max_positions = TrajectoryConverter.get_min_max_positions(agent_data)
+    assert np.array_equal(min_positions, expected_min)
+    assert np.array_equal(max_positions, expected_max)
+
+
+@pytest.mark.parametrize("frames", [slice(1, 2), slice(0, 3, 2), np.array([2, 0])])
+def test_ragged_subpoints_get_frames(frames):
+    padded, ragged = padded_and_ragged_converters()
+    agent_data = ragged._data.agent_data
+    frame_agent_data = agent_data.get_frames(frames)
+    # only the values for the given frames are kept
+    assert frame_agent_data.subpoints.shape[0] == int(
+        np.sum(frame_agent_data.n_subpoints)
+    )
+    if isinstance(frames, slice) and frames.step is None:
+        assert np.shares_memory(frame_agent_data.subpoints, agent_data.subpoints)
+    assert frame_agent_data == padded._data.agent_data.get_frames(frames)
@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 import numpy as np
 import pytest
 import random
@@ -9,15 +12,18 @@ from simulariumio import FileConverter, InputFileData, JsonWriter
 bin_path = "simulariumio/tests/data/binary/binary_test.binary"
 binary_file_data = open(bin_path, "rb").read()
 binary_data_object = BinaryData(binary_file_data)
+mapped_binary_data_object = BinaryData(file_path=bin_path, memory_map=True)
 
 # convert to JSON
 traj_data_obj = FileConverter(input_file=InputFileData(file_path=bin_path))._data
-json_path = "simulariumio/tests/data/binary/json_test"
-JsonWriter.save(traj_data_obj, json_path, False)
-json_file_data = open(json_path + ".simularium", "r").read()
+with tempfile.TemporaryDirectory() as output_dir:
+    json_path = os.path.join(output_dir, "json_test")
+    JsonWriter.save(traj_data_obj, json_path, False)
+    with open(json_path + ".simularium", "r") as json_file:
+        json_file_data = json_file.read()
 json_data_object = JsonData(json_file_data)
 
-test_data_objects = [binary_data_object, json_data_object]
+test_data_objects = [binary_data_object, mapped_binary_data_object, json_data_object]
 
 expected_traj_info = {
     "version": 3,
@@ -89,3 +95,19 @@ def test_get_index_for_time(data_object: SimulariumFileData):
     random_frame = random.randint(0, expected_traj_info["totalSteps"] - 1)
     expected_time = random_frame * expected_traj_info["timeStepSize"]
     assert data_object.get_index_for_time(expected_time) == random_frame
+
+
+def test_mapped_frame_data_is_not_copied():
+    with BinaryData(file_path=bin_path, memory_map=True) as data_object:
+        mapped_contents = data_object.get_file_contents()
+        frame = data_object.get_frame_at_index(frame_index)
+        # the frame data is a view of the memory mapped file
+        assert frame.data.obj is mapped_contents
+        start, end = data_object.frame_metadata[frame_index].get_start_end_indices()
+        assert frame.data == binary_file_data[start:end]
+        assert np.array_equal(
+            np.frombuffer(frame.data, dtype="<f4"),
+            np.frombuffer(binary_file_data[start:end], dtype="<f4"),
+        )
+        frame.data.release()
+    assert mapped_contents.closed
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+
+import pytest
+import numpy as np
+
+from simulariumio import AgentData, DisplayData, TypeNameData
+from simulariumio.constants import DISPLAY_TYPE
+from simulariumio.exceptions import DataError
+
+type_names = [
+    ["A", "B", "A"],
+    ["C", "A"],
+    [],
+    ["B", "", "C", "C"],
+]
+
+
+def test_type_name_data_codes():
+    types = TypeNameData.from_type_names(type_names, max_agents=5)
+    assert types.codes.shape == (4, 5)
+    assert types.names == ["A", "B", "C", ""]
+    assert np.array_equal(types.n_types, [3, 2, 0, 4])
+    assert np.array_equal(types.codes[0], [0, 1, 0, -1, -1])
+    assert np.array_equal(types.codes[2], [-1, -1, -1, -1, -1])
+    assert types.to_list() == type_names
+    assert types == type_names
+    assert types.get_used_names() == ["A", "B", "C", ""]
+
+
+def test_type_name_data_list_access():
+    types = TypeNameData.from_type_names(type_names)
+    assert len(types) == 4
+    assert len(types[1]) == 2
+    assert types[0][1] == "B"
+    assert types[-1][-2] == "C"
+    assert list(types[3]) == ["B", "", "C", "C"]
+    assert [len(frame) for frame in types] == [3, 2, 0, 4]
+    with pytest.raises(IndexError):
+        types[1][2]
+    types[2].append("D")
+    types[2] += ["E", "A"]
+    types[1][0] = "B"
+    types[0] = ["E"]
+    assert types == [["E"], ["B", "A"], ["D", "E", "A"], ["B", "", "C", "C"]]
+    # appending past the max agents increases the size
+    for _ in range(3):
+        types[1].append("F")
+    assert types[1] == ["B", "A", "F", "F", "F"]
+    assert types.codes.shape[1] >= 5
+
+
+def test_type_name_data_equality():
+    types = TypeNameData.from_type_names(type_names)
+    # same type names with different codes
+    other = TypeNameData(
+        codes=[
+            [2, 0, 2, -1],
+            [1, 2, -1, -1],
+            [-1, -1, -1, -1],
+            [0, 3, 1, 1],
+        ],
+        names=["B", "C", "A", ""],
+    )
+    assert other.names != types.names
+    assert types == other
+    types_copy = copy.deepcopy(types)
+    assert types_copy == types
+    types_copy[0][0] = "C"
+    assert types_copy != types
+    assert types[0][0] == "A"
+
+
+def test_agent_data_type_ids_and_mapping():
+    agent_data = AgentData(
+        times=np.arange(4),
+        n_agents=np.array([3, 2, 0, 4]),
+        viz_types=1000.0 * np.ones((4, 4)),
+        unique_ids=np.arange(16).reshape((4, 4)),
+        types=type_names,
+        positions=np.zeros((4, 4, 3)),
+        radii=np.ones((4, 4)),
+        display_data={
+            type_name: DisplayData(name=type_name, display_type=DISPLAY_TYPE.SPHERE)
+            for type_name in ["C", "B", "A"]
+        },
+    )
+    type_ids, type_mapping = agent_data.get_type_ids_and_mapping()
+    assert np.array_equal(
+        type_ids,
+        [
+            [0, 1, 0, 0],
+            [2, 0, 0, 0],
+            [0, 0, 0, 0],
+            [1, 0, 2, 2],
+        ],
+    )
+    assert [type_mapping[tid]["name"] for tid in type_mapping] == ["A", "B", "C"]
+    agent_data.types[2].append("D")
+    with pytest.raises(DataError):
+        agent_data.get_type_ids_and_mapping()
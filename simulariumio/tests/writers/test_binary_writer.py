@@ -1,13 +1,20 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
+import struct
+
 import pytest
+import numpy as np
 from typing import List, Any
 
 from simulariumio import (
     TrajectoryConverter,
     BinaryWriter,
+    FileConverter,
+    InputFileData,
 )
+from simulariumio.cytosim import CytosimConverter, CytosimData, CytosimObjectInfo
 from simulariumio.writers.binary_values import BinaryValues
 from simulariumio.constants import (
     BINARY_SETTINGS,
@@ -984,3 +991,96 @@ def test_binary_writer(
         assert_binary_values_equal(
             chunk_index, binary_spatial_data, expected_spatial_data
         )
+
+
+@pytest.mark.parametrize(
+    "max_bytes, expected_n_files",
+    [
+        (BINARY_SETTINGS.MAX_BYTES, 1),
+        (1900, 2),
+        (1800, 3),
+    ],
+)
+def test_binary_writer_save(tmp_path, max_bytes, expected_n_files):
+    converter = TrajectoryConverter(binary_test_data)
+    output_path = str(tmp_path / "test")
+    BinaryWriter.save(converter._data, output_path, True, max_bytes)
+    (
+        binary_headers,
+        trajectory_infos,
+        binary_spatial_data,
+    ) = BinaryWriter.format_trajectory_data(converter._data, max_bytes)
+    assert len(binary_headers) == expected_n_files
+    for chunk_index in range(expected_n_files):
+        output_name = (
+            f"{output_path}.simularium"
+            if expected_n_files < 2
+            else f"{output_path}_{chunk_index}.simularium"
+        )
+        with open(output_name, "rb") as saved_file:
+            saved_bytes = saved_file.read()
+        # the saved spatial data block should match the formatted data
+        header, header_format = BinaryWriter._data_buffer_with_format(
+            chunk_index, binary_headers
+        )
+        spatial, spatial_format = BinaryWriter._data_buffer_with_format(
+            chunk_index, binary_spatial_data
+        )
+        spatial_bytes = struct.pack(spatial_format, *spatial)
+        header_values = struct.unpack(header_format, saved_bytes[:64])
+        assert list(header_values) == header
+        spatial_offset = header[7]
+        spatial_length = header[9]
+        assert spatial_length == len(spatial_bytes) + 8
+        assert (
+            saved_bytes[spatial_offset + 8 : spatial_offset + spatial_length]
+            == spatial_bytes
+        )
+        traj_info_offset = header[4] + 8
+        traj_info = json.loads(
+            saved_bytes[traj_info_offset:spatial_offset].decode("utf-8").strip("\x00")
+        )
+        assert traj_info == json.loads(json.dumps(trajectory_infos[chunk_index]))
+
+
+def test_binary_writer_save_float32(tmp_path):
+    converter = CytosimConverter(
+        CytosimData(
+            object_info={
+                "fibers": CytosimObjectInfo(
+                    cytosim_file=InputFileData(
+                        file_path=(
+                            "simulariumio/tests/data/cytosim/3_fibers_3_frames/test.txt"
+                        ),
+                    ),
+                )
+            },
+            dtype=np.float32,
+        )
+    )
+    agent_data = converter._data.agent_data
+    output_path = str(tmp_path / "test")
+    BinaryWriter.save(converter._data, output_path, True)
+    # float32 values are written as is, so they are read back exactly
+    saved_agent_data = FileConverter(
+        input_file=InputFileData(file_path=f"{output_path}.simularium")
+    )._data.agent_data
+    assert np.array_equal(saved_agent_data.n_agents, agent_data.n_agents)
+    for time_index in range(agent_data.total_timesteps()):
+        n_agents = int(agent_data.n_agents[time_index])
+        assert saved_agent_data.times[time_index] == np.float32(
+            agent_data.times[time_index]
+        )
+        assert np.array_equal(
+            saved_agent_data.positions[time_index][:n_agents],
+            agent_data.positions[time_index][:n_agents],
+        )
+        assert np.array_equal(
+            saved_agent_data.radii[time_index][:n_agents],
+            agent_data.radii[time_index][:n_agents],
+        )
+        for agent_index in range(n_agents):
+            assert np.array_equal(
+                saved_agent_data.get_subpoints(time_index, agent_index),
+                agent_data.get_subpoints(time_index, agent_index),
+            )
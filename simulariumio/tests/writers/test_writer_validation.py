@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from simulariumio import (
+    AgentData,
+    DisplayData,
+    JsonWriter,
+    MetaData,
+    TrajectoryData,
+)
+from simulariumio.constants import DISPLAY_TYPE, MAX_AGENT_ID, VIZ_TYPE
+from simulariumio.exceptions import DataError
+
+
+def trajectory_data(unique_ids: np.ndarray) -> TrajectoryData:
+    return TrajectoryData(
+        meta_data=MetaData(box_size=np.array([100.0, 100.0, 100.0])),
+        agent_data=AgentData(
+            times=np.array([0.0, 1.0]),
+            n_agents=np.array([3, 2]),
+            viz_types=np.array(
+                [
+                    [VIZ_TYPE.DEFAULT, VIZ_TYPE.FIBER, VIZ_TYPE.DEFAULT],
+                    [VIZ_TYPE.FIBER, VIZ_TYPE.DEFAULT, VIZ_TYPE.DEFAULT],
+                ]
+            ),
+            unique_ids=unique_ids,
+            types=[["A", "F", "G"], ["F", "A"]],
+            positions=np.zeros((2, 3, 3)),
+            radii=np.ones((2, 3)),
+            n_subpoints=np.array([[0, 6, 4], [3, 0, 0]]),
+            subpoints=np.ones((2, 3, 6)),
+            display_data={
+                "A": DisplayData(name="A", display_type=DISPLAY_TYPE.SPHERE),
+                "F": DisplayData(name="F", display_type=DISPLAY_TYPE.FIBER),
+                "G": DisplayData(name="G", display_type=DISPLAY_TYPE.SPHERE_GROUP),
+            },
+        ),
+    )
+
+
+def test_validate_ids_reports_all_invalid_ids():
+    data = trajectory_data(
+        np.array([[0, MAX_AGENT_ID + 1, 2], [MAX_AGENT_ID + 2, MAX_AGENT_ID + 1, 0]])
+    )
+    with pytest.raises(DataError) as error:
+        JsonWriter._validate_ids(data)
+    assert str([MAX_AGENT_ID + 1, MAX_AGENT_ID + 2]) in str(error.value)
+    JsonWriter._validate_ids(trajectory_data(np.array([[0, 1, 2], [0, 1, 0]])))
+
+
+def test_check_agent_ids_are_unique_per_frame():
+    buffer_data = JsonWriter.format_trajectory_data(
+        trajectory_data(np.array([[0, 1, 2], [0, 1, 0]]))
+    )
+    assert JsonWriter._check_agent_ids_are_unique_per_frame(buffer_data)
+    duplicates = JsonWriter.format_trajectory_data(
+        trajectory_data(np.array([[2, 1, 2], [1, 1, 0]]))
+    )
+    with pytest.raises(DataError) as error:
+        JsonWriter._check_agent_ids_are_unique_per_frame(duplicates)
+    assert "found duplicate IDs [2.0] in frame 0" in str(error.value)
+    assert "found duplicate IDs [1.0] in frame 1" in str(error.value)
+    # frames where none of the agents have subpoints
+    no_subpoints = trajectory_data(np.array([[0, 1, 0], [1, 2, 0]]))
+    no_subpoints.agent_data.n_subpoints[:] = 0
+    with pytest.raises(DataError) as error:
+        JsonWriter._check_agent_ids_are_unique_per_frame(
+            JsonWriter.format_trajectory_data(no_subpoints)
+        )
+    assert str(error.value) == (
+        "Problem with Data: 'found duplicate IDs [0.0] in frame 0'."
+    )
+
+
+def test_check_types_match_subpoints():
+    data = trajectory_data(np.array([[0, 1, 2], [0, 1, 0]]))
+    # the sphere group has subpoints but isn't a fiber
+    assert JsonWriter._check_types_match_subpoints(data) == (
+        "Agent at index Time = 0, Agent = 2: Type G has subpoints "
+        f"and viz type is {VIZ_TYPE.DEFAULT}"
+    )
+    data.agent_data.viz_types[1][0] = VIZ_TYPE.DEFAULT
+    data.agent_data.n_subpoints[0][2] = 0
+    data.agent_data.display_data["A"].display_type = DISPLAY_TYPE.FIBER
+    assert JsonWriter._check_types_match_subpoints(data).split("\n") == [
+        "Agent at index Time = 0, Agent = 0: Type A does not have subpoints "
+        f"and display type is {DISPLAY_TYPE.FIBER}",
+        "Agent at index Time = 1, Agent = 0: Type F has subpoints "
+        f"and viz type is {VIZ_TYPE.DEFAULT}",
+        "Agent at index Time = 1, Agent = 1: Type A does not have subpoints "
+        f"and display type is {DISPLAY_TYPE.FIBER}",
+    ]
+
+
+def test_check_subpoints_match_display_type_reports_all_agents():
+    agent_data = trajectory_data(np.array([[0, 1, 2], [0, 1, 0]])).agent_data
+    agent_data._check_subpoints_match_display_type()
+    agent_data.n_subpoints[0][1] = 5
+    agent_data.n_subpoints[0][2] = 3
+    with pytest.raises(DataError) as error:
+        agent_data._check_subpoints_match_display_type()
+    messages = str(error.value).split("\n")
+    assert len(messages) == 2
+    assert "T = 0 : F at index = 1 has n_subpoints = 5" in messages[0]
+    assert "T = 0 : G at index = 2 has n_subpoints = 3" in messages[1]
+    assert "requires subpoints in multiples of 4" in messages[1]
@@ -3,8 +3,7 @@
 
 import json
 import logging
-from typing import List, Dict, Callable, Tuple
-import copy
+from typing import List, Dict, Callable, Tuple, Union
 import time
 import numpy as np
 
@@ -17,8 +16,10 @@ from .data_objects import (
     HistogramPlotData,
     ScatterPlotData,
     TrajectoryData,
+    LazyTrajectoryData,
     DisplayData,
     AgentData,
+    BoundsData,
 )
 from .filters import Filter
 from .exceptions import UnsupportedPlotTypeError
@@ -82,6 +83,16 @@ class TrajectoryConverter:
             self.progress_callback(percent_complete)
             self.last_report_time = current_time
 
+    def _get_valid_agent_mask(data: np.array, n_agents: np.array) -> np.array:
+        """
+        Given position data (shape = [timesteps, agents, 3]), and
+        corresponding n_agents data, indicating agents per timestamp,
+        return a mask (shape = [timesteps, agents, 1]) that is True
+        for values that correspond with agents, as specified by n_agents.
+        """
+        agent_indices = np.arange(data.shape[1])
+        return (agent_indices < np.asarray(n_agents)[:, np.newaxis])[:, :, np.newaxis]
+
     def _get_valid_agents(data: np.array, n_agents: np.array) -> np.array:
         """
         Given position data (shape = [timesteps, agents, 3]), and
@@ -89,17 +100,8 @@ class TrajectoryConverter:
         return arrays of X, Y, and Z values from data, skipping values
         that do not correspond with agents, as specified by n_agents.
         """
-        x_data = np.array([])
-        y_data = np.array([])
-        z_data = np.array([])
-        x = data[:, :, 0]
-        y = data[:, :, 1]
-        z = data[:, :, 2]
-        for i in range(len(n_agents)):
-            x_data = np.append(x_data, x[i][0 : int(n_agents[i])])
-            y_data = np.append(y_data, y[i][0 : int(n_agents[i])])
-            z_data = np.append(z_data, z[i][0 : int(n_agents[i])])
-        return np.array([x_data, y_data, z_data])
+        mask = TrajectoryConverter._get_valid_agent_mask(data, n_agents)
+        return data[: mask.shape[0]][mask[:, :, 0]].T
 
     @staticmethod
     def get_xyz_max(data: np.array, n_agents: np.array = None) -> np.array:
@@ -109,15 +111,12 @@ class TrajectoryConverter:
         all position data, skipping the zeros that represent no data. Provide
         maximum X, Y, and Z values from remaining data
         """
-        if n_agents is not None:
-            [x_data, y_data, z_data] = TrajectoryConverter._get_valid_agents(
-                data, n_agents
-            )
-        else:
-            x_data = data[:, :, 0].flatten()
-            y_data = data[:, :, 1].flatten()
-            z_data = data[:, :, 2].flatten()
-        return np.array([max(x_data), max(y_data), max(z_data)])
+        mask = (
+            TrajectoryConverter._get_valid_agent_mask(data, n_agents)
+            if n_agents is not None
+            else True
+        )
+        return np.fmax.reduce(data, axis=(0, 1), where=mask, initial=-np.inf)
 
     @staticmethod
     def get_xyz_min(data: np.array, n_agents: np.array = None) -> np.array:
@@ -127,16 +126,36 @@ class TrajectoryConverter:
         all position data, skipping the zeros that represent no data. Provide
         minimum X, Y, and Z values from remaining data
         """
-        if n_agents is not None:
-            [x_data, y_data, z_data] = TrajectoryConverter._get_valid_agents(
-                data, n_agents
-            )
-        else:
-            x_data = data[:, :, 0].flatten()
-            y_data = data[:, :, 1].flatten()
-            z_data = data[:, :, 2].flatten()
+        mask = (
+            TrajectoryConverter._get_valid_agent_mask(data, n_agents)
+            if n_agents is not None
+            else True
+        )
+        return np.fmin.reduce(data, axis=(0, 1), where=mask, initial=np.inf)
 
-        return np.array([min(x_data), min(y_data), min(z_data)])
+    @staticmethod
+    def _get_valid_subpoint_masks(n_subpoints: np.array, max_subpoints: int):
+        """
+        Given a list of n_subpoints per agent per timestep
+        (shape = [timesteps, agents]), return a mask for each of X, Y, and Z
+        (shape = [3, timesteps, agents, subpoints]) that is True for the
+        subpoint values of that axis, where the values of all agents
+        are read one after another as XYZ coordinates
+        """
+        n_subpoints = n_subpoints.astype(int)
+        value_indices = np.arange(max_subpoints)
+        # the axis of the first subpoint value of each agent
+        start_indices = np.zeros(n_subpoints.size, dtype=int)
+        np.cumsum(n_subpoints.flatten()[:-1], out=start_indices[1:])
+        start_axes = (start_indices % VALUES_PER_3D_POINT).astype(np.int8)
+        value_axes = (
+            start_axes.reshape(n_subpoints.shape)[:, :, np.newaxis]
+            + (value_indices % VALUES_PER_3D_POINT).astype(np.int8)
+        ) % VALUES_PER_3D_POINT
+        valid = value_indices < n_subpoints[:, :, np.newaxis]
+        return np.array(
+            [valid & (value_axes == axis) for axis in range(VALUES_PER_3D_POINT)]
+        )
 
     @staticmethod
     def get_subpoints_xyz(subpoints: np.array, n_subpoints: np.array) -> np.array:
@@ -146,14 +165,77 @@ class TrajectoryConverter:
         extract all subpoint data, skipping the zeros which represent no data.
         Reshape resulting subpoint data into a 2D array of XYZ coordinate data
         """
-        xyz_subpoints = np.array([])
-        for timestep in range(len(n_subpoints)):
-            for agent in range(len(n_subpoints[timestep])):
-                xyz_subpoints = np.append(
-                    xyz_subpoints,
-                    subpoints[timestep][agent][0 : int(n_subpoints[timestep][agent])],
-                )
-        return xyz_subpoints.reshape(1, -1, 3)
+        value_indices = np.arange(subpoints.shape[2])
+        valid = value_indices < n_subpoints[:, :, np.newaxis]
+        return subpoints[: valid.shape[0], : valid.shape[1]][valid].reshape(1, -1, 3)
+
+    @staticmethod
+    def get_subpoints_xyz_min_max(
+        subpoints: np.array, n_subpoints: np.array
+    ) -> Tuple[np.array, np.array]:
+        """
+        Given AgentData subpoints (shape = [timesteps, agents, subpoints]), and a
+        list of n_subpoints per agent per timestep (shape = [timesteps, agents])
+        provide the minimum and maximum X, Y, and Z values of the subpoint data,
+        skipping the zeros which represent no data, without copying it
+        """
+        subpoints = subpoints[: n_subpoints.shape[0], : n_subpoints.shape[1]]
+        if subpoints.shape[2] % VALUES_PER_3D_POINT == 0 and np.all(
+            n_subpoints % VALUES_PER_3D_POINT == 0
+        ):
+            # each agent's subpoints are whole XYZ points
+            points = subpoints.reshape(subpoints.shape[:2] + (-1, VALUES_PER_3D_POINT))
+            mask = (
+                np.arange(points.shape[2])
+                < n_subpoints[:, :, np.newaxis] // VALUES_PER_3D_POINT
+            )[:, :, :, np.newaxis]
+            return (
+                np.fmin.reduce(points, axis=(0, 1, 2), where=mask, initial=np.inf),
+                np.fmax.reduce(points, axis=(0, 1, 2), where=mask, initial=-np.inf),
+            )
+        masks = TrajectoryConverter._get_valid_subpoint_masks(
+            n_subpoints, subpoints.shape[2]
+        )
+        min_subpoints = np.array(
+            [np.fmin.reduce(subpoints, None, where=m, initial=np.inf) for m in masks]
+        )
+        max_subpoints = np.array(
+            [np.fmax.reduce(subpoints, None, where=m, initial=-np.inf) for m in masks]
+        )
+        return (min_subpoints, max_subpoints)
+
+    @staticmethod
+    def get_ragged_subpoints_xyz_min_max(
+        subpoints: np.array, subpoint_offsets: np.array, n_subpoints: np.array
+    ) -> Tuple[np.array, np.array]:
+        """
+        Given ragged AgentData subpoints (a flat array of values),
+        the offset of each agent's values in it and a list of n_subpoints
+        per agent per timestep (shape = [timesteps, agents]),
+        provide the minimum and maximum X, Y, and Z values of the subpoint data,
+        reading the values of each agent with the same axes
+        as get_subpoints_xyz_min_max does for padded subpoints
+        """
+        has_subpoints = n_subpoints > 0
+        indices = AgentData._ragged_indices(
+            subpoint_offsets[has_subpoints], n_subpoints[has_subpoints]
+        )
+        # the axis of each value, continuing from the previous agent's values
+        value_axes = np.arange(indices.shape[0]) % VALUES_PER_3D_POINT
+        values = subpoints[indices]
+        min_subpoints = np.array(
+            [
+                np.fmin.reduce(values, where=value_axes == axis, initial=np.inf)
+                for axis in range(VALUES_PER_3D_POINT)
+            ]
+        )
+        max_subpoints = np.array(
+            [
+                np.fmax.reduce(values, where=value_axes == axis, initial=-np.inf)
+                for axis in range(VALUES_PER_3D_POINT)
+            ]
+        )
+        return (min_subpoints, max_subpoints)
 
     @staticmethod
     def translate_positions(data: AgentData, translation: np.ndarray) -> AgentData:
@@ -167,45 +249,70 @@ class TrajectoryConverter:
         translation : np.ndarray (shape = [3])
             XYZ translation
         """
-        total_steps = data.times.size
-        max_subpoints = int(np.amax(data.n_subpoints))
-        for time_index in range(total_steps):
-            for agent_index in range(int(data.n_agents[time_index])):
-                display_type = data.display_type_for_agent(time_index, agent_index)
-                has_fiber_subpoints = (
-                    max_subpoints > 0 and display_type == DISPLAY_TYPE.FIBER
-                )
-                if has_fiber_subpoints:
-                    # only translate subpoints for fibers, since sphere group
-                    # subpoint positions are relative to agent's position, and no
-                    # other display types have subpoints currently
-                    sp_items = Filter.get_items_from_subpoints(
-                        data, time_index, agent_index
-                    )
-                    if sp_items is None:
-                        has_fiber_subpoints = False
-                    else:
-                        # translate subpoints for fibers
-                        n_items = sp_items.shape[0]
-                        for item_index in range(n_items):
-                            sp_items[item_index][:VALUES_PER_3D_POINT] += translation
-                        n_sp = int(data.n_subpoints[time_index][agent_index])
-                        data.subpoints[time_index][agent_index][
-                            :n_sp
-                        ] = sp_items.reshape(n_sp)
-                if not has_fiber_subpoints:
-                    # agents for fibers don't have their own position data, so only
-                    # translate agents without fiber subpoints. eventually, if fiber
-                    # subpoints are relative to agent position, we can just translate
-                    # the agent position and leave the subpoints as is
-                    data.positions[time_index][agent_index] += translation
-
+        agent_mask = data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        codes = data.types.codes[:total_steps, :max_agents]
+        n_subpoints = data.n_subpoints[:total_steps, :max_agents]
+        # whether each type code is a fiber, the last is for codes that are -1
+        is_fiber = np.array(
+            [
+                display_type == DISPLAY_TYPE.FIBER
+                for display_type in data.display_types_for_codes(agent_mask)
+            ]
+            + [False]
+        )
+        # only translate subpoints for fibers, since sphere group subpoint
+        # positions are relative to agent's position, and no other display types
+        # have subpoints currently. agents for fibers don't have their own
+        # position data, so only translate agents without fiber subpoints
+        fiber_mask = agent_mask & (n_subpoints > 0) & is_fiber[codes]
+        positions = data.positions[:total_steps, :max_agents]
+        np.add(
+            positions,
+            translation,
+            out=positions,
+            where=(agent_mask & ~fiber_mask)[:, :, np.newaxis],
+        )
+        if not np.any(fiber_mask):
+            return data
+        if (
+            not data.has_ragged_subpoints()
+            and data.subpoints.shape[:2] == fiber_mask.shape
+            and data.subpoints.shape[2] % VALUES_PER_3D_POINT == 0
+            and data.subpoints.flags.c_contiguous
+        ):
+            # translate the XYZ points of fibers in a view of the subpoints
+            points = data.subpoints.reshape(
+                fiber_mask.shape + (-1, VALUES_PER_3D_POINT)
+            )
+            point_mask = fiber_mask[:, :, np.newaxis] & (
+                np.arange(points.shape[2])
+                < n_subpoints[:, :, np.newaxis] // VALUES_PER_3D_POINT
+            )
+            np.add(
+                points, translation, out=points, where=point_mask[:, :, :, np.newaxis]
+            )
+        else:
+            subpoint_indices = data.get_subpoint_indices_for_agents(
+                *np.nonzero(fiber_mask)
+            )
+            data.subpoints[subpoint_indices] += np.tile(
+                translation, subpoint_indices[0].size // VALUES_PER_3D_POINT
+            )
         return data
 
     @staticmethod
     def get_min_max_positions(
         agent_data: AgentData,
+        bounds: BoundsData = None,
     ) -> Tuple[np.array, np.array]:
+        """
+        Return the minimum and maximum XYZ values of the position, radii,
+        and subpoints data from AgentData, from the bounds accumulated
+        while parsing it if they are provided, otherwise by scanning it
+        """
+        if bounds is not None and not bounds.is_empty():
+            return bounds.get_min_max()
         max_dimensions = TrajectoryConverter.get_xyz_max(
             agent_data.positions + agent_data.radii[:, :, np.newaxis],
             agent_data.n_agents,
@@ -220,11 +327,22 @@ class TrajectoryConverter:
             and agent_data.n_subpoints is not None
             and agent_data.subpoints.size > 0
         ):
-            xyz_subpoints = TrajectoryConverter.get_subpoints_xyz(
-                agent_data.subpoints, agent_data.n_subpoints
-            )
-            max_subpoints = TrajectoryConverter.get_xyz_max(xyz_subpoints)
-            min_subpoints = TrajectoryConverter.get_xyz_min(xyz_subpoints)
+            if agent_data.has_ragged_subpoints():
+                (
+                    min_subpoints,
+                    max_subpoints,
+                ) = TrajectoryConverter.get_ragged_subpoints_xyz_min_max(
+                    agent_data.subpoints,
+                    agent_data.subpoint_offsets,
+                    agent_data.n_subpoints,
+                )
+            else:
+                (
+                    min_subpoints,
+                    max_subpoints,
+                ) = TrajectoryConverter.get_subpoints_xyz_min_max(
+                    agent_data.subpoints, agent_data.n_subpoints
+                )
             max_dimensions = np.amax([max_dimensions, max_subpoints], 0)
             min_dimensions = np.amin([min_dimensions, min_subpoints], 0)
         return (min_dimensions, max_dimensions)
@@ -246,14 +364,17 @@ class TrajectoryConverter:
     @staticmethod
     def calculate_scale_factor(
         agent_data: AgentData,
+        bounds: BoundsData = None,
     ) -> float:
         """
         Return a scale factor, using the given position, radii,
         and subpoints, data from AgentData, so that the final range of agent
         locations is within the dimensions defined by VIEWER_DIMENSION_RANGE.
+        Use the bounds accumulated while parsing the AgentData if provided,
+        and only scan the AgentData if not.
         """
         min_dimensions, max_dimensions = TrajectoryConverter.get_min_max_positions(
-            agent_data
+            agent_data, bounds
         )
         return TrajectoryConverter._get_scale_factor_with_min_max(
             min_dimensions, max_dimensions
@@ -263,16 +384,20 @@ class TrajectoryConverter:
     def scale_agent_data(
         agent_data: AgentData,
         input_scale_factor: float = None,
+        bounds: BoundsData = None,
     ) -> Tuple[AgentData, float]:
         """
         Return a scaled AgentData object, either using a provided scale
         factor if input_scale_factor is given, or using a calculated scale
-        factor using calculate_scale_factor() with the provided agent data.
+        factor using calculate_scale_factor() with the provided agent data
+        and the bounds accumulated while parsing it, if provided.
         Also returns the scale factor that was used on the AgentData object.
         """
         if input_scale_factor is None:
             # If scale factor wasn't provided, calculate one
-            scale_factor = TrajectoryConverter.calculate_scale_factor(agent_data)
+            scale_factor = TrajectoryConverter.calculate_scale_factor(
+                agent_data, bounds
+            )
         else:
             scale_factor = input_scale_factor
         agent_data.radii *= scale_factor
@@ -283,16 +408,18 @@ class TrajectoryConverter:
     def center_and_scale_agent_data(
         agent_data: AgentData,
         input_scale_factor: float = None,
+        bounds: BoundsData = None,
     ) -> Tuple[AgentData, float]:
         """
         Center the provided agent_data at the origin, based on the range of
-        XYZ position data and subpoint data. In addition, scale position
+        XYZ position data and subpoint data, from the bounds accumulated
+        while parsing it if provided. In addition, scale position
         and radii data based on the input_scale_factor if provided, otherwise
         calculate the scale factor using calculate_scale_factor(). Returns the
         centered and scaled AgentData, and the scale factor that was applied
         """
         min_dimensions, max_dimensions = TrajectoryConverter.get_min_max_positions(
-            agent_data
+            agent_data, bounds
         )
         translation = -0.5 * (max_dimensions + min_dimensions)
 
@@ -380,6 +507,78 @@ class TrajectoryConverter:
         plot_reader_class = self._determine_plot_reader(plot_type)
         self._data.plots.append(plot_reader_class().read(data))
 
+    def _sum_per_frame_and_type(
+        self, values: np.ndarray = None
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Group the agents in each frame by type, where type names
+        with the same name before "#" are one type, and sum the given values
+        for each group
+
+        Parameters
+        ----------
+        values: np.ndarray (shape = [timesteps, agents, ...]) (optional)
+            A value or array of values for each agent to sum
+            Default: None (only count the agents)
+
+        Returns
+        -------
+        The type names in the order they first appear,
+        the number of agents (shape = [timesteps, types]),
+        and the sums of the values (shape = [timesteps, types, ...]),
+        or None if no values were given
+        """
+        agent_data = self._data.agent_data
+        agent_mask = agent_data.get_agent_mask()
+        total_steps, max_agents = agent_mask.shape
+        time_indices, agent_indices = np.nonzero(agent_mask)
+        type_codes = agent_data.types.codes[time_indices, agent_indices]
+        # number the base type names in the order their codes first appear
+        unique_codes, first_indices = np.unique(type_codes, return_index=True)
+        type_names = []
+        type_index_for_code = np.zeros(len(agent_data.types.names), dtype=int)
+        for type_code in unique_codes[np.argsort(first_indices)]:
+            type_name = agent_data.types.names[type_code].split("#")[0]
+            if type_name not in type_names:
+                type_names.append(type_name)
+            type_index_for_code[type_code] = type_names.index(type_name)
+        n_types = len(type_names)
+        groups = time_indices * n_types + type_index_for_code[type_codes]
+        n_groups = total_steps * n_types
+        counts = np.bincount(groups, minlength=n_groups).reshape((total_steps, n_types))
+        if values is None:
+            return type_names, counts, None
+        agent_values = values[:total_steps, :max_agents][agent_mask]
+        sums = np.array(
+            [
+                np.bincount(groups, weights=component, minlength=n_groups)
+                for component in agent_values.reshape(
+                    (agent_values.shape[0], int(np.prod(agent_values.shape[1:])))
+                ).T
+            ]
+        )
+        return (
+            type_names,
+            counts,
+            np.moveaxis(sums, 0, -1).reshape(
+                (total_steps, n_types) + agent_values.shape[1:]
+            ),
+        )
+
+    def _mean_per_frame_and_type(
+        self, values: np.ndarray
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the type names and the mean of the given values (shape =
+        [timesteps, agents, ...]) for each type in each frame,
+        or zero in frames without agents of that type
+        """
+        type_names, counts, sums = self._sum_per_frame_and_type(values)
+        counts = counts.reshape(counts.shape + (1,) * (sums.ndim - counts.ndim))
+        means = np.zeros_like(sums)
+        np.divide(sums, counts, out=means, where=counts > 0)
+        return type_names, means
+
     def add_number_of_agents_plot(
         self,
         plot_title: str = "Number of agents over time",
@@ -397,33 +596,175 @@ class TrajectoryConverter:
             The title for the y-axis of the plot
             Default: "Number of agents"
         """
+        agent_data = self._data.agent_data
+        type_names, counts, _ = self._sum_per_frame_and_type()
         n_agents = {}
-        for time_index in range(self._data.agent_data.times.size):
-            for agent_index in range(int(self._data.agent_data.n_agents[time_index])):
-                type_name = self._data.agent_data.types[time_index][agent_index]
-                if "#" in type_name:
-                    type_name = type_name.split("#")[0]
-                if type_name not in n_agents:
-                    n_agents[type_name] = np.zeros_like(self._data.agent_data.times)
-                n_agents[type_name][time_index] += 1
+        for type_index, type_name in enumerate(type_names):
+            n_agents[type_name] = counts[:, type_index].astype(agent_data.times.dtype)
         self.add_plot(
             ScatterPlotData(
                 title=plot_title,
                 xaxis_title=f"Time ({self._data.time_units})",
                 yaxis_title=yaxis_title,
-                xtrace=self._data.agent_data.times,
+                xtrace=agent_data.times,
                 ytraces=n_agents,
                 render_mode="lines",
             )
         )
 
-    def filter_data(self, filters: List[Filter]) -> TrajectoryData:
+    def add_mean_radius_plot(
+        self,
+        plot_title: str = "Mean radius over time",
+        yaxis_title: str = None,
+    ):
         """
-        Return the simularium data with the given filter applied
+        Add a scatterplot of the mean radius of each type of agent over time
+
+        Parameters
+        ----------
+        plot_title: str
+            The title for the plot
+            Default: "Mean radius over time"
+        yaxis_title: str
+            The title for the y-axis of the plot
+            Default: "Mean radius (spatial units)"
         """
-        filtered_data = copy.deepcopy(self._data)
-        for f in filters:
+        agent_data = self._data.agent_data
+        type_names, means = self._mean_per_frame_and_type(agent_data.radii)
+        mean_radii = {}
+        for type_index, type_name in enumerate(type_names):
+            mean_radii[type_name] = means[:, type_index]
+        self.add_plot(
+            ScatterPlotData(
+                title=plot_title,
+                xaxis_title=f"Time ({self._data.time_units})",
+                yaxis_title=(
+                    yaxis_title
+                    if yaxis_title is not None
+                    else f"Mean radius ({self._data.spatial_units})"
+                ),
+                xtrace=agent_data.times,
+                ytraces=mean_radii,
+                render_mode="lines",
+            )
+        )
+
+    def add_centroid_plot(
+        self,
+        plot_title: str = "Centroid over time",
+        yaxis_title: str = None,
+    ):
+        """
+        Add a scatterplot of the X, Y, and Z of the mean position
+        of each type of agent over time
+
+        Parameters
+        ----------
+        plot_title: str
+            The title for the plot
+            Default: "Centroid over time"
+        yaxis_title: str
+            The title for the y-axis of the plot
+            Default: "Position (spatial units)"
+        """
+        agent_data = self._data.agent_data
+        type_names, means = self._mean_per_frame_and_type(agent_data.positions)
+        centroids = {}
+        for type_index, type_name in enumerate(type_names):
+            for dim_index, dim_name in enumerate(["X", "Y", "Z"]):
+                centroids[f"{type_name} {dim_name}"] = means[:, type_index, dim_index]
+        self.add_plot(
+            ScatterPlotData(
+                title=plot_title,
+                xaxis_title=f"Time ({self._data.time_units})",
+                yaxis_title=(
+                    yaxis_title
+                    if yaxis_title is not None
+                    else f"Position ({self._data.spatial_units})"
+                ),
+                xtrace=agent_data.times,
+                ytraces=centroids,
+                render_mode="lines",
+            )
+        )
+
+    def filter_data(
+        self,
+        filters: List[Filter],
+        in_place: bool = False,
+        lazy: bool = False,
+        n_workers: int = 1,
+        use_processes: bool = False,
+    ) -> Union[TrajectoryData, LazyTrajectoryData]:
+        """
+        Return the simularium data with the given filters applied
+
+        Parameters
+        ----------
+        filters: List[Filter]
+            The filters to apply, in order
+        in_place: bool (optional)
+            Apply the filters to this converter's data
+            instead of a copy of it? This uses the least memory,
+            but the unfiltered data is not kept.
+            Otherwise the AgentData arrays are shared with
+            this converter's data, and each one is only copied before
+            a filter that changes it in place
+            Default: False
+        lazy: bool (optional)
+            Return LazyTrajectoryData that applies the filters
+            to each frame when BinaryWriter or JsonWriter writes it,
+            instead of filtering the whole trajectory now?
+            Filters that don't filter each frame independently,
+            and any filters before them, are still applied now
+            Default: False
+        n_workers: int (optional)
+            Split the timesteps into this many chunks and filter them
+            in parallel, then join the filtered chunks? Filters that
+            don't filter each frame independently, and any filters
+            before them, are applied to the whole trajectory first
+            Default: 1 (filter the whole trajectory at once)
+        use_processes: bool (optional)
+            If n_workers > 1, filter the chunks in a pool of processes
+            that read the data from shared memory, instead of
+            a pool of threads? Processes are faster for filters
+            that spend most of their time in Python instead of numpy
+            Default: False
+        """
+        parallel = not lazy and n_workers > 1
+        n_eager = 0
+        if lazy or parallel:
+            for index, f in enumerate(filters):
+                if type(f).apply_to_frames is Filter.apply_to_frames:
+                    n_eager = index + 1
+        else:
+            n_eager = len(filters)
+        if in_place:
+            filtered_data = self._data
+        else:
+            filtered_data = self._data.get_shallow_copy()
+        for f in filters[:n_eager]:
+            if not in_place:
+                filtered_data.agent_data.copy_fields_shared_with(
+                    self._data.agent_data, f.get_mutated_agent_data_fields()
+                )
             filtered_data = f.apply(filtered_data)
+        if lazy:
+            print(
+                f"Filtering: {len(filters) - n_eager} filters will be applied "
+                "to each timestep as it is written -------------"
+            )
+            return LazyTrajectoryData(filtered_data, filters[n_eager:])
+        if parallel:
+            print(
+                f"Filtering: {len(filters) - n_eager} filters in "
+                f"{n_workers} chunks of timesteps -------------"
+            )
+            filtered_data = LazyTrajectoryData(
+                filtered_data, filters[n_eager:]
+            ).get_trajectory_data(n_workers, use_processes)
+            if in_place:
+                self._data = filtered_data
         return filtered_data
 
     def to_JSON(self):
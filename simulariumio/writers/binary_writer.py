@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from typing import List, Tuple, Any, Dict, Union
+from typing import List, Tuple, Any, Dict, Union, Callable
 import struct
 import json
 
@@ -11,6 +11,7 @@ import numpy as np
 from ..data_objects import (
     AgentData,
     TrajectoryData,
+    LazyTrajectoryData,
 )
 from ..constants import BINARY_SETTINGS, BINARY_BLOCK_TYPE, CURRENT_VERSION
 from .writer import Writer
@@ -23,6 +24,17 @@ log = logging.getLogger(__name__)
 
 ###############################################################################
 
+# little-endian layout of the values written before each frame's buffer
+FRAME_HEADER_DTYPE = np.dtype(
+    [
+        ("frame_number", "<u4"),
+        ("time", "<f4"),
+        ("n_agents", "<u4"),
+    ]
+)
+
+###############################################################################
+
 
 class BinaryWriter(Writer):
     @staticmethod
@@ -191,32 +203,65 @@ class BinaryWriter(Writer):
         )
 
     @staticmethod
-    def _spatial_data_header(
+    def _spatial_data_header_array(
         chunk: BinaryChunk,
-    ) -> BinaryValues:
+    ) -> np.ndarray:
         """
-        Return spatial data header values and format
+        Return spatial data header values as a little-endian uint32 array
         """
         n_header_values = (
             BINARY_SETTINGS.SPATIAL_BLOCK_HEADER_CONSTANT_N_VALUES + 2 * chunk.n_frames
         )  # frame offsets and lengths
-        spatial_data_header_n_bytes = BINARY_SETTINGS.BYTES_PER_VALUE * n_header_values
-        frame_offsets_and_lengths = []
-        current_offset = (
-            spatial_data_header_n_bytes
-            + BINARY_SETTINGS.BYTES_PER_VALUE * BINARY_SETTINGS.BLOCK_HEADER_N_VALUES
+        result = np.zeros(n_header_values, dtype="<u4")
+        result[0] = CURRENT_VERSION.SPATIAL_DATA
+        result[1] = chunk.n_frames
+        if chunk.n_frames < 1:
+            return result
+        frame_n_bytes = BINARY_SETTINGS.BYTES_PER_VALUE * np.array(
+            chunk.frame_n_values, dtype=np.int64
         )
-        for frame_n_values in chunk.frame_n_values:
-            frame_n_bytes = BINARY_SETTINGS.BYTES_PER_VALUE * frame_n_values
-            frame_offsets_and_lengths.append(current_offset)
-            frame_offsets_and_lengths.append(frame_n_bytes)
-            current_offset += frame_n_bytes
+        first_offset = BINARY_SETTINGS.BYTES_PER_VALUE * (
+            n_header_values + BINARY_SETTINGS.BLOCK_HEADER_N_VALUES
+        )
+        frame_offsets = np.zeros(chunk.n_frames, dtype=np.int64)
+        np.cumsum(frame_n_bytes[:-1], out=frame_offsets[1:])
+        frame_offsets += first_offset
+        constant_n_values = BINARY_SETTINGS.SPATIAL_BLOCK_HEADER_CONSTANT_N_VALUES
+        result[constant_n_values::2] = frame_offsets
+        result[constant_n_values + 1 :: 2] = frame_n_bytes
+        return result
+
+    @staticmethod
+    def _spatial_data_header(
+        chunk: BinaryChunk,
+    ) -> BinaryValues:
+        """
+        Return spatial data header values and format
+        """
+        header = BinaryWriter._spatial_data_header_array(chunk)
         return BinaryValues(
-            values=(
-                [CURRENT_VERSION.SPATIAL_DATA, chunk.n_frames]
-                + frame_offsets_and_lengths
-            ),
-            format_string=f"<{n_header_values}I",
+            values=header.tolist(),
+            format_string=f"<{header.shape[0]}I",
+        )
+
+    @staticmethod
+    def _frame_header_array(
+        global_time_index: int,
+        chunk_time_index: int,
+        agent_data: AgentData,
+    ) -> np.ndarray:
+        """
+        Return the header values for a frame as a structured array
+        """
+        return np.array(
+            [
+                (
+                    chunk_time_index,
+                    agent_data.times[global_time_index],
+                    agent_data.n_agents[global_time_index],
+                )
+            ],
+            dtype=FRAME_HEADER_DTYPE,
         )
 
     @staticmethod
@@ -273,16 +318,18 @@ class BinaryWriter(Writer):
 
     @staticmethod
     def format_trajectory_data(
-        trajectory_data: TrajectoryData,
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData],
         max_bytes: int = BINARY_SETTINGS.MAX_BYTES,
     ) -> Tuple[List[BinaryValues], List[Dict[str, Any]], List[List[BinaryValues]]]:
         """
         Return the data shaped for Simularium binary
         Parameters
         ----------
-        trajectory_data: TrajectoryData
-            the data to format
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData]
+            the data to format, LazyTrajectoryData is filtered first
         """
+        if isinstance(trajectory_data, LazyTrajectoryData):
+            trajectory_data = trajectory_data.get_trajectory_data()
         print("Converting Trajectory Data to Binary -------------")
         trajectory_data.agent_data._check_subpoints_match_display_type()
         frame_buffers_n_values = BinaryWriter._frame_buffers_n_values(trajectory_data)
@@ -377,57 +424,88 @@ class BinaryWriter(Writer):
         return len(databytes) + block_header_length
 
     @staticmethod
-    def save(
-        trajectory_data: TrajectoryData, output_path: str, validate_ids: bool
+    def _write_spatial_block(
+        chunk: BinaryChunk,
+        agent_data: AgentData,
+        get_frame_buffer: Callable[[int], np.ndarray],
+        file_name: str,
+    ) -> int:
+        """
+        Write the spatial data block for a chunk to a file one frame at a time,
+        so only the current frame is held in memory.
+        The frame headers use the times and number of agents in the AgentData,
+        and get_frame_buffer returns the float32 buffer for a frame index
+        Return number of bytes written
+        """
+        with open(file_name, "ab") as outfile:
+            # write block type
+            outfile.write(
+                struct.pack("<i", BINARY_BLOCK_TYPE.SPATIAL_DATA_BINARY.value)
+            )
+            # write block size
+            outfile.write(struct.pack("<i", chunk.n_bytes))
+            # write spatial data header with frame offsets and lengths
+            outfile.write(BinaryWriter._spatial_data_header_array(chunk))
+            # write frames straight from float32 arrays
+            for chunk_frame_index in range(chunk.n_frames):
+                global_frame_index = chunk.get_global_index(chunk_frame_index)
+                outfile.write(
+                    BinaryWriter._frame_header_array(
+                        global_frame_index, chunk_frame_index, agent_data
+                    )
+                )
+                outfile.write(memoryview(get_frame_buffer(global_frame_index)))
+        return chunk.n_bytes
+
+    @staticmethod
+    def _write_files(
+        trajectory_data: TrajectoryData,
+        type_mapping: Dict[str, Any],
+        frame_buffers_n_values: List[int],
+        get_frame_buffer: Callable[[int], np.ndarray],
+        output_path: str,
+        max_bytes: int,
     ) -> None:
         """
-        Save the simularium data in .simularium binary format
-        at the output path
-        Parameters
-        ----------
-        trajectory_data: TrajectoryData
-            the data to save
-        output_path: str
-            where to save the file
-        validate_ids: bool
-            additional validation to check agent ID size?
+        Split the frames into files that fit in max_bytes and write each file:
+        the binary header, trajectory info, spatial data, and plot data
         """
-        if validate_ids:
-            Writer._validate_ids(trajectory_data)
-        (
-            binary_headers,
-            trajectory_infos,
-            binary_spatial_data,
-        ) = BinaryWriter.format_trajectory_data(trajectory_data)
+        file_chunks, traj_info_n_bytes, plot_data_n_bytes = BinaryWriter._chunk_files(
+            trajectory_data, type_mapping, frame_buffers_n_values, max_bytes
+        )
         print("Writing Binary -------------")
-        for chunk_index in range(len(binary_spatial_data)):
+        for chunk_index, file_chunk in enumerate(file_chunks):
             # determine filename(s)
-            if len(binary_headers) < 2:
+            if len(file_chunks) < 2:
                 output_name = f"{output_path}.simularium"
             else:
                 output_name = f"{output_path}_{chunk_index}.simularium"
             # binary header
-            header_buffer, header_format = BinaryWriter._data_buffer_with_format(
-                chunk_index, binary_headers
+            binary_header = BinaryWriter._binary_header(
+                traj_info_n_bytes,
+                file_chunk.n_bytes,
+                plot_data_n_bytes,
             )
             with open(output_name, "wb") as outfile:
-                outfile.write(struct.pack(header_format, *header_buffer))
+                outfile.write(
+                    struct.pack(binary_header.format_string, *binary_header.values)
+                )
             # trajectory info
             BinaryWriter._write_block(
-                json.dumps(trajectory_infos[chunk_index]),
+                json.dumps(
+                    Writer._get_trajectory_info(
+                        trajectory_data, file_chunk.n_frames, type_mapping
+                    )
+                ),
                 BINARY_BLOCK_TYPE.TRAJ_INFO_JSON.value,
                 output_name,
             )
             # spatial data
-            (
-                spatial_data_buffer,
-                spatial_format,
-            ) = BinaryWriter._data_buffer_with_format(chunk_index, binary_spatial_data)
-            BinaryWriter._write_block(
-                spatial_data_buffer,
-                BINARY_BLOCK_TYPE.SPATIAL_DATA_BINARY.value,
+            BinaryWriter._write_spatial_block(
+                file_chunk,
+                trajectory_data.agent_data,
+                get_frame_buffer,
                 output_name,
-                spatial_format,
             )
             # plot data
             BinaryWriter._write_block(
@@ -441,3 +519,160 @@ class BinaryWriter(Writer):
                 output_name,
             )
             print(f"saved to {output_name}")
+
+    @staticmethod
+    def _lazy_frame_buffer(
+        frame_agent_data: AgentData,
+        type_id_for_code: np.ndarray,
+        buffer_size: int,
+    ) -> np.ndarray:
+        """
+        Pack a filtered frame of LazyTrajectoryData into a float32 buffer
+        """
+        frame_buffer, _, _ = Writer._get_frame_buffer_array(
+            0,
+            frame_agent_data,
+            type_id_for_code[frame_agent_data.types.codes],
+            buffer_size,
+            dtype="<f4",
+        )
+        return frame_buffer
+
+    @staticmethod
+    def _lazy_frame_buffers(
+        trajectory_data: LazyTrajectoryData,
+        type_id_for_code: np.ndarray,
+        max_cache_bytes: int,
+    ) -> Tuple[np.ndarray, List[int], Dict[int, np.ndarray]]:
+        """
+        Filter each frame of LazyTrajectoryData to check it and get its size,
+        since the file chunks and spatial data header depend on
+        the size of every frame. Keep the packed buffers of as many frames
+        as fit in max_cache_bytes, so those are not filtered again to write them.
+        Return the number of agents and number of buffer values for each frame,
+        and the kept buffers by frame index
+        """
+        total_steps = trajectory_data.total_timesteps()
+        n_agents = np.zeros(total_steps)
+        frame_buffers_n_values = []
+        cached_buffers = {}
+        cached_n_bytes = 0
+        for time_index in range(total_steps):
+            frame_agent_data = trajectory_data.get_frame(time_index)
+            frame_agent_data._check_subpoints_match_display_type()
+            n_agents[time_index] = frame_agent_data.n_agents[0]
+            buffer_size = Writer._get_frame_buffer_size(0, frame_agent_data)
+            frame_buffers_n_values.append(buffer_size)
+            buffer_n_bytes = BINARY_SETTINGS.BYTES_PER_VALUE * buffer_size
+            if cached_n_bytes + buffer_n_bytes <= max_cache_bytes:
+                cached_buffers[time_index] = BinaryWriter._lazy_frame_buffer(
+                    frame_agent_data, type_id_for_code, buffer_size
+                )
+                cached_n_bytes += buffer_n_bytes
+        return n_agents, frame_buffers_n_values, cached_buffers
+
+    @staticmethod
+    def _save_lazy(
+        trajectory_data: LazyTrajectoryData,
+        output_path: str,
+        validate_ids: bool,
+        max_bytes: int = BINARY_SETTINGS.MAX_BYTES,
+    ) -> None:
+        """
+        Save LazyTrajectoryData in .simularium binary format,
+        filtering each frame once to get its size, and again as it is written
+        only if its packed buffer didn't fit in
+        BINARY_SETTINGS.LAZY_FRAME_CACHE_BYTES
+        """
+        if validate_ids:
+            Writer._validate_ids(trajectory_data.data)
+        print("Converting Trajectory Data to Binary -------------")
+        header_data = trajectory_data.get_header_data()
+        (
+            type_id_for_code,
+            type_mapping,
+        ) = trajectory_data.get_type_id_for_code_and_mapping()
+        (
+            header_data.agent_data.n_agents,
+            frame_buffers_n_values,
+            cached_buffers,
+        ) = BinaryWriter._lazy_frame_buffers(
+            trajectory_data,
+            type_id_for_code,
+            BINARY_SETTINGS.LAZY_FRAME_CACHE_BYTES,
+        )
+
+        def get_frame_buffer(time_index: int) -> np.ndarray:
+            if time_index in cached_buffers:
+                # release each kept buffer once it is written
+                return cached_buffers.pop(time_index)
+            return BinaryWriter._lazy_frame_buffer(
+                trajectory_data.get_frame(time_index),
+                type_id_for_code,
+                frame_buffers_n_values[time_index],
+            )
+
+        BinaryWriter._write_files(
+            header_data,
+            type_mapping,
+            frame_buffers_n_values,
+            get_frame_buffer,
+            output_path,
+            max_bytes,
+        )
+
+    @staticmethod
+    def save(
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData],
+        output_path: str,
+        validate_ids: bool,
+        max_bytes: int = BINARY_SETTINGS.MAX_BYTES,
+    ) -> None:
+        """
+        Save the simularium data in .simularium binary format
+        at the output path. The header and trajectory info are written
+        first, then the spatial data is packed and written frame by frame
+        Parameters
+        ----------
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData]
+            the data to save, LazyTrajectoryData is filtered
+            one frame at a time as it is written
+        output_path: str
+            where to save the file
+        validate_ids: bool
+            additional validation to check agent ID size?
+        max_bytes: int (optional)
+            max size of each output file, data is split
+            into multiple files if needed
+            Default: BINARY_SETTINGS.MAX_BYTES
+        """
+        if isinstance(trajectory_data, LazyTrajectoryData):
+            BinaryWriter._save_lazy(
+                trajectory_data, output_path, validate_ids, max_bytes
+            )
+            return
+        if validate_ids:
+            Writer._validate_ids(trajectory_data)
+        print("Converting Trajectory Data to Binary -------------")
+        trajectory_data.agent_data._check_subpoints_match_display_type()
+        frame_buffers_n_values = BinaryWriter._frame_buffers_n_values(trajectory_data)
+        type_ids, type_mapping = trajectory_data.agent_data.get_type_ids_and_mapping()
+
+        def get_frame_buffer(time_index: int) -> np.ndarray:
+            frame_buffer, _, _ = Writer._get_frame_buffer_array(
+                time_index,
+                trajectory_data.agent_data,
+                type_ids,
+                frame_buffers_n_values[time_index],
+                dtype="<f4",
+            )
+            return frame_buffer
+
+        BinaryWriter._write_files(
+            trajectory_data,
+            type_mapping,
+            frame_buffers_n_values,
+            get_frame_buffer,
+            output_path,
+            max_bytes,
+        )
@@ -3,13 +3,14 @@
 
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 import numpy as np
 
 from ..data_objects import (
     AgentData,
     TrajectoryData,
+    LazyTrajectoryData,
 )
 from ..constants import V1_SPATIAL_BUFFER_STRUCT, CURRENT_VERSION, VALUES_PER_3D_POINT
 from .writer import Writer
@@ -116,14 +117,85 @@ class JsonWriter(Writer):
         return bundle_data
 
     @staticmethod
-    def format_trajectory_data(trajectory_data: TrajectoryData) -> Dict[str, Any]:
+    def _get_spatial_bundle_data_lazy(
+        trajectory_data: LazyTrajectoryData,
+        type_id_for_code: np.ndarray,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the spatialData's bundleData for LazyTrajectoryData,
+        filtering one frame at a time
+        """
+        bundle_data: List[Dict[str, Any]] = []
+        uids = {}
+        used_unique_IDs = []
+        source_agent_data = trajectory_data.data.agent_data
+        if source_agent_data.draw_fiber_points:
+            used_unique_IDs = list(
+                np.unique(source_agent_data.unique_ids[trajectory_data.frame_indices])
+            )
+        for time_index in range(trajectory_data.total_timesteps()):
+            frame_agent_data = trajectory_data.get_frame(time_index)
+            frame_agent_data._check_subpoints_match_display_type()
+            frame_data = {}
+            frame_data["frameNumber"] = time_index
+            frame_data["time"] = float(frame_agent_data.times[0])
+            frame_data["data"], uids, used_unique_IDs = Writer._get_frame_buffer(
+                0,
+                frame_agent_data,
+                type_id_for_code[frame_agent_data.types.codes],
+                -1,
+                uids,
+                used_unique_IDs,
+            )
+            bundle_data.append(frame_data)
+        return bundle_data
+
+    @staticmethod
+    def _format_lazy_trajectory_data(
+        trajectory_data: LazyTrajectoryData,
+    ) -> Dict[str, Any]:
+        """
+        Return LazyTrajectoryData shaped for Simularium JSON
+        """
+        print("Converting Trajectory Data to JSON -------------")
+        total_steps = trajectory_data.total_timesteps()
+        (
+            type_id_for_code,
+            type_mapping,
+        ) = trajectory_data.get_type_id_for_code_and_mapping()
+        return {
+            "trajectoryInfo": Writer._get_trajectory_info(
+                trajectory_data.get_header_data(), total_steps, type_mapping
+            ),
+            "spatialData": {
+                "version": CURRENT_VERSION.SPATIAL_DATA,
+                "msgType": 1,
+                "bundleStart": 0,
+                "bundleSize": total_steps,
+                "bundleData": JsonWriter._get_spatial_bundle_data_lazy(
+                    trajectory_data, type_id_for_code
+                ),
+            },
+            "plotData": {
+                "version": CURRENT_VERSION.PLOT_DATA,
+                "data": trajectory_data.plots,
+            },
+        }
+
+    @staticmethod
+    def format_trajectory_data(
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData]
+    ) -> Dict[str, Any]:
         """
         Return the data shaped for Simularium JSON
         Parameters
         ----------
-        trajectory_data: TrajectoryData
-            the data to format
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData]
+            the data to format, LazyTrajectoryData is filtered
+            one frame at a time
         """
+        if isinstance(trajectory_data, LazyTrajectoryData):
+            return JsonWriter._format_lazy_trajectory_data(trajectory_data)
         print("Converting Trajectory Data to JSON -------------")
         trajectory_data.agent_data._check_subpoints_match_display_type()
         simularium_data = {}
@@ -164,14 +236,16 @@ class JsonWriter(Writer):
 
     @staticmethod
     def save(
-        trajectory_data: TrajectoryData, output_path: str, validate_ids: bool
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData],
+        output_path: str,
+        validate_ids: bool,
     ) -> None:
         """
         Save the simularium data in .simularium JSON format
         at the output path
         Parameters
         ----------
-        trajectory_data: TrajectoryData
+        trajectory_data: Union[TrajectoryData, LazyTrajectoryData]
             the data to save
         output_path: str
             where to save the file
@@ -179,7 +253,11 @@ class JsonWriter(Writer):
             additional validation to check agent ID size?
         """
         if validate_ids:
-            Writer._validate_ids(trajectory_data)
+            Writer._validate_ids(
+                trajectory_data.data
+                if isinstance(trajectory_data, LazyTrajectoryData)
+                else trajectory_data
+            )
         json_data = JsonWriter.format_trajectory_data(trajectory_data)
         print("Writing JSON -------------")
         with open(f"{output_path}.simularium", "w+") as outfile:
@@ -4,7 +4,6 @@
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, List, Dict, Tuple
-import math
 
 import numpy as np
 
@@ -113,6 +112,32 @@ class Writer(ABC):
             result["modelInfo"] = dict(trajectory_data.meta_data.model_meta_data)
         return result
 
+    @staticmethod
+    def _get_frame_n_fiber_spheres(
+        time_index: int,
+        agent_data: AgentData,
+        n_subpoints: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Get the number of spheres drawn at fiber points
+        for each agent in the given frame of AgentData
+        """
+        n_agents = n_subpoints.shape[0]
+        result = np.zeros(n_agents, dtype=int)
+        if not agent_data.draw_fiber_points or n_agents < 1:
+            return result
+        is_fiber = np.zeros(n_agents, dtype=bool)
+        for agent_index in np.nonzero(n_subpoints > 0)[0]:
+            type_name = agent_data.types.get_name(time_index, agent_index)
+            if type_name not in agent_data.display_data:
+                continue
+            display_type = agent_data.display_data[type_name].display_type
+            is_fiber[agent_index] = display_type == DISPLAY_TYPE.FIBER
+        # a sphere at every other fiber point
+        n_fiber_points = n_subpoints // SUBPOINT_VALUES_PER_ITEM(DISPLAY_TYPE.FIBER)
+        result[is_fiber] = (n_fiber_points[is_fiber] + 1) // 2
+        return result
+
     @staticmethod
     def _get_frame_buffer_size(
         time_index: int,
@@ -122,28 +147,51 @@ class Writer(ABC):
         Get the required size for a buffer to hold the given frame of AgentData
         """
         n_agents = int(agent_data.n_agents[time_index])
+        n_subpoints = agent_data.n_subpoints[time_index][:n_agents].astype(int)
         buffer_size = (V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT) * n_agents
-        for agent_index in range(n_agents):
-            n_subpoints = int(agent_data.n_subpoints[time_index][agent_index])
-            if n_subpoints > 0:
-                buffer_size += n_subpoints
-                if agent_data.draw_fiber_points:
-                    buffer_size += (
-                        V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT
-                    ) * max(math.ceil(n_subpoints / 6.0), 1)
+        buffer_size += int(np.sum(n_subpoints))
+        if agent_data.draw_fiber_points:
+            has_subpoints = n_subpoints[n_subpoints > 0]
+            buffer_size += (V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT) * int(
+                np.sum(np.maximum(np.ceil(has_subpoints / 6.0), 1))
+            )
         return buffer_size
 
     @staticmethod
-    def _get_frame_buffer(
+    def _get_fiber_sphere_uids(
+        raw_uids: np.ndarray,
+        uids: Dict[int, int],
+        used_unique_IDs: List[int],
+    ) -> np.ndarray:
+        """
+        Get unique IDs for spheres drawn at fiber points,
+        remapping any raw IDs that have already been used
+        """
+        result = np.zeros(raw_uids.shape[0])
+        for index, raw_uid in enumerate(raw_uids.tolist()):
+            if raw_uid not in uids:
+                uid = raw_uid
+                while uid in used_unique_IDs:
+                    uid += 100
+                uids[raw_uid] = uid
+                used_unique_IDs.append(uid)
+            result[index] = uids[raw_uid]
+        return result
+
+    @staticmethod
+    def _get_frame_buffer_array(
         time_index: int,
         agent_data: AgentData,
         type_ids: np.ndarray,
         buffer_size: int = -1,
         uids: Dict[int, int] = None,
         used_unique_IDs: List[int] = None,
-    ) -> Tuple[List[float], Dict[int, int], List[int]]:
+        dtype: np.dtype = float,
+    ) -> Tuple[np.ndarray, Dict[int, int], List[int]]:
         """
-        Get a float buffer for one frame of AgentData
+        Get a float buffer for one frame of AgentData as a numpy array
+        of the given dtype, packing all agents at once
+        using offsets from the subpoint counts
         """
         if buffer_size < 0:
             buffer_size = Writer._get_frame_buffer_size(time_index, agent_data)
@@ -151,142 +199,140 @@ class Writer(ABC):
             uids = {}
         if used_unique_IDs is None:
             used_unique_IDs = []
-        result = np.zeros(buffer_size)
+        result = np.zeros(buffer_size, dtype=dtype)
         n_agents = int(agent_data.n_agents[time_index])
-        i = 0
-        for agent_index in range(n_agents):
-            # add agent
-            result[i + V1_SPATIAL_BUFFER_STRUCT.VIZ_TYPE_INDEX] = agent_data.viz_types[
-                time_index, agent_index
-            ]
-            result[i + V1_SPATIAL_BUFFER_STRUCT.UID_INDEX] = agent_data.unique_ids[
-                time_index, agent_index
-            ]
-            result[i + V1_SPATIAL_BUFFER_STRUCT.TID_INDEX] = type_ids[
-                time_index, agent_index
-            ]
-            result[
-                i
-                + V1_SPATIAL_BUFFER_STRUCT.POSX_INDEX : i
-                + V1_SPATIAL_BUFFER_STRUCT.POSX_INDEX
-                + VALUES_PER_3D_POINT
-            ] = agent_data.positions[time_index, agent_index]
-            result[
-                i
-                + V1_SPATIAL_BUFFER_STRUCT.ROTX_INDEX : i
-                + V1_SPATIAL_BUFFER_STRUCT.ROTX_INDEX
-                + VALUES_PER_3D_POINT
-            ] = agent_data.rotations[time_index, agent_index]
-            result[i + V1_SPATIAL_BUFFER_STRUCT.R_INDEX] = agent_data.radii[
-                time_index, agent_index
-            ]
-            n_subpoints = int(agent_data.n_subpoints[time_index][agent_index])
-            result[i + V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX] = n_subpoints
-            if n_subpoints > 0:
-                # add subpoints
-                sp_start_index = i + V1_SPATIAL_BUFFER_STRUCT.SP_INDEX
-                result[
-                    sp_start_index : sp_start_index + n_subpoints
-                ] = agent_data.subpoints[time_index][agent_index][:n_subpoints]
-                i += (V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT) + n_subpoints
-                # optionally draw spheres at points
-                if agent_data.draw_fiber_points:
-                    type_name = agent_data.types[time_index][agent_index]
-                    if type_name not in agent_data.display_data:
-                        continue
-                    display_type = agent_data.display_data[type_name].display_type
-                    if display_type != DISPLAY_TYPE.FIBER:
-                        continue
-                    n_fiber_points = math.floor(
-                        n_subpoints
-                        / float(SUBPOINT_VALUES_PER_ITEM(DISPLAY_TYPE.FIBER))
-                    )
-                    for p in range(n_fiber_points):
-                        # every other fiber point
-                        if p % 2 != 0:
-                            continue
-                        # unique instance ID
-                        raw_uid = (
-                            100 * (agent_data.unique_ids[time_index, agent_index] + 1)
-                            + p
-                        )
-                        if raw_uid not in uids:
-                            uid = raw_uid
-                            while uid in used_unique_IDs:
-                                uid += 100
-                            uids[raw_uid] = uid
-                            used_unique_IDs.append(uid)
-                        # add sphere
-                        result[
-                            i + V1_SPATIAL_BUFFER_STRUCT.VIZ_TYPE_INDEX
-                        ] = VIZ_TYPE.DEFAULT
-                        result[i + V1_SPATIAL_BUFFER_STRUCT.UID_INDEX] = uids[raw_uid]
-                        result[i + V1_SPATIAL_BUFFER_STRUCT.TID_INDEX] = type_ids[
-                            time_index, agent_index
-                        ]
-                        first_subpoint_index = VALUES_PER_3D_POINT * p
-                        result[
-                            i
-                            + V1_SPATIAL_BUFFER_STRUCT.POSX_INDEX : i
-                            + V1_SPATIAL_BUFFER_STRUCT.POSX_INDEX
-                            + VALUES_PER_3D_POINT
-                        ] = agent_data.subpoints[time_index][agent_index][
-                            first_subpoint_index : first_subpoint_index
-                            + VALUES_PER_3D_POINT
-                        ]
-                        result[i + V1_SPATIAL_BUFFER_STRUCT.R_INDEX] = 0.5
-                        i += V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT
-            else:
-                i += V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT
+        if n_agents < 1:
+            return result, uids, used_unique_IDs
+        buffer_struct = V1_SPATIAL_BUFFER_STRUCT
+        n_subpoints = agent_data.n_subpoints[time_index][:n_agents].astype(int)
+        n_spheres = Writer._get_frame_n_fiber_spheres(
+            time_index, agent_data, n_subpoints
+        )
+        # each agent is followed by its subpoints and any fiber point spheres
+        agent_n_values = (
+            buffer_struct.MIN_VALUES_PER_AGENT
+            + n_subpoints
+            + buffer_struct.MIN_VALUES_PER_AGENT * n_spheres
+        )
+        starts = np.zeros(n_agents, dtype=int)
+        np.cumsum(agent_n_values[:-1], out=starts[1:])
+        xyz = np.arange(VALUES_PER_3D_POINT)
+        # add agents
+        result[starts + buffer_struct.VIZ_TYPE_INDEX] = agent_data.viz_types[
+            time_index, :n_agents
+        ]
+        result[starts + buffer_struct.UID_INDEX] = agent_data.unique_ids[
+            time_index, :n_agents
+        ]
+        result[starts + buffer_struct.TID_INDEX] = type_ids[time_index, :n_agents]
+        result[
+            starts[:, np.newaxis] + buffer_struct.POSX_INDEX + xyz
+        ] = agent_data.positions[time_index, :n_agents]
+        result[
+            starts[:, np.newaxis] + buffer_struct.ROTX_INDEX + xyz
+        ] = agent_data.rotations[time_index, :n_agents]
+        result[starts + buffer_struct.R_INDEX] = agent_data.radii[time_index, :n_agents]
+        result[starts + buffer_struct.NSP_INDEX] = n_subpoints
+        max_subpoints = int(np.amax(n_subpoints))
+        if max_subpoints < 1:
+            return result, uids, used_unique_IDs
+        # add subpoints
+        frame_subpoints = agent_data.get_subpoints_for_agents(
+            np.full(n_agents, time_index), np.arange(n_agents)
+        )
+        result[
+            AgentData._ragged_indices(starts + buffer_struct.SP_INDEX, n_subpoints)
+        ] = frame_subpoints
+        total_spheres = int(np.sum(n_spheres))
+        if total_spheres < 1:
+            return result, uids, used_unique_IDs
+        # optionally draw spheres at every other fiber point
+        sphere_agents = np.repeat(np.arange(n_agents), n_spheres)
+        sphere_offsets = np.zeros(n_agents, dtype=int)
+        np.cumsum(n_spheres[:-1], out=sphere_offsets[1:])
+        sphere_numbers = np.arange(total_spheres) - sphere_offsets[sphere_agents]
+        fiber_points = 2 * sphere_numbers
+        sp_value_starts = np.zeros(n_agents, dtype=int)
+        np.cumsum(n_subpoints[:-1], out=sp_value_starts[1:])
+        sphere_starts = (
+            starts[sphere_agents]
+            + buffer_struct.MIN_VALUES_PER_AGENT
+            + n_subpoints[sphere_agents]
+            + buffer_struct.MIN_VALUES_PER_AGENT * sphere_numbers
+        )
+        raw_uids = (
+            100 * (agent_data.unique_ids[time_index, sphere_agents].astype(int) + 1)
+            + fiber_points
+        )
+        result[sphere_starts + buffer_struct.VIZ_TYPE_INDEX] = VIZ_TYPE.DEFAULT
+        result[sphere_starts + buffer_struct.UID_INDEX] = Writer._get_fiber_sphere_uids(
+            raw_uids, uids, used_unique_IDs
+        )
+        result[sphere_starts + buffer_struct.TID_INDEX] = type_ids[
+            time_index, sphere_agents
+        ]
+        result[
+            sphere_starts[:, np.newaxis] + buffer_struct.POSX_INDEX + xyz
+        ] = frame_subpoints[
+            sp_value_starts[sphere_agents][:, np.newaxis]
+            + VALUES_PER_3D_POINT * fiber_points[:, np.newaxis]
+            + xyz
+        ]
+        result[sphere_starts + buffer_struct.R_INDEX] = 0.5
+        return result, uids, used_unique_IDs
+
+    @staticmethod
+    def _get_frame_buffer(
+        time_index: int,
+        agent_data: AgentData,
+        type_ids: np.ndarray,
+        buffer_size: int = -1,
+        uids: Dict[int, int] = None,
+        used_unique_IDs: List[int] = None,
+    ) -> Tuple[List[float], Dict[int, int], List[int]]:
+        """
+        Get a float buffer for one frame of AgentData
+        """
+        result, uids, used_unique_IDs = Writer._get_frame_buffer_array(
+            time_index, agent_data, type_ids, buffer_size, uids, used_unique_IDs
+        )
         return result.tolist(), uids, used_unique_IDs
 
     @staticmethod
     def _check_agent_ids_are_unique_per_frame(buffer_data: Dict[str, Any]) -> bool:
         """
-        For each frame, check that none of the unique agent IDs overlap
+        For each frame, check that none of the unique agent IDs overlap,
+        and report all the duplicate IDs
         """
         bundle_data = buffer_data["spatialData"]["bundleData"]
+        messages = []
         for time_index in range(len(bundle_data)):
-            data = bundle_data[time_index]["data"]
-            agent_index = 1
-            uids = []
-            get_n_subpoints = False
-            while agent_index < len(data):
-                # get the number of subpoints
-                # in order to correctly increment index
-                if get_n_subpoints:
-                    agent_index += int(
-                        data[agent_index]
-                        + (
-                            V1_SPATIAL_BUFFER_STRUCT.MIN_VALUES_PER_AGENT
-                            + 1
-                            - V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX
-                        )
-                    )
-                    get_n_subpoints = False
-                    continue
-                # there should be a unique ID at this index, check for duplicate
-                uid = data[agent_index]
-                if uid in uids:
-                    raise Exception(
-                        f"found duplicate ID {uid} in frame {time_index} "
-                        f"at index {agent_index}"
-                    )
-                uids.append(uid)
-                agent_index += V1_SPATIAL_BUFFER_STRUCT.NSP_INDEX - 1
-                get_n_subpoints = True
+            data = np.asarray(bundle_data[time_index]["data"], dtype=float)
+            agent_starts = AgentData._get_frame_agent_starts(data)
+            uids = np.sort(data[agent_starts + V1_SPATIAL_BUFFER_STRUCT.UID_INDEX])
+            duplicate_uids = np.unique(uids[1:][uids[1:] == uids[:-1]])
+            if duplicate_uids.size > 0:
+                messages.append(
+                    f"found duplicate IDs {duplicate_uids.tolist()} "
+                    f"in frame {time_index}"
+                )
+        if messages:
+            raise DataError("\n".join(messages))
         return True
 
     @staticmethod
     def _validate_ids(trajectory_data: TrajectoryData) -> None:
         """
         Check if agent unique IDs are valid 32 bit integers
-        returns a message identifying violating agent ID
+        raises an error identifying all violating agent IDs
         """
         agent_unique_ids = trajectory_data.agent_data.unique_ids
-        for uid in np.ndarray.flatten(agent_unique_ids):
-            if uid > MAX_AGENT_ID:
-                raise DataError(f"Agent IDs is larger than a 32 bit integer: {uid} ")
+        if agent_unique_ids.size < 1 or np.amax(agent_unique_ids) <= MAX_AGENT_ID:
+            return
+        invalid_ids = np.unique(agent_unique_ids[agent_unique_ids > MAX_AGENT_ID])
+        raise DataError(
+            f"Agent IDs are larger than a 32 bit integer: {invalid_ids.tolist()} "
+        )
 
     @staticmethod
     def _check_type_matches_subpoints(
@@ -322,21 +368,47 @@ class Writer(ABC):
         """
         For each frame, check that agents that have subpoints
         also have a display_type of "FIBER" and viz type of "FIBER", and vice versa.
-        return a message with the type name of the first agent that is inconsistent
+        return a message with the type name of each agent that is inconsistent,
+        one per line
         """
-        n_subpoints = trajectory_data.agent_data.n_subpoints
-        display_data = trajectory_data.agent_data.display_data
-        for time_index in range(n_subpoints.shape[0]):
-            for agent_index in range(
-                int(trajectory_data.agent_data.n_agents[time_index])
-            ):
-                inconsistent_type = Writer._check_type_matches_subpoints(
-                    trajectory_data.agent_data.types[time_index][agent_index],
+        agent_data = trajectory_data.agent_data
+        n_subpoints = agent_data.n_subpoints
+        display_data = agent_data.display_data
+        total_steps, max_agents = n_subpoints.shape[:2]
+        agent_mask = (
+            np.arange(max_agents) < agent_data.n_agents[:total_steps, np.newaxis]
+        )
+        codes = agent_data.types.codes[:total_steps, :max_agents]
+        # display type for each type code, the last is for codes that are -1
+        display_types = [
+            (
+                display_data[type_name].display_type
+                if type_name in display_data
+                else DISPLAY_TYPE.NONE
+            )
+            for type_name in agent_data.types.names
+        ] + [DISPLAY_TYPE.NONE]
+        check_display_type = np.array(
+            [display_type is not DISPLAY_TYPE.NONE for display_type in display_types]
+        )
+        is_fiber = np.array(
+            [display_type == DISPLAY_TYPE.FIBER for display_type in display_types]
+        )
+        has_subpoints = n_subpoints > 0
+        viz_types = agent_data.viz_types[:total_steps, :max_agents]
+        inconsistent = agent_mask & (
+            (has_subpoints != (viz_types == VIZ_TYPE.FIBER))
+            | (check_display_type[codes] & (has_subpoints != is_fiber[codes]))
+        )
+        messages = []
+        for time_index, agent_index in zip(*np.nonzero(inconsistent)):
+            messages.append(
+                Writer._check_type_matches_subpoints(
+                    agent_data.types.names[codes[time_index, agent_index]],
                     n_subpoints[time_index][agent_index],
-                    trajectory_data.agent_data.viz_types[time_index][agent_index],
+                    viz_types[time_index][agent_index],
                     display_data,
                     f"at index Time = {time_index}, Agent = {agent_index}",
                 )
-                if inconsistent_type:
-                    return inconsistent_type
-        return ""
+            )
+        return "\n".join(messages)